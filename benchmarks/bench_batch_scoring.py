@@ -0,0 +1,87 @@
+"""Benchmark reconciling a list of names against a roster.
+
+Compares scoring every (query, name) pair with player_match_score against
+batch_top_matches, with and without its NumPy pre-filter. Queries are
+roster names with a typo, as they come in bank transfer exports.
+
+Usage:
+    python benchmarks/bench_batch_scoring.py [--queries 100] [--targets 1000 10000]
+"""
+import argparse
+import itertools
+import random
+import time
+
+from ultimate_mcp_server.modules import utils
+from ultimate_mcp_server.modules.utils import batch_top_matches, player_match_score
+
+from bench_search_topk import _names
+
+THRESHOLD = 0.8
+LIMIT = 3
+
+
+def typo(name: str, rng: random.Random) -> str:
+    position = rng.randrange(len(name) - 1)
+    return name[:position] + name[position + 1] + name[position] + name[position + 2:]
+
+
+def pairwise(queries, targets):
+    """Every pair scored with player_match_score, then sorted per query."""
+    results = []
+    for query in queries:
+        scored = [(target, player_match_score(query, target)) for target in targets]
+        matches = [(target, score) for target, score in scored if score >= THRESHOLD]
+        matches.sort(key=lambda match: -match[1])
+        results.append(matches[:LIMIT])
+    return results
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, nargs="+", default=[100])
+    parser.add_argument("--targets", type=int, nargs="+", default=[1000, 10000])
+    args = parser.parse_args()
+
+    if utils.np is None:
+        print("NumPy is not installed (pip install -e '.[fast]'); skipping the NumPy column")
+
+    rng = random.Random(42)
+    print(f"batch fuzzy matching, threshold {THRESHOLD}, limit {LIMIT}")
+    print(f"  {'queries':>7} {'targets':>7} {'pairwise':>11} {'pure':>11} {'numpy':>11}")
+    for query_count, target_count in itertools.product(args.queries, args.targets):
+        targets = _names(target_count)
+        queries = [typo(rng.choice(targets), rng) for _ in range(query_count)]
+
+        utils.clear_caches()
+        before, expected = timed(pairwise, queries, targets)
+
+        numpy = utils.np
+        utils.np = None
+        try:
+            pure, pure_result = timed(batch_top_matches, queries, targets, THRESHOLD, LIMIT)
+        finally:
+            utils.np = numpy
+        # Ties may be ordered differently, but the scores are the same
+        assert [[score for _, score in row] for row in pure_result] == [
+            [score for _, score in row] for row in expected
+        ]
+
+        vectorized = "n/a"
+        if numpy is not None:
+            seconds, result = timed(batch_top_matches, queries, targets, THRESHOLD, LIMIT)
+            assert result == pure_result
+            vectorized = f"{seconds:9.2f} s"
+        print(
+            f"  {query_count:>7} {target_count:>7} {before:9.2f} s {pure:9.2f} s {vectorized:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
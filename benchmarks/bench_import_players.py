@@ -0,0 +1,97 @@
+"""Benchmark import_players on a large roster.
+
+Compares the old per-row importer (SELECT, then INSERT or UPDATE for every
+row) with the chunked ON CONFLICT upsert, for a first import into an empty
+database and for re-importing the same file (all rows unchanged).
+
+Usage:
+    python benchmarks/bench_import_players.py [--rows 20000]
+"""
+import argparse
+import csv
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from ultimate_mcp_server.modules.data_types import ImportPlayersCommand, Player
+from ultimate_mcp_server.modules.functionality.import_players import import_players
+from ultimate_mcp_server.modules.init_db import init_db
+from ultimate_mcp_server.modules.pool import close_pools, connection
+
+
+def legacy_import_players(csv_path: Path, db_uri: str) -> int:
+    """import_players as it worked before: header lookup and two queries per row,
+    keeping a Player for every imported row."""
+    imported = []
+    with connection(db_uri) as conn, open(csv_path, newline="") as file:
+        cursor = conn.cursor()
+        for row in csv.DictReader(file):
+            name_key = next((k for k in row if k.lower() in ["name", "nombre"]), None)
+            phone_key = next((k for k in row if k.lower() in ["phone", "telefono"]), None)
+            email_key = next((k for k in row if k.lower() in ["email"]), None)
+            name, phone = row[name_key].strip(), row[phone_key].strip()
+            email = row.get(email_key, "").strip() or None
+            cursor.execute("SELECT name FROM players WHERE name = ?", (name,))
+            if cursor.fetchone():
+                cursor.execute(
+                    "UPDATE players SET phone = ?, email = ? WHERE name = ?", (phone, email, name)
+                )
+            else:
+                cursor.execute(
+                    "INSERT INTO players (name, created, phone, email) VALUES (?, ?, ?, ?)",
+                    (name, datetime.now(), phone, email),
+                )
+            imported.append(Player(name=name, created=datetime.now(), phone=phone, email=email))
+        conn.commit()
+    return len(imported)
+
+
+def chunked_import_players(csv_path: Path, db_uri: str) -> int:
+    result = import_players(ImportPlayersCommand(csv_path=csv_path, db_uri=db_uri))
+    return result.inserted + result.updated + result.unchanged
+
+
+def measure(func, csv_path: Path, db_uri: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(csv_path, db_uri)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "roster.csv"
+        with open(csv_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["Nombre", "Telefono", "Email"])
+            for i in range(args.rows):
+                writer.writerow([f"Player {i}", f"+34{i:09d}", f"player{i}@example.com"])
+
+        print(f"import_players ({args.rows} rows)")
+        cases = [
+            ("before: per-row", legacy_import_players),
+            ("after: chunked upsert", chunked_import_players),
+        ]
+        for label, func in cases:
+            db_uri = f"file://{Path(tmp) / (func.__name__ + '.db')}"
+            init_db(db_uri)
+            for run in ("first import", "re-import"):
+                elapsed, peak = measure(func, csv_path, db_uri)
+                print(
+                    f"  {label:<24} {run:<14} {elapsed * 1000:9.1f} ms  "
+                    f"{args.rows / elapsed:10.0f} rows/s  peak {peak / 1024:8.0f} KiB"
+                )
+        close_pools()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark the per-call overhead of init_db.
+
+Compares the old behaviour (open a connection and run every CREATE TABLE IF
+NOT EXISTS statement on each call) with the per-URI schema registry.
+
+Usage:
+    python benchmarks/bench_init_db.py [--calls 2000]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from ultimate_mcp_server.modules.init_db import init_db, reset_schema_registry
+from ultimate_mcp_server.modules.migrations.m0001_initial_schema import (
+    upgrade as _create_schema,
+)
+from ultimate_mcp_server.modules.pool import close_pools, connection
+from ultimate_mcp_server.modules.utils import get_connection
+
+
+def legacy_init_db(db_uri: str) -> None:
+    """init_db as it worked before the schema registry: new connection + DDL."""
+    conn = get_connection(db_uri)
+    cursor = conn.cursor()
+    _create_schema(cursor)
+    conn.commit()
+    conn.close()
+
+
+def pooled_ddl_init_db(db_uri: str) -> None:
+    """Pooled connection, but still running the DDL on every call."""
+    with connection(db_uri) as conn:
+        _create_schema(conn.cursor())
+        conn.commit()
+
+
+def cold_check_init_db(db_uri: str) -> None:
+    """First call in a fresh process: PRAGMA user_version check only."""
+    reset_schema_registry(db_uri)
+    init_db(db_uri)
+
+
+def measure(func, db_uri: str, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func(db_uri)
+    return (time.perf_counter() - start) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_uri = f"file://{Path(tmp) / 'bench.db'}"
+        init_db(db_uri)
+
+        cases = [
+            ("before: new connection + DDL", legacy_init_db),
+            ("pooled connection + DDL", pooled_ddl_init_db),
+            ("registry miss: user_version check", cold_check_init_db),
+            ("after: registry hit", init_db),
+        ]
+        baseline = None
+        print(f"init_db per-call overhead ({args.calls} calls)")
+        for label, func in cases:
+            per_call = measure(func, db_uri, args.calls)
+            baseline = baseline or per_call
+            print(f"  {label:<36} {per_call * 1e6:10.1f} us  ({baseline / per_call:8.1f}x)")
+
+        close_pools()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark the memory taken by large listings.
+
+Measures, with tracemalloc, the peak memory allocated while listing every
+player and a whole tournament roster: as pydantic models (list_players,
+list_tournament_players), as records (list_player_records,
+list_tournament_player_records) and streamed with iter_players and
+iter_tournament_players, which never hold more than a fetch batch.
+
+Usage:
+    python benchmarks/bench_memory.py [--sizes 10000 100000]
+"""
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from bench_search_topk import populate
+
+from ultimate_mcp_server.modules.data_types import (
+    ListPlayersCommand,
+    ListTournamentPlayersCommand,
+)
+from ultimate_mcp_server.modules.functionality.list_players import (
+    iter_players,
+    list_player_records,
+    list_players,
+)
+from ultimate_mcp_server.modules.functionality.list_tournament_players import (
+    iter_tournament_players,
+    list_tournament_player_records,
+    list_tournament_players,
+)
+from ultimate_mcp_server.modules.pool import close_pools
+
+
+def consume(items) -> None:
+    for _ in items:
+        pass
+
+
+def peak_memory(func, *args) -> int:
+    """Peak bytes allocated by a call, including what it returns."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def mib(size: int) -> str:
+    return f"{size / 2 ** 20:7.1f} MiB"
+
+
+def report(label: str, size: int, models: int, records: int, streamed: int) -> None:
+    print(
+        f"  {label:<24} {size:>8} {mib(models)} {mib(records)} {mib(streamed)} "
+        f"{models / records:7.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    print(
+        f"  {'listing':<24} {'rows':>8} {'models':>11} {'records':>11} {'streamed':>11} "
+        f"{'saving':>8}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            db_uri = f"file://{Path(tmp) / f'bench_{size}.db'}"
+            tournament_id = populate(db_uri, size)
+            players = ListPlayersCommand(limit=None, db_uri=db_uri)
+            roster = ListTournamentPlayersCommand(
+                tournament_id=tournament_id, limit=None, db_uri=db_uri
+            )
+            # Warm up the pooled connection and the statement cache
+            consume(iter_players(players))
+
+            report(
+                "list-players",
+                size,
+                peak_memory(list_players, players),
+                peak_memory(list_player_records, players),
+                peak_memory(lambda: consume(iter_players(players))),
+            )
+            report(
+                "list-tournament-players",
+                size,
+                peak_memory(list_tournament_players, roster),
+                peak_memory(list_tournament_player_records, roster),
+                peak_memory(lambda: consume(iter_tournament_players(roster))),
+            )
+        close_pools()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark fuzzy search over very large candidate sets, in-process vs worker processes.
+
+Scores synthetic rosters with top_player_matches in the calling thread,
+then with a ParallelMatcher, which splits the names across worker
+processes and merges their top matches. The first parallel search also
+starts the pool; the timings shown are for later searches, which reuse it.
+
+Usage:
+    python benchmarks/bench_parallel_matching.py [--sizes 50000 200000] [--processes 4]
+"""
+import argparse
+import time
+
+from ultimate_mcp_server.modules.parallel import ParallelMatcher
+from ultimate_mcp_server.modules.utils import clear_caches, top_player_matches
+
+from bench_search_topk import QUERIES, _names
+
+THRESHOLD = 0.6
+LIMIT = 10
+
+
+def timed(func, *args):
+    clear_caches()
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50000, 200000])
+    parser.add_argument("--processes", type=int, default=4)
+    args = parser.parse_args()
+
+    matcher = ParallelMatcher(processes=args.processes, min_candidates=0)
+    # Start the workers before timing anything
+    matcher.top_matches("warm up", _names(args.processes), THRESHOLD, LIMIT)
+
+    print(f"fuzzy top-{LIMIT} search, {args.processes} processes")
+    print(f"  {'names':>7}  {'query':<14} {'in-process':>11} {'parallel':>10} {'speedup':>8}")
+    try:
+        for size in args.sizes:
+            names = sorted(_names(size))
+            for query in QUERIES:
+                before, expected = timed(top_player_matches, query, names, THRESHOLD, LIMIT)
+                after, matches = timed(matcher.top_matches, query, names, THRESHOLD, LIMIT)
+                assert matches == expected
+                print(
+                    f"  {size:>7}  {query:<14} {before * 1000:8.0f} ms {after * 1000:7.0f} ms "
+                    f"{before / after:7.1f}x"
+                )
+    finally:
+        matcher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
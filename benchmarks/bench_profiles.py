@@ -0,0 +1,111 @@
+"""Benchmark write throughput of the SQLite connection profiles.
+
+Measures single-row commits (one transaction per add-player call, as the MCP
+tools do) and batched inserts (one transaction per batch, as the CSV import
+does) for each writable profile, plus the pre-profile baseline with no
+PRAGMAs applied.
+
+Usage:
+    python benchmarks/bench_profiles.py [--rows 2000] [--batch 500]
+"""
+import argparse
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from ultimate_mcp_server.modules.init_db import init_db, reset_schema_registry
+from ultimate_mcp_server.modules.pool import close_pools, configure_pool, connection
+from ultimate_mcp_server.modules.profiles import PROFILES
+
+INSERT_SQL = "INSERT INTO players (name, phone, email) VALUES (?, ?, ?)"
+
+
+def _row(i: int):
+    return (f"Player {i}", f"+34{i:09d}", f"player{i}@example.com")
+
+
+def single_commits(db_uri: str, rows: int) -> None:
+    for i in range(rows):
+        with connection(db_uri) as conn:
+            conn.cursor().execute(INSERT_SQL, _row(i))
+            conn.commit()
+
+
+def batched(db_uri: str, rows: int, batch: int) -> None:
+    with connection(db_uri) as conn:
+        cursor = conn.cursor()
+        for start in range(0, rows, batch):
+            cursor.executemany(
+                INSERT_SQL, [_row(i) for i in range(start, min(start + batch, rows))]
+            )
+            conn.commit()
+
+
+def baseline(db_path: Path, rows: int, batch: int):
+    """Plain sqlite3 connection with SQLite defaults (rollback journal)."""
+    conn = sqlite3.connect(db_path)
+    start = time.perf_counter()
+    for i in range(rows):
+        conn.execute(INSERT_SQL, _row(i))
+        conn.commit()
+    single = time.perf_counter() - start
+    conn.execute("DELETE FROM players")
+    conn.commit()
+    start = time.perf_counter()
+    for offset in range(0, rows, batch):
+        conn.executemany(INSERT_SQL, [_row(i) for i in range(offset, min(offset + batch, rows))])
+        conn.commit()
+    batch_time = time.perf_counter() - start
+    conn.close()
+    return single, batch_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"Write throughput ({args.rows} rows, batches of {args.batch})")
+    print(f"  {'profile':<22} {'single commits':>18} {'batched':>18}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "baseline.db"
+        init_db(f"file://{db_path}")
+        close_pools()
+        single, batch_time = baseline(db_path, args.rows, args.batch)
+        print(
+            f"  {'(no pragmas)':<22} {args.rows / single:12.0f} rows/s "
+            f"{args.rows / batch_time:12.0f} rows/s"
+        )
+
+        for name, profile in PROFILES.items():
+            if profile.query_only:
+                continue
+            db_uri = f"file://{Path(tmp) / f'{name}.db'}"
+            configure_pool(db_uri, profile=name)
+            init_db(db_uri)
+
+            start = time.perf_counter()
+            single_commits(db_uri, args.rows)
+            single = time.perf_counter() - start
+
+            with connection(db_uri) as conn:
+                conn.cursor().execute("DELETE FROM players")
+                conn.commit()
+
+            start = time.perf_counter()
+            batched(db_uri, args.rows, args.batch)
+            batch_time = time.perf_counter() - start
+
+            print(
+                f"  {name:<22} {args.rows / single:12.0f} rows/s "
+                f"{args.rows / batch_time:12.0f} rows/s"
+            )
+            close_pools()
+            reset_schema_registry(db_uri)
+
+
+if __name__ == "__main__":
+    main()
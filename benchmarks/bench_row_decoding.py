@@ -0,0 +1,100 @@
+"""Benchmark decoding large tournament rosters.
+
+Compares the old decoding of list_tournament_players (text rows fetched
+with fetchall and validated into Player models) with the trusted path
+(rows decoded into models by the cursor's row_factory, without
+validation), and with iter_tournament_players, which streams records and
+builds no models at all.
+
+Usage:
+    python benchmarks/bench_row_decoding.py [--sizes 10000 50000]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from bench_search_topk import populate
+
+from ultimate_mcp_server.modules.data_types import ListTournamentPlayersCommand, Player
+from ultimate_mcp_server.modules.functionality.list_tournament_players import (
+    PlayerWithPayment,
+    iter_tournament_players,
+    list_tournament_players,
+)
+from ultimate_mcp_server.modules.pool import close_pools, connection
+from ultimate_mcp_server.modules.timestamps import from_timestamp
+
+LEGACY_SQL = """
+    SELECT p.name, p.created, p.phone, p.email, tp.has_paid, tp.payment_date, tp.player_id
+    FROM tournament_players tp
+    JOIN players p ON p.id = tp.player_id
+    WHERE tp.tournament_id = ?
+    ORDER BY p.name, p.id
+"""
+
+
+def legacy_players(db_uri: str, tournament_id: int):
+    """Decoding as it worked before: every row parsed and validated."""
+    with connection(db_uri) as conn:
+        cursor = conn.cursor()
+        cursor.execute(LEGACY_SQL, (tournament_id,))
+        rows = cursor.fetchall()
+    return [
+        PlayerWithPayment(
+            player=Player(
+                name=row[0],
+                created=from_timestamp(row[1]),
+                phone=row[2],
+                email=row[3],
+            ),
+            has_paid=bool(row[4]),
+            payment_date=from_timestamp(row[5]) if row[5] is not None else None,
+            player_id=row[6],
+        )
+        for row in rows
+    ]
+
+
+def trusted_players(db_uri: str, tournament_id: int):
+    command = ListTournamentPlayersCommand(tournament_id=tournament_id, limit=None, db_uri=db_uri)
+    return list_tournament_players(command)[1]
+
+
+def streamed_players(db_uri: str, tournament_id: int):
+    command = ListTournamentPlayersCommand(tournament_id=tournament_id, limit=None, db_uri=db_uri)
+    for _ in iter_tournament_players(command):
+        pass
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000])
+    args = parser.parse_args()
+
+    print("list-tournament-players, whole roster")
+    print(f"  {'players':>8} {'validated':>12} {'trusted':>10} {'records':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            db_uri = f"file://{Path(tmp) / f'bench_{size}.db'}"
+            tournament_id = populate(db_uri, size)
+            assert legacy_players(db_uri, tournament_id) == trusted_players(db_uri, tournament_id)
+
+            before = min(timed(legacy_players, db_uri, tournament_id) for _ in range(3))
+            after = min(timed(trusted_players, db_uri, tournament_id) for _ in range(3))
+            streamed = min(timed(streamed_players, db_uri, tournament_id) for _ in range(3))
+            print(
+                f"  {size:>8} {before * 1000:9.1f} ms {after * 1000:7.1f} ms "
+                f"{streamed * 1000:7.1f} ms {before / streamed:7.1f}x"
+            )
+        close_pools()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Benchmark fuzzy search over large paid rosters.
+
+Compares the old scoring (score every paid player in full, build a result
+for every match, sort them all and slice) with the heap-based top-k
+selection and its early-exit bounds, on the same fetched rows. Both start
+with empty caches; "repeat" runs the top-k search again, with the match
+scores of the first run cached. The last column is the end-to-end
+search_paid_players call, which first rules out, in one batch, the names
+that share too few characters with the query to reach the threshold.
+
+Usage:
+    python benchmarks/bench_search_topk.py [--sizes 1000 10000 100000] [--limit 10]
+"""
+import argparse
+import itertools
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+from ultimate_mcp_server.modules.data_types import SearchPaidPlayersCommand
+from ultimate_mcp_server.modules.functionality.search_paid_players import (
+    PAID_PLAYERS_SQL,
+    _best_matches,
+    _payment_info,
+    search_paid_players,
+)
+from ultimate_mcp_server.modules.init_db import init_db
+from ultimate_mcp_server.modules.pool import close_pools, connection
+from ultimate_mcp_server.modules.timestamps import to_day, to_timestamp
+from ultimate_mcp_server.modules.utils import (
+    clear_caches,
+    normalize_name,
+    player_match_score,
+    save_phonetic_codes,
+)
+
+FIRST_NAMES = [
+    "Juan", "María", "Pedro", "Ana", "Carlos", "Laura", "José", "Lucía", "Miguel", "Elena",
+    "David", "Sara", "Javier", "Paula", "Daniel", "Marta", "Pablo", "Alba", "Jorge", "Irene",
+    "Sergio", "Clara", "Álvaro", "Nuria", "Adrián", "Julia", "Diego", "Rocío", "Raúl", "Eva",
+    "Iván", "Noelia", "Rubén", "Silvia", "Óscar", "Cristina", "Hugo", "Teresa", "Mario", "Inés",
+]
+SURNAMES = [
+    "García", "Rodríguez", "González", "Fernández", "López", "Martínez", "Sánchez", "Pérez",
+    "Gómez", "Martín", "Jiménez", "Ruiz", "Hernández", "Díaz", "Moreno", "Muñoz", "Álvarez",
+    "Romero", "Alonso", "Gutiérrez", "Navarro", "Torres", "Domínguez", "Vázquez", "Ramos",
+    "Gil", "Ramírez", "Serrano", "Blanco", "Molina", "Morales", "Suárez", "Ortega", "Delgado",
+    "Castro", "Ortiz", "Rubio", "Marín", "Sanz", "Núñez", "Iglesias", "Medina", "Garrido",
+    "Cortés", "Castillo", "Santos", "Lozano", "Guerrero", "Cano", "Prieto",
+]
+QUERIES = ["Juan", "Garcia Lopez", "Jaun Perez"]
+
+
+def _names(count: int):
+    combos = itertools.product(SURNAMES, SURNAMES, FIRST_NAMES)
+    return [f"{first} {last1} {last2}" for last1, last2, first in itertools.islice(combos, count)]
+
+
+def populate(db_uri: str, size: int) -> int:
+    init_db(db_uri)
+    now = to_timestamp(datetime.now())
+    names = _names(size)
+    with connection(db_uri) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT INTO tournaments (name, location, date, surface, registration_deadline, "
+            "created) VALUES ('Bench Open', 'Madrid', ?, 'grass', ?, ?)",
+            (to_day(date(2030, 6, 1)), to_day(date(2030, 5, 1)), now),
+        )
+        tournament_id = cursor.lastrowid
+        cursor.executemany(
+            "INSERT INTO players (name, normalized_name, created, phone, email) "
+            "VALUES (?, ?, ?, ?, NULL)",
+            [(name, normalize_name(name), now, f"+34{i:09d}") for i, name in enumerate(names)],
+        )
+        save_phonetic_codes(cursor, names)
+        cursor.executemany(
+            "INSERT INTO tournament_players "
+            "(tournament_id, player_id, sort_name, registered_at, has_paid, payment_date) "
+            "SELECT ?, id, name, ?, 1, ? FROM players",
+            [(tournament_id, now, now)],
+        )
+        conn.commit()
+    return tournament_id
+
+
+def legacy_matches(command: SearchPaidPlayersCommand, player_data):
+    """Scoring as it worked before: every row scored and built, then sorted."""
+    results = []
+    for row in player_data:
+        match_score = player_match_score(command.name_query, row[0])
+        if match_score >= command.match_threshold:
+            results.append(_payment_info(row, match_score))
+    results.sort(key=lambda p: (-p.match_score, p.player.name))
+    return results[:command.limit]
+
+
+def cold(func, *args) -> float:
+    """Time a call made with empty name and score caches."""
+    clear_caches()
+    return timed(func, *args)
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"search-paid-players, limit {args.limit}")
+    print(
+        f"  {'paid':>7}  {'query':<14} {'sort all':>10} {'top-k':>10} "
+        f"{'speedup':>8} {'repeat':>10} {'end-to-end':>11}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            db_uri = f"file://{Path(tmp) / f'bench_{size}.db'}"
+            tournament_id = populate(db_uri, size)
+            with connection(db_uri) as conn:
+                cursor = conn.cursor()
+                cursor.execute(PAID_PLAYERS_SQL + " ORDER BY tp.sort_name", (tournament_id,))
+                player_data = cursor.fetchall()
+
+            for query in QUERIES:
+                command = SearchPaidPlayersCommand(
+                    tournament_id=tournament_id,
+                    name_query=query,
+                    limit=args.limit,
+                    db_uri=db_uri,
+                )
+                assert [
+                    (p.player.name, p.match_score) for p in legacy_matches(command, player_data)
+                ] == [(p.player.name, p.match_score) for p in _best_matches(command, player_data)]
+
+                before = cold(legacy_matches, command, player_data)
+                after = cold(_best_matches, command, player_data)
+                repeat = timed(_best_matches, command, player_data)
+                end_to_end = cold(search_paid_players, command)
+                print(
+                    f"  {size:>7}  {query:<14} {before * 1000:8.1f} ms {after * 1000:8.1f} ms "
+                    f"{before / after:7.1f}x {repeat * 1000:8.1f} ms {end_to_end * 1000:9.1f} ms"
+                )
+        close_pools()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark tournament lookups with and without the tournament cache.
+
+Compares reading the tournaments row on every lookup (fetch_tournament)
+with the cache (cached_tournament), when nothing changed, when another
+connection wrote to a different table (data_version changed, so the
+change counter is read again) and when the tournament itself changed (the
+row is read again). Each lookup runs in its own transaction, as a command
+does; the times include the writes.
+
+Usage:
+    python benchmarks/bench_tournament_cache.py [--calls 5000]
+"""
+import argparse
+import sqlite3
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+from ultimate_mcp_server.modules.data_types import AddTournamentCommand, SurfaceType
+from ultimate_mcp_server.modules.functionality.add_tournament import add_tournament
+from ultimate_mcp_server.modules.init_db import init_db
+from ultimate_mcp_server.modules.pool import close_pools
+from ultimate_mcp_server.modules.records import fetch_tournament
+from ultimate_mcp_server.modules.session import Session
+from ultimate_mcp_server.modules.tournament_cache import cached_tournament
+
+
+def uncached(session: Session, tournament_id: int) -> None:
+    fetch_tournament(session.cursor(), tournament_id)
+
+
+def cached(session: Session, tournament_id: int) -> None:
+    cached_tournament(session, tournament_id)
+
+
+def no_write(writer, tournament_id: int) -> None:
+    pass
+
+
+def write_other_table(writer, tournament_id: int) -> None:
+    writer.execute("UPDATE players SET phone = phone")
+    writer.commit()
+
+
+def write_tournament(writer, tournament_id: int) -> None:
+    writer.execute("UPDATE tournaments SET location = location WHERE id = ?", (tournament_id,))
+    writer.commit()
+
+
+def measure(lookup, write, db_uri: str, tournament_id: int, writer, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        write(writer, tournament_id)
+        with Session(db_uri) as session:
+            lookup(session, tournament_id)
+    return (time.perf_counter() - start) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        db_uri = f"file://{db_path}"
+        init_db(db_uri)
+        tournament_id = add_tournament(
+            AddTournamentCommand(
+                name="Bench Open",
+                location="Madrid",
+                date=date(2030, 6, 1),
+                surface=SurfaceType.GRASS,
+                registration_deadline=date(2030, 5, 1),
+                db_uri=db_uri,
+            )
+        ).id
+        # Stands for another process writing to the database
+        writer = sqlite3.connect(db_path)
+
+        # Another player, so that writing to players changes a row
+        writer.execute("INSERT INTO players (name, normalized_name, created) VALUES ('A', 'a', 0)")
+        writer.commit()
+
+        cases = [
+            ("no writes", no_write),
+            ("other table written", write_other_table),
+            ("tournament written", write_tournament),
+        ]
+        print(f"Tournament lookup, one transaction each ({args.calls} calls)")
+        print(f"  {'between lookups':<22} {'uncached':>11} {'cached':>11} {'speedup':>8}")
+        for label, write in cases:
+            before_time = measure(uncached, write, db_uri, tournament_id, writer, args.calls)
+            after_time = measure(cached, write, db_uri, tournament_id, writer, args.calls)
+            print(
+                f"  {label:<22} {before_time * 1e6:8.1f} us {after_time * 1e6:8.1f} us "
+                f"{before_time / after_time:7.1f}x"
+            )
+
+        writer.close()
+        close_pools()
+
+
+if __name__ == "__main__":
+    main()
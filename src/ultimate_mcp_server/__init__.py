@@ -26,8 +26,16 @@ def main():
             "add-player",
             "list-players",
             "remove-player",
+            "search-players",
             "backup",
             "import-players",
+            "export-players",
+            "list-tournaments",
+            "list-tournament-players",
+            "list-player-tournaments",
+            "list-federation-payments",
+            "federation-payment-totals",
+            "migrate",
         ]:
             return cli()
 
@@ -9,6 +9,7 @@ from .modules.data_types import (
     RemovePlayerCommand,
     BackupCommand,
     ImportPlayersCommand,
+    ExportPlayersCommand,
     AddTournamentCommand,
     ListTournamentsCommand,
     UpdateTournamentCommand,
@@ -22,30 +23,55 @@ from .modules.data_types import (
     AddFederationPaymentCommand,
     RemoveLastFederationPaymentCommand,
     ListFederationPaymentsCommand,
+    FederationPaymentTotalsCommand,
     SearchPaidPlayersCommand,
+    SearchPlayersCommand,
     SurfaceType
 )
 from .modules.functionality.add_player import add_player
-from .modules.functionality.list_players import list_players
+from .modules.functionality.list_players import PLAYERS_PAGE, iter_players
 from .modules.functionality.remove_player import remove_player
 from .modules.functionality.backup import backup
 from .modules.functionality.import_players import import_players
+from .modules.functionality.export_players import export_players
 from .modules.functionality.add_tournament import add_tournament
-from .modules.functionality.list_tournaments import list_tournaments
+from .modules.functionality.list_tournaments import TOURNAMENTS_PAGE, iter_tournaments
 from .modules.functionality.update_tournament import update_tournament
 from .modules.functionality.remove_tournament import remove_tournament
 from .modules.functionality.register_player import register_player
 from .modules.functionality.unregister_player import unregister_player
-from .modules.functionality.list_tournament_players import list_tournament_players, PlayerWithPayment
-from .modules.functionality.list_player_tournaments import list_player_tournaments
+from .modules.functionality.list_tournament_players import (
+    REGISTRATIONS_PAGE,
+    iter_tournament_players,
+)
+from .modules.functionality.list_player_tournaments import iter_player_tournaments
 from .modules.functionality.mark_payment import mark_payment
 from .modules.functionality.clear_payment import clear_payment
 from .modules.functionality.add_federation_payment import add_federation_payment
 from .modules.functionality.remove_last_federation_payment import remove_last_federation_payment
-from .modules.functionality.list_federation_payments import list_federation_payments
+from .modules.functionality.list_federation_payments import (
+    PAYMENTS_PAGE,
+    iter_federation_payments,
+)
+from .modules.functionality.federation_payment_totals import federation_payment_totals
 from .modules.functionality.search_paid_players import search_paid_players, PlayerPaymentInfo
+from .modules.functionality.search_players import search_players
+from .modules.migrations import migrate, migration_status
+from .modules.records import fetch_player
+from .modules.session import Session
+from .modules.tournament_cache import cached_tournament
 from .modules.constants import DEFAULT_DB_URI
 
+def echo_next_page(page, last, count, limit):
+    """Tell how to get the next page of a listing, if there may be one.
+
+    Listings are printed as they stream from the database, so this takes
+    the last item printed and how many there were instead of the page.
+    """
+    if last is not None and limit is not None and count >= limit:
+        click.echo(f"\nMore results may follow: rerun with --after {page.token_after(last)}")
+
+
 @click.group()
 def cli():
     """FDU - Ultimate Frisbee Team Management"""
@@ -73,25 +99,63 @@ def add_player_command(name, phone, email, db_uri):
 
 @cli.command("list-players")
 @click.option("--limit", "-l", default=1000, help="Maximum number of players to list")
+@click.option("--after", "-a", help="Page token printed by the previous page")
 @click.option("--db-uri", default=DEFAULT_DB_URI, help="Database URI (sqlitecloud:// or file://)")
-def list_players_command(limit, db_uri):
-    """List players in the database."""
+def list_players_command(limit, after, db_uri):
+    """List players in the database, by name."""
     try:
         command = ListPlayersCommand(
             limit=limit,
+            after=after,
             db_uri=db_uri
         )
-        players = list_players(command)
+        # Print the players as they are read
+        count, player = 0, None
+        for player in iter_players(command):
+            if count == 0:
+                click.echo("Players:")
+            count += 1
+            email_display = f", Email: {player.email}" if player.email else ""
+            click.echo(f"- {player.name} (Phone: {player.phone}{email_display})")
         
-        if not players:
+        if count == 0:
             click.echo("No players found")
             return
-        
-        # Print the players
-        click.echo("Players:")
-        for player in players:
+        echo_next_page(PLAYERS_PAGE, player, count, limit)
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
+
+@cli.command("search-players")
+@click.argument("name")
+@click.option("--threshold", "-m", default=0.6, help="Match threshold (0-1), higher = stricter matching")
+@click.option("--limit", "-l", default=10, help="Maximum number of results")
+@click.option("--phonetic", is_flag=True, help="Score names that sound like the query at least 80%")
+@click.option("--db-uri", default=DEFAULT_DB_URI, help="Database URI (sqlitecloud:// or file://)")
+def search_players_command(name, threshold, limit, phonetic, db_uri):
+    """Find players by name, tolerating typos and partial names."""
+    try:
+        command = SearchPlayersCommand(
+            name_query=name,
+            match_threshold=threshold,
+            limit=limit,
+            phonetic=phonetic,
+            db_uri=db_uri
+        )
+        matches = search_players(command)
+
+        if not matches:
+            click.echo(f"No players matching '{name}' found")
+            return
+
+        click.echo(f"Players matching '{name}':")
+        for match in matches:
+            player = match.player
             email_display = f", Email: {player.email}" if player.email else ""
-            click.echo(f"- {player.name} (Phone: {player.phone}{email_display})")
+            match_percentage = int(match.match_score * 100)
+            click.echo(
+                f"- {player.name} (Match: {match_percentage}%, Phone: {player.phone}{email_display})"
+            )
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
@@ -130,8 +194,10 @@ def backup_command(backup_path, db_uri):
 
 @cli.command("import-players")
 @click.argument("csv_file", type=click.Path(exists=True))
+@click.option("--diff", is_flag=True, help="List every player that is inserted or updated")
+@click.option("--dry-run", is_flag=True, help="Show the changes without writing anything")
 @click.option("--db-uri", default=DEFAULT_DB_URI, help="Database URI (sqlitecloud:// or file://)")
-def import_players_command(csv_file, db_uri):
+def import_players_command(csv_file, diff, dry_run, db_uri):
     """Import players from a CSV file, updating existing players.
     
     CSV_FILE must be a CSV file with headers. The following headers are recognized:
@@ -142,29 +208,61 @@ def import_players_command(csv_file, db_uri):
     try:
         command = ImportPlayersCommand(
             csv_path=Path(csv_file),
+            diff=diff,
+            dry_run=dry_run,
             db_uri=db_uri
         )
         
-        players, errors = import_players(command)
+        result = import_players(command)
         
         # Print results
-        if players:
-            click.echo(f"Successfully imported/updated {len(players)} players:")
-            for player in players:
-                email_display = f", Email: {player.email}" if player.email else ""
-                click.echo(f"- {player.name} (Phone: {player.phone}{email_display})")
+        if result.changes:
+            click.echo(f"Changes ({len(result.changes)}):")
+            for change in result.changes:
+                click.echo(change.describe())
+            click.echo("")
         
-        if errors:
-            click.echo(f"\nEncountered {len(errors)} errors:")
-            for error in errors:
+        if result.errors:
+            click.echo(f"Encountered {result.failed} errors:")
+            for error in result.errors:
                 click.echo(f"- {error}")
+            if result.failed > len(result.errors):
+                click.echo(f"- ... and {result.failed - len(result.errors)} more")
+            click.echo("")
                 
-        click.echo(f"\nImport complete: {len(players)} successes, {len(errors)} failures.")
+        heading = "Dry run, nothing was written" if result.dry_run else "Import complete"
+        click.echo(
+            f"{heading}: {result.inserted} inserted, {result.updated} updated, "
+            f"{result.unchanged} unchanged, {result.failed} failures."
+        )
         
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
 
+@cli.command("export-players")
+@click.argument("csv_file")
+@click.option("--tournament-id", "-t", type=int,
+              help="Export this tournament's registrations, with their payment status")
+@click.option("--db-uri", default=DEFAULT_DB_URI, help="Database URI (sqlitecloud:// or file://)")
+def export_players_command(csv_file, tournament_id, db_uri):
+    """Export players to a CSV file that import-players can read back.
+    
+    The file has name, phone and email columns, plus has_paid and
+    payment_date when exporting a tournament's registrations.
+    """
+    try:
+        command = ExportPlayersCommand(
+            csv_path=Path(csv_file),
+            tournament_id=tournament_id,
+            db_uri=db_uri
+        )
+        count = export_players(command)
+        click.echo(f"Exported {count} players to {csv_file}")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
+
 @cli.command("add-tournament")
 @click.option("--name", "-n", required=True, help="Tournament name")
 @click.option("--location", "-l", required=True, help="Tournament location")
@@ -195,29 +293,33 @@ def add_tournament_command(name, location, date, surface, registration_deadline,
 
 @cli.command("list-tournaments")
 @click.option("--limit", "-l", default=1000, help="Maximum number of tournaments to list")
+@click.option("--after", "-a", help="Page token printed by the previous page")
 @click.option("--db-uri", default=DEFAULT_DB_URI, help="Database URI (sqlitecloud:// or file://)")
-def list_tournaments_command(limit, db_uri):
-    """List tournaments in the database."""
+def list_tournaments_command(limit, after, db_uri):
+    """List tournaments in the database, by date."""
     try:
         command = ListTournamentsCommand(
             limit=limit,
+            after=after,
             db_uri=db_uri
         )
-        tournaments = list_tournaments(command)
-        
-        if not tournaments:
-            click.echo("No tournaments found")
-            return
-        
-        # Print the tournaments
-        click.echo("Tournaments:")
-        for tournament in tournaments:
+        # Print the tournaments as they are read
+        count, tournament = 0, None
+        for tournament in iter_tournaments(command):
+            if count == 0:
+                click.echo("Tournaments:")
+            count += 1
             click.echo(f"- ID: {tournament.id}, Name: {tournament.name}")
             click.echo(f"  Location: {tournament.location}")
             click.echo(f"  Date: {tournament.date}")
             click.echo(f"  Surface: {tournament.surface.value}")
             click.echo(f"  Registration Deadline: {tournament.registration_deadline}")
             click.echo("")
+        
+        if count == 0:
+            click.echo("No tournaments found")
+            return
+        echo_next_page(TOURNAMENTS_PAGE, tournament, count, limit)
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
@@ -315,37 +417,46 @@ def unregister_player_command(tournament_id, player_name, db_uri):
 @cli.command("list-tournament-players")
 @click.option("--tournament-id", "-t", required=True, type=int, help="Tournament ID")
 @click.option("--limit", "-l", default=1000, help="Maximum number of players to list")
+@click.option("--after", "-a", help="Page token printed by the previous page")
 @click.option("--db-uri", default=DEFAULT_DB_URI, help="Database URI (sqlitecloud:// or file://)")
-def list_tournament_players_command(tournament_id, limit, db_uri):
-    """List all players registered for a tournament."""
+def list_tournament_players_command(tournament_id, limit, after, db_uri):
+    """List all players registered for a tournament, by name."""
     try:
         command = ListTournamentPlayersCommand(
             tournament_id=tournament_id,
             limit=limit,
+            after=after,
             db_uri=db_uri
         )
-        tournament, players = list_tournament_players(command)
-        
-        # Print tournament details
-        click.echo(f"Tournament: {tournament.name} (ID: {tournament.id})")
-        click.echo(f"Location: {tournament.location}")
-        click.echo(f"Date: {tournament.date}")
-        click.echo(f"Surface: {tournament.surface.value}")
+        count, player_info = 0, None
+        # One transaction, so the tournament and its players are read from the same snapshot
+        with Session(db_uri) as session:
+            tournament = cached_tournament(session, tournament_id)
+            
+            # Print tournament details
+            click.echo(f"Tournament: {tournament.name} (ID: {tournament.id})")
+            click.echo(f"Location: {tournament.location}")
+            click.echo(f"Date: {tournament.date}")
+            click.echo(f"Surface: {tournament.surface.value}")
+            
+            # Print registered players with payment info as they are read
+            for player_info in iter_tournament_players(command, session):
+                if count == 0:
+                    click.echo("\nRegistered Players:")
+                count += 1
+                player = player_info.player
+                email_display = f", Email: {player.email}" if player.email else ""
+                payment_status = "[PAID]" if player_info.has_paid else "[UNPAID]"
+                payment_date = f" on {player_info.payment_date.strftime('%Y-%m-%d')}" if player_info.payment_date else ""
+                
+                click.echo(f"- {player.name} {payment_status}{payment_date}")
+                click.echo(f"  Phone: {player.phone}{email_display}")
         
-        if not players:
+        if count == 0:
             click.echo("\nNo players registered for this tournament")
             return
-        
-        # Print registered players with payment info
-        click.echo(f"\nRegistered Players ({len(players)}):")
-        for player_info in players:
-            player = player_info.player
-            email_display = f", Email: {player.email}" if player.email else ""
-            payment_status = "[PAID]" if player_info.has_paid else "[UNPAID]"
-            payment_date = f" on {player_info.payment_date.strftime('%Y-%m-%d')}" if player_info.payment_date else ""
-            
-            click.echo(f"- {player.name} {payment_status}{payment_date}")
-            click.echo(f"  Phone: {player.phone}{email_display}")
+        click.echo(f"\n{count} players listed")
+        echo_next_page(REGISTRATIONS_PAGE, player_info, count, limit)
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
@@ -354,34 +465,43 @@ def list_tournament_players_command(tournament_id, limit, db_uri):
 @cli.command("list-player-tournaments")
 @click.option("--player-name", "-p", required=True, help="Name of the player")
 @click.option("--limit", "-l", default=1000, help="Maximum number of tournaments to list")
+@click.option("--after", "-a", help="Page token printed by the previous page")
 @click.option("--db-uri", default=DEFAULT_DB_URI, help="Database URI (sqlitecloud:// or file://)")
-def list_player_tournaments_command(player_name, limit, db_uri):
-    """List all tournaments a player is registered for."""
+def list_player_tournaments_command(player_name, limit, after, db_uri):
+    """List all tournaments a player is registered for, by date."""
     try:
         command = ListPlayerTournamentsCommand(
             player_name=player_name,
             limit=limit,
+            after=after,
             db_uri=db_uri
         )
-        player, tournaments = list_player_tournaments(command)
-        
-        # Print player details
-        click.echo(f"Player: {player.name}")
-        click.echo(f"Phone: {player.phone}")
-        if player.email:
-            click.echo(f"Email: {player.email}")
-        
-        if not tournaments:
+        count, tournament = 0, None
+        # One transaction, so the player and their tournaments are read from the same snapshot
+        with Session(db_uri) as session:
+            player = fetch_player(session.cursor(), player_name)
+            
+            # Print player details
+            click.echo(f"Player: {player.name}")
+            click.echo(f"Phone: {player.phone}")
+            if player.email:
+                click.echo(f"Email: {player.email}")
+            
+            # Print registered tournaments as they are read
+            for tournament in iter_player_tournaments(command, session):
+                if count == 0:
+                    click.echo("\nRegistered Tournaments:")
+                count += 1
+                click.echo(f"- ID: {tournament.id}, Name: {tournament.name}")
+                click.echo(f"  Date: {tournament.date}, Location: {tournament.location}")
+                click.echo(f"  Surface: {tournament.surface.value}")
+                click.echo("")
+        
+        if count == 0:
             click.echo("\nPlayer is not registered for any tournaments")
             return
-        
-        # Print registered tournaments
-        click.echo(f"\nRegistered Tournaments ({len(tournaments)}):")
-        for tournament in tournaments:
-            click.echo(f"- ID: {tournament.id}, Name: {tournament.name}")
-            click.echo(f"  Date: {tournament.date}, Location: {tournament.location}")
-            click.echo(f"  Surface: {tournament.surface.value}")
-            click.echo("")
+        click.echo(f"{count} tournaments listed")
+        echo_next_page(TOURNAMENTS_PAGE, tournament, count, limit)
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
@@ -436,7 +556,7 @@ def clear_payment_command(tournament_id, player_name, db_uri):
 
 @cli.command("add-federation-payment")
 @click.option("--player-name", "-p", required=True, help="Name of the player")
-@click.option("--amount", "-a", required=True, type=float, help="Payment amount")
+@click.option("--amount", "-a", required=True, help="Payment amount, e.g. 25.50")
 @click.option("--payment-date", "-d", type=click.DateTime(formats=["%Y-%m-%d"]), 
               default=lambda: datetime.now().date(), help="Payment date (YYYY-MM-DD), defaults to today")
 @click.option("--notes", "-n", help="Optional notes about the payment")
@@ -498,41 +618,76 @@ def remove_last_federation_payment_command(player_name, db_uri):
 @cli.command("list-federation-payments")
 @click.option("--player-name", "-p", required=True, help="Name of the player")
 @click.option("--limit", "-l", default=100, help="Maximum number of payments to list")
+@click.option("--after", "-a", help="Page token printed by the previous page")
 @click.option("--db-uri", default=DEFAULT_DB_URI, help="Database URI (sqlitecloud:// or file://)")
-def list_federation_payments_command(player_name, limit, db_uri):
-    """List all federation payments for a player."""
+def list_federation_payments_command(player_name, limit, after, db_uri):
+    """List all federation payments for a player, newest first."""
     try:
         command = ListFederationPaymentsCommand(
             player_name=player_name,
             limit=limit,
+            after=after,
             db_uri=db_uri
         )
         
-        player, payments = list_federation_payments(command)
-        
-        # Print player details
-        click.echo(f"Player: {player.name}")
-        click.echo(f"Phone: {player.phone}")
-        if player.email:
-            click.echo(f"Email: {player.email}")
+        count, payment = 0, None
+        # One transaction, so the player and their payments are read from the same snapshot
+        with Session(db_uri) as session:
+            player = fetch_player(session.cursor(), player_name)
+            
+            # Print player details
+            click.echo(f"Player: {player.name}")
+            click.echo(f"Phone: {player.phone}")
+            if player.email:
+                click.echo(f"Email: {player.email}")
+            
+            # Print federation payments as they are read
+            for payment in iter_federation_payments(command, session):
+                if count == 0:
+                    click.echo("\nFederation Payments:")
+                count += 1
+                click.echo(f"- ID: {payment.id}, Date: {payment.payment_date.strftime('%Y-%m-%d')}")
+                click.echo(f"  Amount: {payment.amount:.2f}")
+                if payment.notes:
+                    click.echo(f"  Notes: {payment.notes}")
+            
+            # Added up by SQLite, over every payment of the player, not just this page
+            totals = federation_payment_totals(
+                FederationPaymentTotalsCommand(player_name=player.name, db_uri=db_uri), session
+            )
         
-        if not payments:
+        if count == 0:
             click.echo("\nNo federation payments found for this player")
             return
         
-        # Print federation payments
-        click.echo(f"\nFederation Payments ({len(payments)}):")
-        
-        # Calculate total
-        total_amount = sum(payment.amount for payment in payments)
+        click.echo(f"\nTotal Payments ({totals.payments}): {totals.amount:.2f}")
+        echo_next_page(PAYMENTS_PAGE, payment, count, limit)
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@cli.command("federation-payment-totals")
+@click.option("--season", "-s", type=int,
+              help="Season to add up, e.g. 2025 (see SEASON_START_MONTH), defaults to all time")
+@click.option("--player-name", "-p", help="Only add up this player's payments")
+@click.option("--db-uri", default=DEFAULT_DB_URI, help="Database URI (sqlitecloud:// or file://)")
+def federation_payment_totals_command(season, player_name, db_uri):
+    """Add up federation payments per player and for the whole team."""
+    try:
+        command = FederationPaymentTotalsCommand(
+            player_name=player_name,
+            season=season,
+            db_uri=db_uri
+        )
         
-        for payment in payments:
-            click.echo(f"- ID: {payment.id}, Date: {payment.payment_date.strftime('%Y-%m-%d')}")
-            click.echo(f"  Amount: {payment.amount:.2f}")
-            if payment.notes:
-                click.echo(f"  Notes: {payment.notes}")
+        totals = federation_payment_totals(command)
         
-        click.echo(f"\nTotal Payments: {total_amount:.2f}")
+        period = f"season {season}" if season is not None else "all time"
+        click.echo(f"Federation payments, {period}:")
+        for total in totals.players:
+            click.echo(f"- {total.player_name}: {total.amount:.2f} ({total.payments} payments)")
+        click.echo(f"\nTotal ({totals.payments} payments): {totals.amount:.2f}")
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
@@ -544,8 +699,9 @@ def list_federation_payments_command(player_name, limit, db_uri):
 @click.option("--threshold", "-m", type=float, default=0.6, 
               help="Match threshold (0-1), higher = stricter matching")
 @click.option("--limit", "-l", default=100, help="Maximum number of results")
+@click.option("--phonetic", is_flag=True, help="Score names that sound like the query at least 80%")
 @click.option("--db-uri", default=DEFAULT_DB_URI, help="Database URI (sqlitecloud:// or file://)")
-def search_paid_players_command(tournament_id, name, threshold, limit, db_uri):
+def search_paid_players_command(tournament_id, name, threshold, limit, phonetic, db_uri):
     """Search for players who have paid for a tournament, with fuzzy name matching."""
     try:
         command = SearchPaidPlayersCommand(
@@ -553,6 +709,7 @@ def search_paid_players_command(tournament_id, name, threshold, limit, db_uri):
             name_query=name if name else "",
             match_threshold=threshold,
             limit=limit,
+            phonetic=phonetic,
             db_uri=db_uri
         )
         
@@ -597,5 +754,36 @@ def search_paid_players_command(tournament_id, name, threshold, limit, db_uri):
         sys.exit(1)
 
 
+@cli.command("migrate")
+@click.option("--status", is_flag=True, help="Show applied and pending migrations without applying them")
+@click.option("--db-uri", default=DEFAULT_DB_URI, help="Database URI (sqlitecloud:// or file://)")
+def migrate_command(status, db_uri):
+    """Apply pending database schema migrations."""
+    try:
+        if status:
+            states = migration_status(db_uri)
+            pending = [state for state in states if not state.applied]
+            click.echo(f"Migrations ({len(states) - len(pending)} applied, {len(pending)} pending):")
+            for state in states:
+                if state.applied:
+                    applied_at = state.applied_at.strftime("%Y-%m-%d %H:%M")
+                    click.echo(f"  [x] {state.version:04d} {state.name} (applied {applied_at})")
+                else:
+                    click.echo(f"  [ ] {state.version:04d} {state.name} (pending)")
+            return
+        
+        applied = migrate(db_uri)
+        if not applied:
+            click.echo("Database is up to date")
+            return
+        
+        click.echo(f"Applied {len(applied)} migrations:")
+        for migration in applied:
+            click.echo(f"- {migration.version:04d} {migration.name}")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     cli()
\ No newline at end of file
@@ -23,3 +23,44 @@ DEFAULT_LOCAL_DB_PATH = HOME_DIR / ".ultimate.db"
 # 3. Default local file path
 DEFAULT_DB_URI = os.getenv("SQLITE_URI", f"file://{DEFAULT_LOCAL_DB_PATH}")
 
+# Connection pool settings
+# DB_POOL_SIZE: maximum number of idle connections kept per database URI
+# DB_POOL_IDLE_TIMEOUT: seconds an idle connection is kept before it is closed
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_POOL_IDLE_TIMEOUT = float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300"))
+
+# Connection profile applied to new connections (see modules/profiles.py):
+# durable, fast-local or read-only-analytics
+DEFAULT_DB_PROFILE = os.getenv("SQLITE_PROFILE", "durable")
+
+# Tool execution (see modules/executor.py)
+# TOOL_MAX_WORKERS: threads running blocking database work for MCP tools
+# TOOL_CONCURRENCY: tool calls allowed to run at once; extra calls wait
+# TOOL_TIMEOUT: default seconds before a tool call fails with a timeout
+# TOOL_TIMEOUTS: per-tool overrides, e.g. "export-players=600,backup=600"
+TOOL_MAX_WORKERS = int(os.getenv("TOOL_MAX_WORKERS", "8"))
+TOOL_CONCURRENCY = int(os.getenv("TOOL_CONCURRENCY", str(TOOL_MAX_WORKERS)))
+TOOL_TIMEOUT = float(os.getenv("TOOL_TIMEOUT", "30"))
+TOOL_TIMEOUTS = os.getenv("TOOL_TIMEOUTS", "")
+
+# Fuzzy search caches (see modules/utils.py)
+# NAME_CACHE_SIZE: normalized names, token lists and phonetic codes kept in memory
+# SCORE_CACHE_QUERIES: recent search queries whose match scores are kept
+# SCORE_CACHE_SIZE: total (query, name) match scores kept across those queries
+NAME_CACHE_SIZE = int(os.getenv("NAME_CACHE_SIZE", "65536"))
+SCORE_CACHE_QUERIES = int(os.getenv("SCORE_CACHE_QUERIES", "64"))
+SCORE_CACHE_SIZE = int(os.getenv("SCORE_CACHE_SIZE", "262144"))
+
+# Tournament rows kept in memory per database (see modules/tournament_cache.py)
+TOURNAMENT_CACHE_SIZE = int(os.getenv("TOURNAMENT_CACHE_SIZE", "1024"))
+
+# Parallel fuzzy matching (see modules/parallel.py)
+# MATCH_PROCESSES: worker processes scoring large searches, 1 to always score in-process
+# MATCH_PARALLEL_MIN_CANDIDATES: names a search must score before it uses the workers
+MATCH_PROCESSES = int(os.getenv("MATCH_PROCESSES", str(min(4, os.cpu_count() or 1))))
+MATCH_PARALLEL_MIN_CANDIDATES = int(os.getenv("MATCH_PARALLEL_MIN_CANDIDATES", "50000"))
+
+# Federation payment totals (see functionality/federation_payment_totals.py)
+# SEASON_START_MONTH: month (1-12) a season starts in; season 2025 starts in that
+# month of 2025 and lasts a year
+SEASON_START_MONTH = int(os.getenv("SEASON_START_MONTH", "1"))
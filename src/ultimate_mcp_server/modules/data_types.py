@@ -1,9 +1,10 @@
 from datetime import datetime, date
+from decimal import Decimal
 from pathlib import Path
-from typing import Optional, List, Literal
+from typing import Annotated, Dict, Optional, List, Literal, Type, Union
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, create_model
 
 from .constants import DEFAULT_DB_URI
 
@@ -16,7 +17,8 @@ class AddPlayerCommand(BaseModel):
 
 
 class ListPlayersCommand(BaseModel):
-    limit: int = 1000
+    limit: Optional[int] = 1000  # None lists everything
+    after: Optional[str] = None  # Page token from a previous listing
     db_uri: str = DEFAULT_DB_URI
 
 
@@ -32,6 +34,17 @@ class BackupCommand(BaseModel):
 
 class ImportPlayersCommand(BaseModel):
     csv_path: Path
+    # Report every inserted/updated player in the result
+    diff: bool = False
+    # Compute the change set without writing anything (implies diff)
+    dry_run: bool = False
+    db_uri: str = DEFAULT_DB_URI
+
+
+class ExportPlayersCommand(BaseModel):
+    csv_path: Path
+    # Export a tournament's registrations, with their payment status, instead
+    tournament_id: Optional[int] = None
     db_uri: str = DEFAULT_DB_URI
 
 
@@ -67,7 +80,8 @@ class AddTournamentCommand(BaseModel):
 
 
 class ListTournamentsCommand(BaseModel):
-    limit: int = 1000
+    limit: Optional[int] = 1000  # None lists everything
+    after: Optional[str] = None  # Page token from a previous listing
     db_uri: str = DEFAULT_DB_URI
 
 
@@ -112,14 +126,16 @@ class UnregisterPlayerCommand(BaseModel):
 class ListTournamentPlayersCommand(BaseModel):
     """Command to list all players registered for a tournament."""
     tournament_id: int
-    limit: int = 1000
+    limit: Optional[int] = 1000  # None lists everything
+    after: Optional[str] = None  # Page token from a previous listing
     db_uri: str = DEFAULT_DB_URI
 
 
 class ListPlayerTournamentsCommand(BaseModel):
     """Command to list all tournaments a player is registered for."""
     player_name: str
-    limit: int = 1000
+    limit: Optional[int] = 1000  # None lists everything
+    after: Optional[str] = None  # Page token from a previous listing
     db_uri: str = DEFAULT_DB_URI
 
 
@@ -144,7 +160,7 @@ class FederationPayment(BaseModel):
     id: Optional[int] = None
     player_name: str
     payment_date: datetime
-    amount: float
+    amount: Decimal
     notes: Optional[str] = None
     created_at: Optional[datetime] = None
 
@@ -153,7 +169,7 @@ class AddFederationPaymentCommand(BaseModel):
     """Command to add a federation payment for a player."""
     player_name: str
     payment_date: datetime  
-    amount: float
+    amount: Decimal = Field(decimal_places=2)  # Whole cents, e.g. 25.50
     notes: Optional[str] = None
     db_uri: str = DEFAULT_DB_URI
 
@@ -167,7 +183,15 @@ class RemoveLastFederationPaymentCommand(BaseModel):
 class ListFederationPaymentsCommand(BaseModel):
     """Command to list all federation payments for a player."""
     player_name: str
-    limit: int = 100
+    limit: Optional[int] = 100  # None lists everything
+    after: Optional[str] = None  # Page token from a previous listing
+    db_uri: str = DEFAULT_DB_URI
+
+
+class FederationPaymentTotalsCommand(BaseModel):
+    """Command to add up federation payments, per player and team-wide."""
+    player_name: Optional[str] = None  # None adds up every player's payments
+    season: Optional[int] = None  # e.g. 2025 (see SEASON_START_MONTH); None for all time
     db_uri: str = DEFAULT_DB_URI
 
 
@@ -177,5 +201,83 @@ class SearchPaidPlayersCommand(BaseModel):
     name_query: str = ""  # Optional, if empty will return all paid players
     match_threshold: float = 0.6  # Similarity threshold (0-1), higher = stricter matching
     limit: int = 100
+    phonetic: bool = False  # Sound-alike names score at least PHONETIC_MATCH_SCORE
     db_uri: str = DEFAULT_DB_URI
 
+
+class SearchPlayersCommand(BaseModel):
+    """Command to find players by a possibly misspelled name."""
+    name_query: str
+    match_threshold: float = 0.6  # Similarity threshold (0-1), higher = stricter matching
+    limit: int = 10
+    phonetic: bool = False  # Sound-alike names score at least PHONETIC_MATCH_SCORE
+    db_uri: str = DEFAULT_DB_URI
+
+
+class CacheStats(BaseModel):
+    """Usage counters of one of the in-memory fuzzy search caches."""
+    name: str
+    hits: int
+    misses: int
+    size: int  # Entries currently cached
+    max_size: int
+
+
+class BatchMode(str, Enum):
+    """How a batch reacts to a failing operation."""
+    ATOMIC = "atomic"  # roll back everything and skip the remaining operations
+    CONTINUE = "continue"  # keep the successful operations and go on
+
+
+# Commands that can run in a batch, keyed by tool name
+BATCH_COMMANDS: Dict[str, Type[BaseModel]] = {
+    "add-player": AddPlayerCommand,
+    "remove-player": RemovePlayerCommand,
+    "add-tournament": AddTournamentCommand,
+    "update-tournament": UpdateTournamentCommand,
+    "remove-tournament": RemoveTournamentCommand,
+    "register-player": RegisterPlayerCommand,
+    "unregister-player": UnregisterPlayerCommand,
+    "mark-payment": MarkPaymentCommand,
+    "clear-payment": ClearPaymentCommand,
+    "add-federation-payment": AddFederationPaymentCommand,
+    "remove-last-federation-payment": RemoveLastFederationPaymentCommand,
+}
+
+
+def _batch_operation(op: str, command_type: Type[BaseModel]) -> Type[BaseModel]:
+    """Model of one batch operation: {"op": op, "args": <command fields>}.
+
+    The arguments are the command's fields except db_uri, since the batch
+    decides which database every operation runs on.
+    """
+    base_name = command_type.__name__.removesuffix("Command")
+    args_type = create_model(
+        f"{base_name}Args",
+        __doc__=f"Arguments of a batch {op} operation.",
+        **{
+            name: (field.annotation, field)
+            for name, field in command_type.model_fields.items()
+            if name != "db_uri"
+        },
+    )
+    return create_model(
+        f"{base_name}Operation",
+        __doc__=f"A batch {op} operation.",
+        op=(Literal[op], ...),
+        args=(args_type, ...),
+    )
+
+
+# A single operation of a batch: a tool name and that command's arguments
+BatchOperation = Annotated[
+    Union[tuple(_batch_operation(op, command_type) for op, command_type in BATCH_COMMANDS.items())],
+    Field(discriminator="op"),
+]
+
+
+class BatchCommand(BaseModel):
+    """Command to run several write operations in one transaction."""
+    operations: List[BatchOperation]
+    mode: BatchMode = BatchMode.ATOMIC
+    db_uri: str = DEFAULT_DB_URI
@@ -0,0 +1,208 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, Optional, TypeVar
+
+from .constants import TOOL_CONCURRENCY, TOOL_MAX_WORKERS, TOOL_TIMEOUT, TOOL_TIMEOUTS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Tools that routinely take longer than the default timeout
+DEFAULT_TOOL_TIMEOUTS: Dict[str, float] = {
+    "backup": 300.0,
+    "export-players": 300.0,
+}
+
+# Tools that change the database. A worker thread can't be interrupted, so a
+# timed-out write would still commit after its caller was told it failed, and
+# a retry would apply it twice. These tools always run to completion.
+WRITE_TOOLS: FrozenSet[str] = frozenset({
+    "add-player",
+    "remove-player",
+    "import-players",
+    "add-tournament",
+    "update-tournament",
+    "remove-tournament",
+    "register-player",
+    "unregister-player",
+    "mark-payment",
+    "clear-payment",
+    "add-federation-payment",
+    "remove-last-federation-payment",
+    "batch",
+})
+
+
+class ToolTimeoutError(TimeoutError):
+    """Raised when a tool call doesn't finish within its timeout."""
+
+
+def parse_timeouts(spec: str) -> Dict[str, float]:
+    """Parse a "tool=seconds,tool=seconds" string into a dictionary.
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    timeouts = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, sep, seconds = entry.partition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"Invalid tool timeout '{entry}', expected tool=seconds")
+        try:
+            timeouts[name.strip()] = float(seconds)
+        except ValueError:
+            raise ValueError(f"Invalid tool timeout '{entry}', expected tool=seconds")
+    return timeouts
+
+
+class ToolExecutor:
+    """Runs blocking tool functions on a bounded thread pool.
+
+    - At most ``max_workers`` threads execute database work.
+    - At most ``max_concurrency`` tool calls are in flight; extra calls wait
+      on the event loop without holding a thread.
+    - Each read-only call is bounded by its tool's timeout. On timeout the
+      caller gets a ToolTimeoutError right away, but the call keeps running
+      (threads can't be interrupted) and keeps its thread and its concurrency
+      slot until it finishes.
+    - Calls to WRITE_TOOLS never time out, so a caller is only told a write
+      failed when it was actually rolled back.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = TOOL_MAX_WORKERS,
+        max_concurrency: int = TOOL_CONCURRENCY,
+        default_timeout: Optional[float] = TOOL_TIMEOUT,
+        timeouts: Optional[Dict[str, float]] = None,
+    ):
+        if max_workers < 1 or max_concurrency < 1:
+            raise ValueError("max_workers and max_concurrency must be at least 1")
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.default_timeout = default_timeout
+        self.timeouts = dict(DEFAULT_TOOL_TIMEOUTS)
+        self.timeouts.update(parse_timeouts(TOOL_TIMEOUTS))
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # asyncio primitives belong to one event loop, so keep one per loop
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    def timeout_for(self, name: str) -> Optional[float]:
+        """Timeout in seconds for a tool, or None if it has no timeout."""
+        if name in WRITE_TOOLS:
+            return None
+        timeout = self.timeouts.get(name, self.default_timeout)
+        if timeout is None or timeout <= 0:
+            return None
+        return timeout
+
+    async def run(self, name: str, func: Callable[..., T], *args) -> T:
+        """Run ``func(*args)`` on the thread pool and await its result.
+
+        Raises:
+            ToolTimeoutError: If the call exceeds the tool's timeout
+        """
+        loop = asyncio.get_running_loop()
+        timeout = self.timeout_for(name)
+        # Propagate context variables to the worker thread, like asyncio.to_thread
+        call = functools.partial(contextvars.copy_context().run, func, *args)
+
+        semaphore = self._semaphore(loop)
+        await semaphore.acquire()
+        try:
+            future = loop.run_in_executor(self._executor(), call)
+        except BaseException:
+            semaphore.release()
+            raise
+        # Release the slot when the thread is done, not when the caller stops waiting
+        future.add_done_callback(lambda _: semaphore.release())
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Tool '%s' timed out after %.1f seconds", name, timeout)
+            raise ToolTimeoutError(f"Tool '{name}' timed out after {timeout:g} seconds")
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Stop the worker threads. A later call starts a fresh pool.
+
+        With ``cancel_futures``, calls still waiting for a thread are cancelled
+        instead of being run first.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._semaphores.clear()
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="mcp-tool"
+                    )
+        return self._pool
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            # Drop semaphores of loops that are gone (e.g. successive asyncio.run calls)
+            for stale in [l for l in self._semaphores if l.is_closed()]:
+                del self._semaphores[stale]
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+
+_executor = ToolExecutor()
+
+
+def get_executor() -> ToolExecutor:
+    """Get the process-wide tool executor."""
+    return _executor
+
+
+def configure_executor(
+    max_workers: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    default_timeout: Optional[float] = None,
+    timeouts: Optional[Dict[str, float]] = None,
+) -> ToolExecutor:
+    """Replace the process-wide tool executor with new settings.
+
+    The previous executor is shut down after its running calls finish.
+    """
+    global _executor
+    previous = _executor
+    _executor = ToolExecutor(
+        max_workers=max_workers if max_workers is not None else previous.max_workers,
+        max_concurrency=(
+            max_concurrency if max_concurrency is not None else previous.max_concurrency
+        ),
+        default_timeout=(
+            default_timeout if default_timeout is not None else previous.default_timeout
+        ),
+        timeouts={**previous.timeouts, **(timeouts or {})},
+    )
+    previous.shutdown(wait=False)
+    return _executor
+
+
+async def run_tool(name: str, func: Callable[..., T], *args) -> T:
+    """Run a blocking tool function on the process-wide executor.
+
+    Example:
+        player = await run_tool("add-player", add_player, command)
+    """
+    return await _executor.run(name, func, *args)
@@ -1,7 +1,7 @@
 # Functionality module initialization
 from .add_player import add_player
 from .backup import backup
-from .import_players import import_players
+from .import_players import import_players, ImportPlayersResult, PlayerChange
 from .list_players import list_players
 from .remove_player import remove_player
 from .add_tournament import add_tournament
@@ -17,4 +17,7 @@ from .clear_payment import clear_payment
 from .add_federation_payment import add_federation_payment
 from .remove_last_federation_payment import remove_last_federation_payment
 from .list_federation_payments import list_federation_payments
-from .search_paid_players import search_paid_players, PlayerPaymentInfo
\ No newline at end of file
+from .federation_payment_totals import federation_payment_totals, PaymentTotal, PaymentTotals
+from .search_paid_players import search_paid_players, PlayerPaymentInfo
+from .search_players import search_players, PlayerMatch
+from .run_batch import run_batch, BatchResult, BatchOperationResult
\ No newline at end of file
@@ -1,15 +1,23 @@
 from datetime import datetime
+from typing import Optional
 
 from ..data_types import AddFederationPaymentCommand, FederationPayment
-from ..utils import get_connection
+from ..session import Session, transaction
 from ..init_db import init_db
+from ..money import from_cents, to_cents
+from ..timestamps import to_timestamp
+from ..utils import find_player
 
 
-def add_federation_payment(command: AddFederationPaymentCommand) -> FederationPayment:
+def add_federation_payment(
+    command: AddFederationPaymentCommand, session: Optional[Session] = None
+) -> FederationPayment:
     """Add a federation payment for a player.
     
     Args:
         command: The command with player and payment details
+        session: Optional session to run in; committing is then left to
+            the session owner
         
     Returns:
         The created FederationPayment object
@@ -19,18 +27,14 @@ def add_federation_payment(command: AddFederationPaymentCommand) -> FederationPa
     """
     init_db(command.db_uri)
     
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    try:
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        
         # Check if player exists
-        cursor.execute(
-            "SELECT name FROM players WHERE name = ?", 
-            (command.player_name,)
-        )
-        player = cursor.fetchone()
-        if not player:
+        player = find_player(cursor, command.player_name)
+        if player is None:
             raise ValueError(f"Player '{command.player_name}' not found")
+        player_id, player_name = player
         
         # Current timestamp
         now = datetime.now()
@@ -39,32 +43,26 @@ def add_federation_payment(command: AddFederationPaymentCommand) -> FederationPa
         cursor.execute(
             """
             INSERT INTO federation_payments 
-            (player_name, payment_date, amount, notes, created_at)
+            (player_id, payment_date, amount_cents, notes, created_at)
             VALUES (?, ?, ?, ?, ?)
             """, 
             (
-                command.player_name, 
-                command.payment_date, 
-                command.amount, 
+                player_id, 
+                to_timestamp(command.payment_date),
+                to_cents(command.amount),
                 command.notes, 
-                now
+                to_timestamp(now)
             )
         )
-        conn.commit()
         
         # Get the ID of the newly inserted payment
         payment_id = cursor.lastrowid
         
-        return FederationPayment(
-            id=payment_id,
-            player_name=command.player_name,
-            payment_date=command.payment_date,
-            amount=command.amount,
-            notes=command.notes,
-            created_at=now
-        )
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
\ No newline at end of file
+    return FederationPayment.model_construct(
+        id=payment_id,
+        player_name=player_name,
+        payment_date=command.payment_date,
+        amount=from_cents(to_cents(command.amount)),
+        notes=command.notes,
+        created_at=now
+    )
@@ -1,34 +1,47 @@
 from datetime import datetime
+from typing import Optional
 
 from ..data_types import AddPlayerCommand, Player
-from ..utils import get_connection
+from ..session import Session, transaction
+from ..timestamps import to_timestamp
 from ..init_db import init_db
+from ..name_index import index_players_added
+from ..utils import find_player, normalize_name, save_phonetic_codes
 
 
-def add_player(command: AddPlayerCommand) -> Player:
+def add_player(command: AddPlayerCommand, session: Optional[Session] = None) -> Player:
     init_db(command.db_uri)
 
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-
     now = datetime.now()
 
-    try:
-        cursor.execute(
-            "INSERT INTO players (name, created, phone, email) VALUES (?, ?, ?, ?)",
-            (command.name, now, command.phone, command.email),
-        )
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        # Handle both sqlite3.IntegrityError and sqlitecloud equivalent
-        if "UNIQUE constraint failed" in str(e) or "already exists" in str(e):
-            raise ValueError(f"Player '{command.name}' already exists")
-        raise
-    finally:
-        conn.close()
-
-    return Player(
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        try:
+            cursor.execute(
+                "INSERT INTO players (name, normalized_name, created, phone, email) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    command.name,
+                    normalize_name(command.name),
+                    to_timestamp(now),
+                    command.phone,
+                    command.email,
+                ),
+            )
+            save_phonetic_codes(cursor, [command.name])
+            tx.after_commit(lambda: index_players_added(command.db_uri, [command.name]))
+        except Exception as e:
+            # Handle both sqlite3.IntegrityError and sqlitecloud equivalent
+            if "UNIQUE constraint failed" in str(e) or "already exists" in str(e):
+                existing = find_player(cursor, command.name)
+                if existing is not None and existing[1] != command.name:
+                    raise ValueError(
+                        f"Player '{command.name}' already exists as '{existing[1]}'"
+                    )
+                raise ValueError(f"Player '{command.name}' already exists")
+            raise
+
+    return Player.model_construct(
         name=command.name, created=now, phone=command.phone, email=command.email
     )
 
@@ -1,15 +1,20 @@
 from datetime import datetime
+from typing import Optional
 
 from ..data_types import AddTournamentCommand, Tournament, SurfaceType
-from ..utils import get_connection
+from ..session import Session, transaction
 from ..init_db import init_db
+from ..timestamps import to_day, to_timestamp
+from ..tournament_cache import tournaments_changed
 
 
-def add_tournament(command: AddTournamentCommand) -> Tournament:
+def add_tournament(command: AddTournamentCommand, session: Optional[Session] = None) -> Tournament:
     """Add a new tournament to the database.
 
     Args:
         command: The command containing tournament details
+        session: Optional session to run in; committing is then left to
+            the session owner
 
     Returns:
         The created Tournament object with id and created timestamp
@@ -19,40 +24,36 @@ def add_tournament(command: AddTournamentCommand) -> Tournament:
     """
     init_db(command.db_uri)
 
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-
     now = datetime.now()
 
-    try:
-        cursor.execute(
-            """
-            INSERT INTO tournaments 
-            (name, location, date, surface, registration_deadline, created) 
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                command.name,
-                command.location,
-                command.date.isoformat(),
-                command.surface.value,
-                command.registration_deadline.isoformat(),
-                now,
-            ),
-        )
-        conn.commit()
-        
-        # Get the ID of the newly inserted row
-        tournament_id = cursor.lastrowid
-    except Exception as e:
-        conn.rollback()
-        if "UNIQUE constraint failed" in str(e) or "already exists" in str(e):
-            raise ValueError(f"Tournament '{command.name}' already exists")
-        raise
-    finally:
-        conn.close()
-
-    return Tournament(
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        try:
+            cursor.execute(
+                """
+                INSERT INTO tournaments 
+                (name, location, date, surface, registration_deadline, created) 
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    command.name,
+                    command.location,
+                    to_day(command.date),
+                    command.surface.value,
+                    to_day(command.registration_deadline),
+                    to_timestamp(now),
+                ),
+            )
+            
+            # Get the ID of the newly inserted row
+            tournament_id = cursor.lastrowid
+            tournaments_changed(tx)
+        except Exception as e:
+            if "UNIQUE constraint failed" in str(e) or "already exists" in str(e):
+                raise ValueError(f"Tournament '{command.name}' already exists")
+            raise
+
+    return Tournament.model_construct(
         id=tournament_id,
         name=command.name,
         location=command.location,
@@ -60,4 +61,4 @@ def add_tournament(command: AddTournamentCommand) -> Tournament:
         surface=command.surface,
         registration_deadline=command.registration_deadline,
         created=now,
-    )
\ No newline at end of file
+    )
@@ -1,12 +1,20 @@
-import os
 import sqlite3
-import sqlitecloud
-from pathlib import Path
 from urllib.parse import urlparse
 
 from ..data_types import BackupCommand
 from ..init_db import init_db
-from ..utils import get_connection
+from ..migrations import MIGRATIONS, apply_migrations
+from ..pool import connection
+
+# Tables copied when backing up a SQLiteCloud database, parents first
+BACKUP_TABLES = [
+    "players",
+    "player_phonetic_codes",
+    "tournaments",
+    "tournament_players",
+    "federation_payments",
+]
+BACKUP_BATCH_SIZE = 500
 
 def backup(command: BackupCommand) -> str:
     init_db(command.db_uri)
@@ -19,58 +27,40 @@ def backup(command: BackupCommand) -> str:
     
     if parsed_uri.scheme == 'sqlitecloud':
         # SQLiteCloud connection - need to export data through queries
-        conn = get_connection(command.db_uri)
-        
-        # Create a local SQLite backup file
-        backup_conn = sqlite3.connect(command.backup_path)
-        backup_cursor = backup_conn.cursor()
-        
-        # Create the schema
-        backup_cursor.execute('''
-        CREATE TABLE IF NOT EXISTS players (
-            name TEXT PRIMARY KEY,
-            created TIMESTAMP,
-            phone TEXT,
-            email TEXT
-        )
-        ''')
-        
-        # Export data
-        cursor = conn.cursor()
-        cursor.execute("SELECT name, created, phone, email FROM players")
-        rows = cursor.fetchall()
-        
-        for row in rows:
-            backup_cursor.execute(
-                "INSERT INTO players (name, created, phone, email) VALUES (?, ?, ?, ?)",
-                row
-            )
-        
-        backup_conn.commit()
-        backup_conn.close()
-        conn.close()
+        with connection(command.db_uri) as conn:
+            # Create a local SQLite backup file
+            backup_conn = sqlite3.connect(command.backup_path)
+            
+            # Create the schema by running the same migrations as the source
+            apply_migrations(backup_conn, MIGRATIONS)
+            backup_cursor = backup_conn.cursor()
+            
+            # Export data, parents before children
+            cursor = conn.cursor()
+            for table in BACKUP_TABLES:
+                cursor.execute(f"SELECT * FROM {table}")
+                while True:
+                    rows = cursor.fetchmany(BACKUP_BATCH_SIZE)
+                    if not rows:
+                        break
+                    placeholders = ", ".join("?" * len(rows[0]))
+                    backup_cursor.executemany(
+                        f"INSERT INTO {table} VALUES ({placeholders})",
+                        rows
+                    )
+            
+            backup_conn.commit()
+            backup_conn.close()
     else:
         # Local SQLite connection - we can use the native backup function
-        if parsed_uri.scheme == 'file':
-            # Extract the path from the URI
-            db_path = parsed_uri.path
-            if os.name == 'nt' and db_path.startswith('/'):
-                db_path = db_path[1:]
-        else:
-            # Assume it's a direct path (for backward compatibility)
-            db_path = command.db_uri
-        
-        # Connect to the database
-        conn = sqlite3.connect(db_path)
-        
-        # Create a new connection for the backup
-        backup_conn = sqlite3.connect(command.backup_path)
-        
-        # Copy the database
-        conn.backup(backup_conn)
-        
-        # Close connections
-        backup_conn.close()
-        conn.close()
+        with connection(command.db_uri) as conn:
+            # Create a new connection for the backup
+            backup_conn = sqlite3.connect(command.backup_path)
+            
+            # Copy the database
+            conn.backup(backup_conn)
+            
+            # Close the backup connection
+            backup_conn.close()
     
     return f"Successfully backed up database to {command.backup_path}"
\ No newline at end of file
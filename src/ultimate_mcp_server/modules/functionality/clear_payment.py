@@ -1,15 +1,21 @@
-from datetime import datetime
+from typing import Optional
 
 from ..data_types import ClearPaymentCommand, TournamentPlayer
-from ..utils import get_connection
+from ..session import Session, transaction
 from ..init_db import init_db
+from ..timestamps import from_timestamp
+from ..utils import normalize_name
 
 
-def clear_payment(command: ClearPaymentCommand) -> TournamentPlayer:
+def clear_payment(
+    command: ClearPaymentCommand, session: Optional[Session] = None
+) -> TournamentPlayer:
     """Clear a player's tournament payment status.
     
     Args:
         command: The command with tournament and player details
+        session: Optional session to run in; committing is then left to
+            the session owner
         
     Returns:
         Updated TournamentPlayer record
@@ -19,57 +25,42 @@ def clear_payment(command: ClearPaymentCommand) -> TournamentPlayer:
     """
     init_db(command.db_uri)
     
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    try:
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        
         # Check if player is registered for this tournament
         cursor.execute(
             """
-            SELECT tournament_id, player_name, registered_at, has_paid
-            FROM tournament_players 
-            WHERE tournament_id = ? AND player_name = ?
+            SELECT tp.player_id, p.name, tp.registered_at, tp.has_paid
+            FROM tournament_players tp
+            JOIN players p ON p.id = tp.player_id
+            WHERE tp.tournament_id = ? AND p.normalized_name = ?
             """,
-            (command.tournament_id, command.player_name)
+            (command.tournament_id, normalize_name(command.player_name))
         )
         registration = cursor.fetchone()
         if not registration:
             raise ValueError(
                 f"Player '{command.player_name}' is not registered for tournament {command.tournament_id}"
             )
+        player_id, player_name = registration[:2]
         
-        # If not already paid, nothing to do
-        if not registration[3]:
-            conn.close()
-            return TournamentPlayer(
-                tournament_id=command.tournament_id,
-                player_name=command.player_name,
-                registered_at=datetime.fromisoformat(registration[2]),
-                has_paid=False,
-                payment_date=None
+        # Clear payment status if it was set, otherwise there is nothing to do
+        if registration[3]:
+            cursor.execute(
+                """
+                UPDATE tournament_players
+                SET has_paid = 0, payment_date = NULL
+                WHERE tournament_id = ? AND player_id = ?
+                """,
+                (command.tournament_id, player_id)
             )
         
-        # Clear payment status
-        cursor.execute(
-            """
-            UPDATE tournament_players
-            SET has_paid = 0, payment_date = NULL
-            WHERE tournament_id = ? AND player_name = ?
-            """,
-            (command.tournament_id, command.player_name)
-        )
-        conn.commit()
-        
-        # Return updated registration
-        return TournamentPlayer(
-            tournament_id=command.tournament_id,
-            player_name=command.player_name,
-            registered_at=datetime.fromisoformat(registration[2]),
-            has_paid=False,
-            payment_date=None
-        )
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
\ No newline at end of file
+    # Return updated registration
+    return TournamentPlayer.model_construct(
+        tournament_id=command.tournament_id,
+        player_name=player_name,
+        registered_at=from_timestamp(registration[2]),
+        has_paid=False,
+        payment_date=None
+    )
@@ -0,0 +1,74 @@
+import csv
+import os
+from typing import Iterator, Sequence
+
+from ..data_types import ExportPlayersCommand, ListPlayersCommand, ListTournamentPlayersCommand
+from .list_players import iter_players
+from .list_tournament_players import iter_tournament_players
+
+# Same headers import-players reads, so an export can be imported back
+PLAYER_HEADER = ["name", "phone", "email"]
+REGISTRATION_HEADER = PLAYER_HEADER + ["has_paid", "payment_date"]
+
+
+def _player_rows(command: ExportPlayersCommand) -> Iterator[Sequence[str]]:
+    for player in iter_players(ListPlayersCommand(limit=None, db_uri=command.db_uri)):
+        yield player.name, player.phone, player.email or ""
+
+
+def _registration_rows(command: ExportPlayersCommand) -> Iterator[Sequence[str]]:
+    registrations = iter_tournament_players(
+        ListTournamentPlayersCommand(
+            tournament_id=command.tournament_id, limit=None, db_uri=command.db_uri
+        )
+    )
+    for registration in registrations:
+        player = registration.player
+        yield (
+            player.name,
+            player.phone,
+            player.email or "",
+            "yes" if registration.has_paid else "no",
+            registration.payment_date.isoformat() if registration.payment_date else "",
+        )
+
+
+def export_players(command: ExportPlayersCommand) -> int:
+    """Write every player, or a tournament's registrations, to a CSV file.
+
+    Rows are streamed from the database to the file in batches, so memory
+    stays flat however large the roster is. The file is written next to its
+    destination and moved into place once complete, so a failed export
+    never leaves a truncated CSV behind.
+
+    Args:
+        command: The command with the CSV path and, to export a tournament's
+            registrations with their payment status, its ID
+
+    Returns:
+        The number of players written
+
+    Raises:
+        ValueError: If the tournament doesn't exist
+    """
+    if command.tournament_id is None:
+        header, rows = PLAYER_HEADER, _player_rows(command)
+    else:
+        header, rows = REGISTRATION_HEADER, _registration_rows(command)
+
+    command.csv_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = command.csv_path.with_name(command.csv_path.name + ".partial")
+    count = 0
+    try:
+        with open(partial_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        os.replace(partial_path, command.csv_path)
+    finally:
+        # Only left behind if writing failed
+        if partial_path.exists():
+            partial_path.unlink()
+    return count
@@ -0,0 +1,115 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+from ..constants import SEASON_START_MONTH
+from ..data_types import FederationPaymentTotalsCommand
+from ..init_db import init_db
+from ..money import from_cents
+from ..session import Session, transaction
+from ..timestamps import to_timestamp
+from ..utils import find_player
+
+
+@dataclass(frozen=True, slots=True)
+class PaymentTotal:
+    """A player's federation payments, added up."""
+    player_name: str
+    payments: int
+    amount: Decimal
+
+
+@dataclass
+class PaymentTotals:
+    """Federation payments added up per player, and for the whole team."""
+    season: Optional[int] = None  # None for all time
+    players: List[PaymentTotal] = field(default_factory=list)  # Sorted by name
+    payments: int = 0  # Team-wide
+    amount: Decimal = Decimal("0.00")  # Team-wide
+
+
+def season_bounds(season: int) -> Tuple[datetime, datetime]:
+    """Start of a season and of the next one.
+
+    Season 2025 starts on the first day of SEASON_START_MONTH in 2025.
+
+    Raises:
+        ValueError: If the season is out of range
+    """
+    return (
+        datetime(season, SEASON_START_MONTH, 1),
+        datetime(season + 1, SEASON_START_MONTH, 1),
+    )
+
+
+def federation_payment_totals(
+    command: FederationPaymentTotalsCommand, session: Optional[Session] = None
+) -> PaymentTotals:
+    """Add up federation payments per player, for a season or for all time.
+
+    The sums are computed by SQLite over the integer cents, grouped by
+    player_id and with the names joined to the grouped rows, so no payment
+    is loaded and the totals are exact. The team-wide total is a second
+    aggregate in the same read transaction.
+
+    Args:
+        command: The command with the season and the player (None for
+            every player who paid)
+        session: Optional session to run in; committing is then left to
+            the session owner
+
+    Returns:
+        The totals of each player, and of the team as a whole
+
+    Raises:
+        ValueError: If the player doesn't exist or the season is out of range
+    """
+    init_db(command.db_uri)
+
+    conditions = []
+    params = []
+    if command.season is not None:
+        start, end = season_bounds(command.season)
+        conditions.append("payment_date >= ? AND payment_date < ?")
+        params += [to_timestamp(start), to_timestamp(end)]
+
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        player_name = None
+        if command.player_name is not None:
+            player = find_player(cursor, command.player_name)
+            if player is None:
+                raise ValueError(f"Player '{command.player_name}' not found")
+            player_id, player_name = player
+            conditions.append("player_id = ?")
+            params.append(player_id)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor.execute(
+            f"""
+            SELECT p.name, t.payments, t.cents
+            FROM (
+                SELECT player_id, COUNT(*) AS payments, SUM(amount_cents) AS cents
+                FROM federation_payments
+                {where}
+                GROUP BY player_id
+            ) t
+            JOIN players p ON p.id = t.player_id
+            ORDER BY p.name
+            """,
+            params,
+        )
+        players = [
+            PaymentTotal(name, payments, from_cents(cents))
+            for name, payments, cents in cursor.fetchall()
+        ]
+        cursor.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(amount_cents), 0) FROM federation_payments {where}",
+            params,
+        )
+        payments, cents = cursor.fetchone()
+
+    if player_name is not None and not players:
+        players.append(PaymentTotal(player_name, 0, from_cents(0)))
+    return PaymentTotals(command.season, players, payments, from_cents(cents))
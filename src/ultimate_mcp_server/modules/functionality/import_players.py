@@ -1,97 +1,279 @@
 import csv
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
-from ..data_types import ImportPlayersCommand, Player
+from ..data_types import ImportPlayersCommand
 from ..init_db import init_db
-from ..utils import get_connection
+from ..name_index import index_players_added, reset_name_index
+from ..session import Session, transaction
+from ..timestamps import to_timestamp
+from ..utils import normalize_name, save_phonetic_codes
 
-def import_players(command: ImportPlayersCommand) -> Tuple[List[Player], List[str]]:
+# Rows written per executemany call
+IMPORT_CHUNK_SIZE = 500
+# Error messages kept in the result; the rest are only counted
+MAX_IMPORT_ERRORS = 100
+
+NAME_HEADERS = ("name", "nombre")
+PHONE_HEADERS = ("phone", "telefono")
+EMAIL_HEADERS = ("email",)
+
+# Only touch existing rows whose contact details actually changed
+UPSERT_SQL = """
+    INSERT INTO players (name, normalized_name, created, phone, email) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET phone = excluded.phone, email = excluded.email
+    WHERE players.phone IS NOT excluded.phone OR players.email IS NOT excluded.email
+"""
+
+
+@dataclass
+class PlayerChange:
+    """A player the import inserts or updates (collected in diff mode)."""
+    name: str
+    action: str  # "insert" or "update"
+    phone: str
+    email: Optional[str] = None
+    old_phone: Optional[str] = None
+    old_email: Optional[str] = None
+
+    def describe(self) -> str:
+        """One-line description, e.g. "~ Ana: phone +1 -> +2"."""
+        if self.action == "insert":
+            email_display = f", Email: {self.email}" if self.email else ""
+            return f"+ {self.name} (Phone: {self.phone}{email_display})"
+        details = []
+        if self.phone != self.old_phone:
+            details.append(f"phone {self.old_phone} -> {self.phone}")
+        if self.email != self.old_email:
+            details.append(f"email {self.old_email or '-'} -> {self.email or '-'}")
+        return f"~ {self.name}: {', '.join(details)}"
+
+
+@dataclass
+class ImportPlayersResult:
+    """Counts of what an import did, plus the problems it found."""
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    errors: List[str] = field(default_factory=list)
+    dry_run: bool = False
+    # Only filled in diff mode
+    changes: List[PlayerChange] = field(default_factory=list)
+
+    @property
+    def imported(self) -> int:
+        """Rows that were inserted or updated."""
+        return self.inserted + self.updated
+
+    def add_error(self, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_IMPORT_ERRORS:
+            self.errors.append(message)
+
+
+@dataclass(frozen=True)
+class _ColumnMap:
+    """Positions of the recognized columns in the CSV header."""
+    header: Sequence[str]
+    name: int
+    phone: int
+    email: Optional[int]
+
+
+def _find_column(header: Sequence[str], aliases: Tuple[str, ...]) -> Optional[int]:
+    return next(
+        (i for i, column in enumerate(header) if column.strip().lower() in aliases), None
+    )
+
+
+def _resolve_columns(header: Sequence[str]) -> _ColumnMap:
+    """Map the CSV header to column positions (case-insensitive, English or Spanish).
+
+    Raises:
+        ValueError: If the name or phone column is missing
+    """
+    name = _find_column(header, NAME_HEADERS)
+    phone = _find_column(header, PHONE_HEADERS)
+    if name is None or phone is None:
+        raise ValueError(
+            f"CSV header must include name/nombre and phone/telefono columns: {list(header)}"
+        )
+    return _ColumnMap(header, name, phone, _find_column(header, EMAIL_HEADERS))
+
+
+def _cell(row: Sequence[str], index: Optional[int]) -> str:
+    if index is None or index >= len(row):
+        return ""
+    return row[index].strip()
+
+
+def _parse_rows(
+    reader, columns: _ColumnMap, result: ImportPlayersResult
+) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """Yield (name, phone, email) for each valid CSV row, recording the invalid ones."""
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        name = _cell(row, columns.name)
+        phone = _cell(row, columns.phone)
+        # Empty emails are stored as NULL
+        email = _cell(row, columns.email) or None
+        if not name or not phone:
+            result.add_error(
+                f"Line {reader.line_num}: row has empty name or phone: "
+                f"{dict(zip(columns.header, row))}"
+            )
+            continue
+        yield name, phone, email
+
+
+def _chunks(rows: Iterator, size: int) -> Iterator[List]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _upsert_chunk(
+    cursor,
+    chunk: List[Tuple[str, str, Optional[str]]],
+    result: ImportPlayersResult,
+    collect_changes: bool = False,
+    dry_run_state: Optional[Dict[str, Tuple[str, str, Optional[str]]]] = None,
+) -> List[str]:
+    """Write one chunk with a single lookup query and a single executemany.
+
+    Rows are matched to players by normalized name (see normalize_name), so
+    "Jose Nunez" in the file updates the stored "José Núñez" instead of
+    clashing with it. New players keep the spelling of their first row.
+
+    In a dry run nothing is written; ``dry_run_state`` remembers the name,
+    phone and email the import would have written for each normalized name,
+    so later chunks still compare against them.
+
+    Returns:
+        The names of the players the chunk inserted
+    """
+    rows = [(normalize_name(name), name, phone, email) for name, phone, email in chunk]
+    keys = list({key for key, _, _, _ in rows})
+    placeholders = ", ".join("?" * len(keys))
+    cursor.execute(
+        "SELECT normalized_name, name, phone, email FROM players "
+        f"WHERE normalized_name IN ({placeholders})",
+        keys,
+    )
+    stored: Dict[str, Tuple[str, str, Optional[str]]] = {
+        key: (name, phone, email) for key, name, phone, email in cursor.fetchall()
+    }
+    if dry_run_state:
+        stored.update((key, dry_run_state[key]) for key in keys if key in dry_run_state)
+
+    now = to_timestamp(datetime.now())
+    pending = []
+    inserted = []
+    # Rows are classified in file order, so a name repeated in the file is
+    # compared with its previous occurrence
+    for key, name, phone, email in rows:
+        existing = stored.get(key)
+        if existing is not None and existing[1:] == (phone, email):
+            result.unchanged += 1
+            continue
+        if existing is None:
+            result.inserted += 1
+            inserted.append(name)
+            action = "insert"
+        else:
+            name = existing[0]
+            result.updated += 1
+            action = "update"
+        if collect_changes:
+            _, old_phone, old_email = existing or (name, None, None)
+            result.changes.append(
+                PlayerChange(name, action, phone, email, old_phone, old_email)
+            )
+        stored[key] = (name, phone, email)
+        pending.append((name, key, now, phone, email))
+
+    if dry_run_state is not None:
+        dry_run_state.update((key, stored[key]) for _, key, _, _, _ in pending)
+        return []
+    if pending:
+        cursor.executemany(UPSERT_SQL, pending)
+        save_phonetic_codes(cursor, inserted)
+    return inserted
+
+
+def import_players(
+    command: ImportPlayersCommand, session: Optional[Session] = None
+) -> ImportPlayersResult:
     """
     Import players from a CSV file, updating existing players if they already exist.
-    
-    Returns a tuple with:
-    - List of successfully imported/updated players
-    - List of error messages for failed imports
+
+    The header is resolved once and the file is streamed in chunks of
+    IMPORT_CHUNK_SIZE rows. Each chunk costs one lookup query and one
+    INSERT ... ON CONFLICT executemany, so memory use doesn't depend on the
+    size of the file. Imports that add more than a chunk of players reset
+    the name index (see name_index.py) instead of keeping their names.
+
+    Change detection compares each row's (phone, email) with the stored
+    values, fetched in bulk per chunk; only new or changed players are
+    written. With ``command.diff`` the result lists
+    those players, and with ``command.dry_run`` it lists them without
+    writing anything.
+
+    Args:
+        command: The command with the CSV path
+        session: Optional session to run in; committing is then left to
+            the session owner
+
+    Returns:
+        An ImportPlayersResult with inserted, updated and unchanged counts
+        and the rows that could not be imported
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        ValueError: If the CSV header lacks the name or phone column
     """
     init_db(command.db_uri)
-    
+
     csv_path = Path(command.csv_path)
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
-    
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    successful_imports = []
-    errors = []
-    
+
+    result = ImportPlayersResult(dry_run=command.dry_run)
+    collect_changes = command.diff or command.dry_run
+    dry_run_state: Optional[Dict[str, Tuple[str, str, Optional[str]]]] = (
+        {} if command.dry_run else None
+    )
+
     with open(csv_path, 'r', newline='') as file:
-        reader = csv.DictReader(file)
-        
-        for row in reader:
-            try:
-                # Normalize column names (case-insensitive, support for Spanish or English)
-                name_key = next((k for k in row.keys() if k.lower() in ['name', 'nombre']), None)
-                phone_key = next((k for k in row.keys() if k.lower() in ['phone', 'telefono']), None)
-                email_key = next((k for k in row.keys() if k.lower() in ['email']), None)
-                
-                if not name_key or not phone_key:
-                    errors.append(f"Row missing required fields (name and phone): {row}")
-                    continue
-                
-                name = row[name_key].strip()
-                phone = row[phone_key].strip()
-                
-                # Handle email - empty strings should be converted to None
-                email_value = row.get(email_key, '').strip() if email_key else ''
-                email = email_value if email_value else None
-                
-                if not name or not phone:
-                    errors.append(f"Row has empty name or phone: {row}")
-                    continue
-                
-                # Check if player already exists
-                cursor.execute(
-                    "SELECT name FROM players WHERE name = ?",
-                    (name,)
-                )
-                existing = cursor.fetchone()
-                
-                now = datetime.now()
-                
-                if existing:
-                    # Update existing player
-                    cursor.execute(
-                        "UPDATE players SET phone = ?, email = ? WHERE name = ?",
-                        (phone, email, name)
-                    )
-                    player = Player(
-                        name=name,
-                        phone=phone,
-                        email=email,
-                        created=now  # We don't have the actual creation time
-                    )
-                    successful_imports.append(player)
-                else:
-                    # Add new player
-                    cursor.execute(
-                        "INSERT INTO players (name, created, phone, email) VALUES (?, ?, ?, ?)",
-                        (name, now, phone, email)
-                    )
-                    player = Player(
-                        name=name,
-                        created=now,
-                        phone=phone,
-                        email=email
-                    )
-                    successful_imports.append(player)
-            
-            except Exception as e:
-                errors.append(f"Error processing row {row}: {str(e)}")
-    
-    conn.commit()
-    conn.close()
-    
-    return successful_imports, errors
\ No newline at end of file
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return result
+        columns = _resolve_columns(header)
+
+        with transaction(command.db_uri, session) as tx:
+            cursor = tx.cursor()
+            # Names to add to the name index once committed; past a chunk's
+            # worth they are dropped and the index is reloaded instead
+            inserted: Optional[List[str]] = []
+            for chunk in _chunks(_parse_rows(reader, columns, result), IMPORT_CHUNK_SIZE):
+                names = _upsert_chunk(cursor, chunk, result, collect_changes, dry_run_state)
+                if inserted is not None:
+                    inserted += names
+                    if len(inserted) > IMPORT_CHUNK_SIZE:
+                        inserted = None
+            if inserted is None:
+                tx.after_commit(lambda: reset_name_index(command.db_uri))
+            elif inserted:
+                tx.after_commit(lambda: index_players_added(command.db_uri, inserted))
+
+    return result
@@ -1,73 +1,94 @@
-from datetime import datetime
-from typing import List, Tuple
+from typing import Iterator, List, Tuple, Optional
 
 from ..data_types import ListFederationPaymentsCommand, FederationPayment, Player
-from ..utils import get_connection
+from ..session import Session, transaction
 from ..init_db import init_db
+from ..pagination import Keyset, sql_limit
+from ..records import PAYMENT_COLUMNS, PaymentRecord, fetch_player, iter_records
+from ..timestamps import to_timestamp
 
+# Newest payments first. idx_federation_payments_player_date ends with the
+# rowid, so (payment_date, created_at, id) pages are index range scans.
+PAYMENTS_PAGE = Keyset(
+    "federation payments",
+    3,
+    lambda payment: (
+        to_timestamp(payment.payment_date), to_timestamp(payment.created_at), payment.id
+    ),
+)
 
-def list_federation_payments(command: ListFederationPaymentsCommand) -> Tuple[Player, List[FederationPayment]]:
+
+def _payments(
+    cursor, player_name: str, command: ListFederationPaymentsCommand, row_factory
+) -> Iterator:
+    after = PAYMENTS_PAGE.decode(command.after) if command.after else ()
+    page_filter = "AND (fp.payment_date, fp.created_at, fp.id) < (?, ?, ?)" if after else ""
+    return iter_records(
+        cursor,
+        row_factory,
+        f"""
+        SELECT {PAYMENT_COLUMNS}
+        FROM federation_payments fp
+        JOIN players p ON p.id = fp.player_id
+        WHERE p.name = ? {page_filter}
+        ORDER BY fp.payment_date DESC, fp.created_at DESC, fp.id DESC
+        LIMIT ?
+        """,
+        (player_name, *after, sql_limit(command.limit))
+    )
+
+
+def iter_federation_payments(
+    command: ListFederationPaymentsCommand, session: Optional[Session] = None
+) -> Iterator[PaymentRecord]:
+    """Stream a player's federation payments, newest first, fetching rows in batches.
+
+    Holds a pooled connection (or the session's transaction) until the
+    iterator is exhausted or closed, so consume it promptly.
+
+    Args:
+        command: The command with player name, limit (None for every
+            payment) and the token of the previous page, if any
+        session: Optional session to run in; committing is then left to
+            the session owner
+
+    Yields:
+        PaymentRecord tuples
+
+    Raises:
+        ValueError: On the first iteration, if the player doesn't exist or
+            the page token is invalid
+    """
+    init_db(command.db_uri)
+
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        player = fetch_player(cursor, command.player_name)
+        yield from _payments(cursor, player.name, command, PaymentRecord.decode)
+
+
+def list_federation_payments(
+    command: ListFederationPaymentsCommand, session: Optional[Session] = None
+) -> Tuple[Player, List[FederationPayment]]:
     """List all federation payments for a player.
     
     Args:
-        command: The command with player name and limit
+        command: The command with player name, limit and the token of the
+            previous page (see PAYMENTS_PAGE.next_token), if any
+        session: Optional session to run in; committing is then left to
+            the session owner
         
     Returns:
         Tuple containing the player and a list of their federation payments
         
     Raises:
-        ValueError: If the player doesn't exist
+        ValueError: If the player doesn't exist or the page token is invalid
     """
     init_db(command.db_uri)
     
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        player = fetch_player(cursor, command.player_name)
+        payments = list(_payments(cursor, player.name, command, PaymentRecord.decode_model))
     
-    try:
-        # Get player details
-        cursor.execute(
-            "SELECT name, created, phone, email FROM players WHERE name = ?",
-            (command.player_name,)
-        )
-        player_data = cursor.fetchone()
-        if not player_data:
-            raise ValueError(f"Player '{command.player_name}' not found")
-        
-        # Create Player object
-        player = Player(
-            name=player_data[0],
-            created=datetime.fromisoformat(player_data[1]),
-            phone=player_data[2],
-            email=player_data[3]
-        )
-        
-        # Get federation payments for this player
-        cursor.execute(
-            """
-            SELECT id, player_name, payment_date, amount, notes, created_at
-            FROM federation_payments
-            WHERE player_name = ?
-            ORDER BY payment_date DESC, created_at DESC
-            LIMIT ?
-            """,
-            (command.player_name, command.limit)
-        )
-        payment_data = cursor.fetchall()
-        
-        # Create list of FederationPayment objects
-        payments = []
-        for row in payment_data:
-            payments.append(
-                FederationPayment(
-                    id=row[0],
-                    player_name=row[1],
-                    payment_date=datetime.fromisoformat(row[2]),
-                    amount=row[3],
-                    notes=row[4],
-                    created_at=datetime.fromisoformat(row[5])
-                )
-            )
-        
-        return player, payments
-    finally:
-        conn.close()
\ No newline at end of file
+    return player.to_model(), payments
@@ -1,74 +1,93 @@
-from datetime import datetime
-from typing import Tuple, List
+from typing import Iterator, Tuple, List, Optional
 
-from ..data_types import ListPlayerTournamentsCommand, Player, Tournament, SurfaceType
-from ..utils import get_connection
+from ..data_types import ListPlayerTournamentsCommand, Player, Tournament
+from ..session import Session, transaction
 from ..init_db import init_db
+from ..pagination import sql_limit
+from ..records import TournamentRecord, fetch_player, iter_records
+from .list_tournaments import TOURNAMENTS_PAGE
 
 
-def list_player_tournaments(command: ListPlayerTournamentsCommand) -> Tuple[Player, List[Tournament]]:
+def _tournaments(
+    cursor, player_name: str, command: ListPlayerTournamentsCommand, row_factory
+) -> Iterator:
+    after = TOURNAMENTS_PAGE.decode(command.after) if command.after else ()
+    page_filter = "AND (t.date, t.id) > (?, ?)" if after else ""
+    return iter_records(
+        cursor,
+        row_factory,
+        f"""
+        SELECT t.id, t.name, t.location, t.date, t.surface,
+               t.registration_deadline, t.created
+        FROM tournaments t
+        JOIN tournament_players tp ON t.id = tp.tournament_id
+        JOIN players p ON p.id = tp.player_id
+        WHERE p.name = ? {page_filter}
+        ORDER BY t.date, t.id
+        LIMIT ?
+        """,
+        (player_name, *after, sql_limit(command.limit))
+    )
+
+
+def iter_player_tournaments(
+    command: ListPlayerTournamentsCommand, session: Optional[Session] = None
+) -> Iterator[TournamentRecord]:
+    """Stream the tournaments a player is registered for, fetching rows in batches.
+
+    Holds a pooled connection (or the session's transaction) until the
+    iterator is exhausted or closed, so consume it promptly.
+
+    Args:
+        command: The command with player name, limit (None for every
+            tournament) and the token of the previous page, if any
+        session: Optional session to run in; committing is then left to
+            the session owner
+
+    Yields:
+        TournamentRecord tuples, by date then id
+
+    Raises:
+        ValueError: On the first iteration, if the player doesn't exist or
+            the page token is invalid
+    """
+    init_db(command.db_uri)
+
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        player = fetch_player(cursor, command.player_name)
+        yield from _tournaments(cursor, player.name, command, TournamentRecord.decode)
+
+
+def list_player_tournaments(
+    command: ListPlayerTournamentsCommand, session: Optional[Session] = None
+) -> Tuple[Player, List[Tournament]]:
     """List all tournaments a player is registered for.
     
+    Tournaments are listed by date, then id. The next page starts after
+    the last one (see TOURNAMENTS_PAGE.next_token); since a player has few
+    registrations, the page is sorted from their idx_tournament_players_player_id
+    entries.
+
     Args:
-        command: The command with player name and limit
+        command: The command with player name, limit and the token of the
+            previous page, if any
+        session: Optional session to run in; committing is then left to
+            the session owner
         
     Returns:
         Tuple containing the player and a list of tournaments they're registered for
         
     Raises:
-        ValueError: If the player doesn't exist
+        ValueError: If the player doesn't exist or the page token is invalid
     """
     init_db(command.db_uri)
     
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    try:
-        # Get player details
-        cursor.execute(
-            "SELECT name, created, phone, email FROM players WHERE name = ?",
-            (command.player_name,)
-        )
-        player_data = cursor.fetchone()
-        if not player_data:
-            raise ValueError(f"Player '{command.player_name}' not found")
-        
-        player = Player(
-            name=player_data[0],
-            created=datetime.fromisoformat(player_data[1]),
-            phone=player_data[2],
-            email=player_data[3]
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        player = fetch_player(cursor, command.player_name)
+        tournaments = list(
+            _tournaments(cursor, player.name, command, TournamentRecord.decode_model)
         )
-        
-        # Get tournaments this player is registered for
-        cursor.execute(
-            """
-            SELECT t.id, t.name, t.location, t.date, t.surface, 
-                   t.registration_deadline, t.created
-            FROM tournaments t
-            JOIN tournament_players tp ON t.id = tp.tournament_id
-            WHERE tp.player_name = ?
-            ORDER BY t.date
-            LIMIT ?
-            """,
-            (command.player_name, command.limit)
-        )
-        tournament_data = cursor.fetchall()
-        
-        tournaments = []
-        for row in tournament_data:
-            tournaments.append(
-                Tournament(
-                    id=row[0],
-                    name=row[1],
-                    location=row[2],
-                    date=datetime.fromisoformat(row[3]).date(),
-                    surface=SurfaceType(row[4]),
-                    registration_deadline=datetime.fromisoformat(row[5]).date(),
-                    created=datetime.fromisoformat(row[6])
-                )
-            )
-        
-        return player, tournaments
-    finally:
-        conn.close()
\ No newline at end of file
+    
+    return player.to_model(), tournaments
@@ -1,33 +1,87 @@
-from datetime import datetime
-from typing import List
+from typing import Iterator, List, Optional
 
 from ..data_types import ListPlayersCommand, Player
 from ..init_db import init_db
-from ..utils import get_connection
+from ..pagination import Keyset, sql_limit
+from ..records import PLAYER_COLUMNS, PlayerRecord, iter_records
+from ..session import Session, transaction
 
-def list_players(command: ListPlayersCommand) -> List[Player]:
-    init_db(command.db_uri)
-    
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        "SELECT name, created, phone, email FROM players LIMIT ?",
-        (command.limit,)
+# Players are listed by name, the primary key
+PLAYERS_PAGE = Keyset("players", 1, lambda player: (player.name,))
+
+
+def _players(cursor, command: ListPlayersCommand, row_factory) -> Iterator:
+    after = PLAYERS_PAGE.decode(command.after) if command.after else ()
+    page_filter = "WHERE name > ?" if after else ""
+    return iter_records(
+        cursor,
+        row_factory,
+        f"SELECT {PLAYER_COLUMNS} FROM players {page_filter} ORDER BY name LIMIT ?",
+        (*after, sql_limit(command.limit))
     )
-    
-    results = cursor.fetchall()
-    conn.close()
-    
-    players = []
-    for row in results:
-        players.append(
-            Player(
-                name=row[0],
-                created=datetime.fromisoformat(row[1]),
-                phone=row[2],
-                email=row[3]
-            )
-        )
-    
-    return players
\ No newline at end of file
+
+
+def iter_players(
+    command: ListPlayersCommand, session: Optional[Session] = None
+) -> Iterator[PlayerRecord]:
+    """Stream players by name, fetching rows in batches.
+
+    Holds a pooled connection (or the session's transaction) until the
+    iterator is exhausted or closed, so consume it promptly.
+
+    Args:
+        command: The command with the page size (None for every player)
+            and the token of the previous page (see PLAYERS_PAGE.next_token),
+            if any
+        session: Optional session to run in; committing is then left to
+            the session owner
+
+    Yields:
+        PlayerRecord tuples
+
+    Raises:
+        ValueError: If the page token is invalid
+    """
+    init_db(command.db_uri)
+
+    with transaction(command.db_uri, session) as tx:
+        yield from _players(tx.cursor(), command, PlayerRecord.decode)
+
+
+def list_players(command: ListPlayersCommand, session: Optional[Session] = None) -> List[Player]:
+    """List players by name, one page at a time.
+
+    Args:
+        command: The command with the page size and the token of the
+            previous page (see PLAYERS_PAGE.next_token), if any
+        session: Optional session to run in; committing is then left to
+            the session owner
+
+    Returns:
+        Up to ``command.limit`` players
+
+    Raises:
+        ValueError: If the page token is invalid
+    """
+    init_db(command.db_uri)
+
+    with transaction(command.db_uri, session) as tx:
+        return list(_players(tx.cursor(), command, PlayerRecord.decode_model))
+
+
+def list_player_records(
+    command: ListPlayersCommand, session: Optional[Session] = None
+) -> List[PlayerRecord]:
+    """Like list_players, but keeps the rows as records.
+
+    For callers that only read the listing, e.g. to print it: records take
+    a fraction of the memory of the models, and ``to_model()`` converts one
+    when a model is needed.
+
+    Raises:
+        ValueError: If the page token is invalid
+    """
+    init_db(command.db_uri)
+
+    with transaction(command.db_uri, session) as tx:
+        return list(_players(tx.cursor(), command, PlayerRecord.decode))
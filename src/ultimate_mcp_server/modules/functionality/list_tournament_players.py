@@ -1,94 +1,141 @@
 from datetime import datetime
-from typing import List, Tuple, Dict
+from typing import Iterator, List, Tuple, Optional
 from dataclasses import dataclass
 
 from ..data_types import ListTournamentPlayersCommand, Player, Tournament
-from ..utils import get_connection
+from ..session import Session, transaction
 from ..init_db import init_db
+from ..pagination import Keyset, sql_limit
+from ..records import (
+    REGISTRATION_COLUMNS,
+    PlayerRecord,
+    RegistrationRecord,
+    TournamentRecord,
+    iter_records,
+)
+from ..timestamps import from_timestamp
+from ..tournament_cache import cached_tournament
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlayerWithPayment:
     player: Player
     has_paid: bool
-    payment_date: datetime = None
+    payment_date: Optional[datetime] = None
+    player_id: Optional[int] = None
 
 
-def list_tournament_players(command: ListTournamentPlayersCommand) -> Tuple[Tournament, List[PlayerWithPayment]]:
+# Registrations are listed by player name, with the player id breaking ties
+# in the key, in the order of idx_tournament_players_sort_name (see
+# m0009_registration_name_order): each page reads one range of it and
+# looks its players up by id.
+REGISTRATIONS_PAGE = Keyset(
+    "registrations", 2, lambda registration: (registration.player.name, registration.player_id)
+)
+
+
+def _decode_player_with_payment(cursor, row) -> PlayerWithPayment:
+    """Row factory for REGISTRATION_COLUMNS that builds the models directly."""
+    return PlayerWithPayment(
+        player=PlayerRecord.decode_model(cursor, row),
+        has_paid=bool(row[4]),
+        payment_date=from_timestamp(row[5]) if row[5] is not None else None,
+        player_id=row[6],
+    )
+
+
+def _registrations(cursor, command: ListTournamentPlayersCommand, row_factory) -> Iterator:
+    after = REGISTRATIONS_PAGE.decode(command.after) if command.after else ()
+    page_filter = "AND (tp.sort_name, tp.player_id) > (?, ?)" if after else ""
+    return iter_records(
+        cursor,
+        row_factory,
+        f"""
+        SELECT {REGISTRATION_COLUMNS}
+        FROM tournament_players tp
+        JOIN players p ON p.id = tp.player_id
+        WHERE tp.tournament_id = ? {page_filter}
+        ORDER BY tp.sort_name, tp.player_id
+        LIMIT ?
+        """,
+        (command.tournament_id, *after, sql_limit(command.limit))
+    )
+
+
+def iter_tournament_players(
+    command: ListTournamentPlayersCommand, session: Optional[Session] = None
+) -> Iterator[RegistrationRecord]:
+    """Stream the players registered for a tournament, fetching rows in batches.
+
+    Holds a pooled connection (or the session's transaction) until the
+    iterator is exhausted or closed, so consume it promptly.
+
+    Args:
+        command: The command with tournament ID, limit (None for every
+            player) and the token of the previous page, if any
+        session: Optional session to run in; committing is then left to
+            the session owner
+
+    Yields:
+        RegistrationRecord tuples
+
+    Raises:
+        ValueError: On the first iteration, if the tournament doesn't exist
+            or the page token is invalid
+    """
+    init_db(command.db_uri)
+
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        cached_tournament(tx, command.tournament_id)
+        yield from _registrations(cursor, command, RegistrationRecord.decode)
+
+
+def list_tournament_players(
+    command: ListTournamentPlayersCommand, session: Optional[Session] = None
+) -> Tuple[Tournament, List[PlayerWithPayment]]:
     """List all players registered for a tournament with payment status.
     
     Args:
-        command: The command with tournament ID and limit
+        command: The command with tournament ID, limit and the token of the
+            previous page (see REGISTRATIONS_PAGE.next_token), if any
+        session: Optional session to run in; committing is then left to
+            the session owner
         
     Returns:
         Tuple containing the tournament and a list of registered players with payment info
         
     Raises:
-        ValueError: If the tournament doesn't exist
+        ValueError: If the tournament doesn't exist or the page token is invalid
     """
     init_db(command.db_uri)
     
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    try:
-        # Get tournament details
-        cursor.execute(
-            """
-            SELECT id, name, location, date, surface, registration_deadline, created 
-            FROM tournaments WHERE id = ?
-            """,
-            (command.tournament_id,)
-        )
-        tournament_data = cursor.fetchone()
-        if not tournament_data:
-            raise ValueError(f"Tournament with ID {command.tournament_id} not found")
-        
-        from ..data_types import SurfaceType, Tournament
-        tournament = Tournament(
-            id=tournament_data[0],
-            name=tournament_data[1],
-            location=tournament_data[2],
-            date=datetime.fromisoformat(tournament_data[3]).date(),
-            surface=SurfaceType(tournament_data[4]),
-            registration_deadline=datetime.fromisoformat(tournament_data[5]).date(),
-            created=datetime.fromisoformat(tournament_data[6])
-        )
-        
-        # Get players registered for this tournament, along with payment info
-        cursor.execute(
-            """
-            SELECT p.name, p.created, p.phone, p.email, tp.has_paid, tp.payment_date
-            FROM players p
-            JOIN tournament_players tp ON p.name = tp.player_name
-            WHERE tp.tournament_id = ?
-            ORDER BY p.name
-            LIMIT ?
-            """,
-            (command.tournament_id, command.limit)
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        tournament = cached_tournament(tx, command.tournament_id).to_model()
+        players_with_payment = list(
+            _registrations(cursor, command, _decode_player_with_payment)
         )
-        player_data = cursor.fetchall()
-        
-        players_with_payment = []
-        for row in player_data:
-            player = Player(
-                name=row[0],
-                created=datetime.fromisoformat(row[1]),
-                phone=row[2],
-                email=row[3]
-            )
-            
-            has_paid = bool(row[4])
-            payment_date = datetime.fromisoformat(row[5]) if row[5] else None
-            
-            players_with_payment.append(
-                PlayerWithPayment(
-                    player=player,
-                    has_paid=has_paid,
-                    payment_date=payment_date
-                )
-            )
-        
-        return tournament, players_with_payment
-    finally:
-        conn.close()
\ No newline at end of file
+    
+    return tournament, players_with_payment
+
+
+def list_tournament_player_records(
+    command: ListTournamentPlayersCommand, session: Optional[Session] = None
+) -> Tuple[TournamentRecord, List[RegistrationRecord]]:
+    """Like list_tournament_players, but keeps the rows as records.
+
+    For callers that only read the listing, e.g. to print it: records take
+    a fraction of the memory of the models (see
+    benchmarks/bench_memory.py), and ``player.to_model()`` converts one
+    when a model is needed.
+
+    Raises:
+        ValueError: If the tournament doesn't exist or the page token is invalid
+    """
+    init_db(command.db_uri)
+
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        tournament = cached_tournament(tx, command.tournament_id)
+        return tournament, list(_registrations(cursor, command, RegistrationRecord.decode))
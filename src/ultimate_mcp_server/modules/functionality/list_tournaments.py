@@ -1,50 +1,79 @@
-from datetime import datetime, date
-from typing import List
+from typing import Iterator, List, Optional
 
-from ..data_types import ListTournamentsCommand, Tournament, SurfaceType
+from ..data_types import ListTournamentsCommand, Tournament
 from ..init_db import init_db
-from ..utils import get_connection
+from ..pagination import Keyset, sql_limit
+from ..records import TOURNAMENT_COLUMNS, TournamentRecord, iter_records
+from ..session import Session, transaction
+from ..timestamps import to_day
 
+# Tournaments are listed by date, then id: idx_tournaments_date ends with the rowid
+TOURNAMENTS_PAGE = Keyset(
+    "tournaments", 2, lambda tournament: (to_day(tournament.date), tournament.id)
+)
 
-def list_tournaments(command: ListTournamentsCommand) -> List[Tournament]:
+
+def _tournaments(cursor, command: ListTournamentsCommand, row_factory) -> Iterator:
+    after = TOURNAMENTS_PAGE.decode(command.after) if command.after else ()
+    page_filter = "WHERE (date, id) > (?, ?)" if after else ""
+    return iter_records(
+        cursor,
+        row_factory,
+        f"""
+        SELECT {TOURNAMENT_COLUMNS}
+        FROM tournaments
+        {page_filter}
+        ORDER BY date, id
+        LIMIT ?
+        """,
+        (*after, sql_limit(command.limit))
+    )
+
+
+def iter_tournaments(
+    command: ListTournamentsCommand, session: Optional[Session] = None
+) -> Iterator[TournamentRecord]:
+    """Stream tournaments by date, fetching rows in batches.
+
+    Holds a pooled connection (or the session's transaction) until the
+    iterator is exhausted or closed, so consume it promptly.
+
+    Args:
+        command: The command with listing parameters, including the token
+            of the previous page (see TOURNAMENTS_PAGE.next_token), if any
+        session: Optional session to run in; committing is then left to
+            the session owner
+
+    Yields:
+        TournamentRecord tuples
+
+    Raises:
+        ValueError: If the page token is invalid
+    """
+    init_db(command.db_uri)
+
+    with transaction(command.db_uri, session) as tx:
+        yield from _tournaments(tx.cursor(), command, TournamentRecord.decode)
+
+
+def list_tournaments(
+    command: ListTournamentsCommand, session: Optional[Session] = None
+) -> List[Tournament]:
     """List tournaments from the database.
 
     Args:
-        command: The command with listing parameters
+        command: The command with listing parameters, including the token
+            of the previous page (see TOURNAMENTS_PAGE.next_token), if any
+        session: Optional session to run in; committing is then left to
+            the session owner
 
     Returns:
         List of Tournament objects sorted by date
+
+    Raises:
+        ValueError: If the page token is invalid
     """
     init_db(command.db_uri)
-    
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        """
-        SELECT id, name, location, date, surface, registration_deadline, created 
-        FROM tournaments 
-        ORDER BY date ASC
-        LIMIT ?
-        """,
-        (command.limit,)
-    )
-    
-    results = cursor.fetchall()
-    conn.close()
-    
-    tournaments = []
-    for row in results:
-        tournaments.append(
-            Tournament(
-                id=row[0],
-                name=row[1],
-                location=row[2],
-                date=date.fromisoformat(row[3]),
-                surface=SurfaceType(row[4]),
-                registration_deadline=date.fromisoformat(row[5]),
-                created=datetime.fromisoformat(row[6]),
-            )
-        )
-    
-    return tournaments
\ No newline at end of file
+
+    with transaction(command.db_uri, session) as tx:
+        return list(_tournaments(tx.cursor(), command, TournamentRecord.decode_model))
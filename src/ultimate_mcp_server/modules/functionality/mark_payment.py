@@ -1,15 +1,22 @@
 from datetime import datetime
+from typing import Optional
 
 from ..data_types import MarkPaymentCommand, TournamentPlayer
-from ..utils import get_connection
+from ..session import Session, transaction
 from ..init_db import init_db
+from ..timestamps import from_timestamp, to_timestamp
+from ..utils import normalize_name
 
 
-def mark_payment(command: MarkPaymentCommand) -> TournamentPlayer:
+def mark_payment(
+    command: MarkPaymentCommand, session: Optional[Session] = None
+) -> TournamentPlayer:
     """Mark a player's tournament registration as paid.
     
     Args:
         command: The command with tournament and player details
+        session: Optional session to run in; committing is then left to
+            the session owner
         
     Returns:
         Updated TournamentPlayer record
@@ -19,24 +26,25 @@ def mark_payment(command: MarkPaymentCommand) -> TournamentPlayer:
     """
     init_db(command.db_uri)
     
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    try:
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        
         # Check if player is registered for this tournament
         cursor.execute(
             """
-            SELECT tournament_id, player_name, registered_at, has_paid, payment_date
-            FROM tournament_players 
-            WHERE tournament_id = ? AND player_name = ?
+            SELECT tp.player_id, p.name, tp.registered_at, tp.has_paid, tp.payment_date
+            FROM tournament_players tp
+            JOIN players p ON p.id = tp.player_id
+            WHERE tp.tournament_id = ? AND p.normalized_name = ?
             """,
-            (command.tournament_id, command.player_name)
+            (command.tournament_id, normalize_name(command.player_name))
         )
         registration = cursor.fetchone()
         if not registration:
             raise ValueError(
                 f"Player '{command.player_name}' is not registered for tournament {command.tournament_id}"
             )
+        player_id, player_name = registration[:2]
         
         # Set payment date to now if not specified
         payment_date = command.payment_date if command.payment_date else datetime.now()
@@ -46,33 +54,16 @@ def mark_payment(command: MarkPaymentCommand) -> TournamentPlayer:
             """
             UPDATE tournament_players
             SET has_paid = 1, payment_date = ?
-            WHERE tournament_id = ? AND player_name = ?
-            """,
-            (payment_date, command.tournament_id, command.player_name)
-        )
-        conn.commit()
-        
-        # Get tournament and player details for response
-        cursor.execute(
-            """
-            SELECT t.name, p.name, p.phone, p.email
-            FROM tournaments t, players p
-            WHERE t.id = ? AND p.name = ?
+            WHERE tournament_id = ? AND player_id = ?
             """,
-            (command.tournament_id, command.player_name)
+            (to_timestamp(payment_date), command.tournament_id, player_id)
         )
-        details = cursor.fetchone()
         
-        # Return updated registration
-        return TournamentPlayer(
-            tournament_id=command.tournament_id,
-            player_name=command.player_name,
-            registered_at=datetime.fromisoformat(registration[2]),
-            has_paid=True,
-            payment_date=payment_date
-        )
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
\ No newline at end of file
+    # Return updated registration
+    return TournamentPlayer.model_construct(
+        tournament_id=command.tournament_id,
+        player_name=player_name,
+        registered_at=from_timestamp(registration[2]),
+        has_paid=True,
+        payment_date=payment_date
+    )
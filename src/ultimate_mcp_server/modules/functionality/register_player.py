@@ -1,15 +1,23 @@
 from datetime import datetime
+from typing import Optional
 
 from ..data_types import RegisterPlayerCommand, TournamentPlayer
-from ..utils import get_connection
+from ..session import Session, transaction
 from ..init_db import init_db
+from ..timestamps import to_timestamp
+from ..tournament_cache import cached_tournament
+from ..utils import find_player
 
 
-def register_player(command: RegisterPlayerCommand) -> TournamentPlayer:
+def register_player(
+    command: RegisterPlayerCommand, session: Optional[Session] = None
+) -> TournamentPlayer:
     """Register a player for a tournament.
     
     Args:
         command: The command with player and tournament details
+        session: Optional session to run in; committing is then left to
+            the session owner
         
     Returns:
         A TournamentPlayer object representing the registration
@@ -21,40 +29,30 @@ def register_player(command: RegisterPlayerCommand) -> TournamentPlayer:
     """
     init_db(command.db_uri)
     
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    try:
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        
         # Check if tournament exists
-        cursor.execute(
-            "SELECT id, registration_deadline FROM tournaments WHERE id = ?", 
-            (command.tournament_id,)
-        )
-        tournament = cursor.fetchone()
-        if not tournament:
-            raise ValueError(f"Tournament with ID {command.tournament_id} not found")
+        tournament = cached_tournament(tx, command.tournament_id)
         
         # Check if registration deadline has passed
-        deadline = datetime.fromisoformat(tournament[1]).date()
+        deadline = tournament.registration_deadline
         if deadline < datetime.now().date():
             raise ValueError(f"Registration deadline ({deadline}) has passed")
         
         # Check if player exists
-        cursor.execute(
-            "SELECT name FROM players WHERE name = ?", 
-            (command.player_name,)
-        )
-        player = cursor.fetchone()
-        if not player:
+        player = find_player(cursor, command.player_name)
+        if player is None:
             raise ValueError(f"Player '{command.player_name}' not found")
+        player_id, player_name = player
         
         # Check if player is already registered
         cursor.execute(
             """
-            SELECT tournament_id, player_name FROM tournament_players 
-            WHERE tournament_id = ? AND player_name = ?
+            SELECT tournament_id, player_id FROM tournament_players 
+            WHERE tournament_id = ? AND player_id = ?
             """, 
-            (command.tournament_id, command.player_name)
+            (command.tournament_id, player_id)
         )
         existing = cursor.fetchone()
         if existing:
@@ -67,22 +65,16 @@ def register_player(command: RegisterPlayerCommand) -> TournamentPlayer:
         cursor.execute(
             """
             INSERT INTO tournament_players 
-            (tournament_id, player_name, registered_at, has_paid, payment_date)
-            VALUES (?, ?, ?, 0, NULL)
+            (tournament_id, player_id, sort_name, registered_at, has_paid, payment_date)
+            VALUES (?, ?, ?, ?, 0, NULL)
             """, 
-            (command.tournament_id, command.player_name, now)
+            (command.tournament_id, player_id, player_name, to_timestamp(now))
         )
-        conn.commit()
         
-        return TournamentPlayer(
-            tournament_id=command.tournament_id,
-            player_name=command.player_name,
-            registered_at=now,
-            has_paid=False,
-            payment_date=None
-        )
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
\ No newline at end of file
+    return TournamentPlayer.model_construct(
+        tournament_id=command.tournament_id,
+        player_name=player_name,
+        registered_at=now,
+        has_paid=False,
+        payment_date=None
+    )
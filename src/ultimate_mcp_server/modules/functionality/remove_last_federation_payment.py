@@ -1,16 +1,21 @@
-from datetime import datetime
 from typing import Optional
 
 from ..data_types import RemoveLastFederationPaymentCommand, FederationPayment
-from ..utils import get_connection
+from ..session import Session, transaction
 from ..init_db import init_db
+from ..records import PAYMENT_COLUMNS, PaymentRecord, select
+from ..utils import find_player
 
 
-def remove_last_federation_payment(command: RemoveLastFederationPaymentCommand) -> Optional[FederationPayment]:
+def remove_last_federation_payment(
+    command: RemoveLastFederationPaymentCommand, session: Optional[Session] = None
+) -> Optional[FederationPayment]:
     """Remove the most recent federation payment for a player.
     
     Args:
         command: The command with player name
+        session: Optional session to run in; committing is then left to
+            the session owner
         
     Returns:
         The removed federation payment or None if no payments exist
@@ -20,56 +25,37 @@ def remove_last_federation_payment(command: RemoveLastFederationPaymentCommand)
     """
     init_db(command.db_uri)
     
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    try:
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        
         # Check if player exists
-        cursor.execute(
-            "SELECT name FROM players WHERE name = ?", 
-            (command.player_name,)
-        )
-        player = cursor.fetchone()
-        if not player:
+        player = find_player(cursor, command.player_name)
+        if player is None:
             raise ValueError(f"Player '{command.player_name}' not found")
         
         # Find the latest payment for this player
-        cursor.execute(
-            """
-            SELECT id, player_name, payment_date, amount, notes, created_at 
-            FROM federation_payments 
-            WHERE player_name = ?
-            ORDER BY payment_date DESC, created_at DESC
+        payment = select(
+            cursor,
+            PaymentRecord.decode,
+            f"""
+            SELECT {PAYMENT_COLUMNS}
+            FROM federation_payments fp
+            JOIN players p ON p.id = fp.player_id
+            WHERE fp.player_id = ?
+            ORDER BY fp.payment_date DESC, fp.created_at DESC
             LIMIT 1
             """, 
-            (command.player_name,)
-        )
-        payment = cursor.fetchone()
+            (player[0],)
+        ).fetchone()
         
         # If no payments found, return None
         if not payment:
             return None
         
-        # Save payment details for return
-        removed_payment = FederationPayment(
-            id=payment[0],
-            player_name=payment[1],
-            payment_date=datetime.fromisoformat(payment[2]),
-            amount=payment[3],
-            notes=payment[4],
-            created_at=datetime.fromisoformat(payment[5])
-        )
-        
         # Delete the payment
         cursor.execute(
             "DELETE FROM federation_payments WHERE id = ?", 
-            (payment[0],)
+            (payment.id,)
         )
-        conn.commit()
         
-        return removed_payment
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
\ No newline at end of file
+    return payment.to_model()
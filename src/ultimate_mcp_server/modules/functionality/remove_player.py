@@ -1,23 +1,23 @@
+from typing import Optional
 from ..data_types import RemovePlayerCommand
 from ..init_db import init_db
-from ..utils import get_connection
+from ..name_index import index_players_removed
+from ..session import Session, transaction
+from ..utils import find_player
 
-def remove_player(command: RemovePlayerCommand) -> bool:
+def remove_player(command: RemovePlayerCommand, session: Optional[Session] = None) -> bool:
     init_db(command.db_uri)
     
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        "DELETE FROM players WHERE name = ?",
-        (command.name,)
-    )
-    
-    found = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        player = find_player(cursor, command.name)
+        found = player is not None
+        if found:
+            player_id, name = player
+            cursor.execute("DELETE FROM players WHERE id = ?", (player_id,))
+            tx.after_commit(lambda: index_players_removed(command.db_uri, [name]))
     
     if not found:
         raise ValueError(f"Player '{command.name}' not found")
     
-    return True
\ No newline at end of file
+    return True
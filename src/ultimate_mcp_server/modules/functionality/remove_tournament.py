@@ -1,13 +1,17 @@
+from typing import Optional
 from ..data_types import RemoveTournamentCommand
 from ..init_db import init_db
-from ..utils import get_connection
+from ..session import Session, transaction
+from ..tournament_cache import tournaments_changed
 
 
-def remove_tournament(command: RemoveTournamentCommand) -> str:
+def remove_tournament(command: RemoveTournamentCommand, session: Optional[Session] = None) -> str:
     """Remove a tournament from the database.
 
     Args:
         command: The command containing the tournament ID to remove
+        session: Optional session to run in; committing is then left to
+            the session owner
 
     Returns:
         Success message
@@ -17,25 +21,18 @@ def remove_tournament(command: RemoveTournamentCommand) -> str:
     """
     init_db(command.db_uri)
     
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    # First check if the tournament exists
-    cursor.execute("SELECT name FROM tournaments WHERE id = ?", (command.id,))
-    result = cursor.fetchone()
-    if not result:
-        conn.close()
-        raise ValueError(f"Tournament with ID {command.id} not found")
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        
+        # First check if the tournament exists
+        cursor.execute("SELECT name FROM tournaments WHERE id = ?", (command.id,))
+        result = cursor.fetchone()
+        if not result:
+            raise ValueError(f"Tournament with ID {command.id} not found")
+            
+        tournament_name = result[0]
         
-    tournament_name = result[0]
-    
-    try:
         cursor.execute("DELETE FROM tournaments WHERE id = ?", (command.id,))
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
+        tournaments_changed(tx)
     
-    return f"Tournament '{tournament_name}' removed successfully"
\ No newline at end of file
+    return f"Tournament '{tournament_name}' removed successfully"
@@ -0,0 +1,136 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from ..data_types import BATCH_COMMANDS, BatchCommand, BatchMode, BatchOperation
+from ..init_db import init_db
+from ..session import Session, transaction
+from .add_federation_payment import add_federation_payment
+from .add_player import add_player
+from .add_tournament import add_tournament
+from .clear_payment import clear_payment
+from .mark_payment import mark_payment
+from .register_player import register_player
+from .remove_last_federation_payment import remove_last_federation_payment
+from .remove_player import remove_player
+from .remove_tournament import remove_tournament
+from .unregister_player import unregister_player
+from .update_tournament import update_tournament
+
+
+def _describe_payment(payment) -> str:
+    if payment is None:
+        return "no payments"
+    return f"payment {payment.id} ({payment.amount:.2f})"
+
+
+# What each batch operation runs (see BATCH_COMMANDS for its command model):
+# (functionality function, short description of the result)
+BATCH_OPERATIONS: Dict[str, Tuple[Callable, Callable[[Any], str]]] = {
+    "add-player": (add_player, lambda p: p.name),
+    "remove-player": (remove_player, lambda _: "removed"),
+    "add-tournament": (add_tournament, lambda t: f"tournament {t.id}"),
+    "update-tournament": (update_tournament, lambda t: f"tournament {t.id}"),
+    "remove-tournament": (remove_tournament, lambda _: "removed"),
+    "register-player": (
+        register_player,
+        lambda r: f"{r.player_name} -> tournament {r.tournament_id}",
+    ),
+    "unregister-player": (unregister_player, lambda _: "unregistered"),
+    "mark-payment": (mark_payment, lambda r: f"{r.player_name} paid"),
+    "clear-payment": (clear_payment, lambda r: f"{r.player_name} unpaid"),
+    "add-federation-payment": (add_federation_payment, _describe_payment),
+    "remove-last-federation-payment": (remove_last_federation_payment, _describe_payment),
+}
+
+
+@dataclass
+class BatchOperationResult:
+    """Outcome of one operation of a batch."""
+    index: int
+    op: str
+    status: str  # "ok", "error" or "skipped"
+    detail: str = ""
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a batch."""
+    mode: BatchMode
+    committed: bool
+    results: List[BatchOperationResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.status == "ok")
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if r.status == "error")
+
+
+def _build_command(
+    operation: BatchOperation, db_uri: str
+) -> Tuple[BaseModel, Callable, Callable]:
+    """Turn a validated batch operation into its command, running on the batch's database."""
+    func, describe = BATCH_OPERATIONS[operation.op]
+    command = BATCH_COMMANDS[operation.op](**operation.args.model_dump(), db_uri=db_uri)
+    return command, func, describe
+
+
+class _BatchAborted(Exception):
+    """Raised inside the batch transaction to roll back an atomic batch."""
+
+
+def run_batch(command: BatchCommand, session: Optional[Session] = None) -> BatchResult:
+    """Run several write operations in a single transaction.
+
+    In atomic mode the first failing operation rolls back the whole batch and
+    the remaining operations are skipped. In continue mode every operation
+    runs in its own savepoint: failures are reported and the successful
+    operations are committed together at the end.
+
+    Args:
+        command: The command with the operations and the batch mode
+        session: Optional session to run in; committing is then left to
+            the session owner
+
+    Returns:
+        A BatchResult with one entry per operation, in order
+    """
+    init_db(command.db_uri)
+
+    result = BatchResult(mode=command.mode, committed=False)
+
+    try:
+        with transaction(command.db_uri, session, immediate=True) as tx:
+            for index, operation in enumerate(command.operations, start=1):
+                try:
+                    op_command, func, describe = _build_command(operation, command.db_uri)
+                    detail = describe(func(op_command, session=tx))
+                except Exception as e:
+                    result.results.append(
+                        BatchOperationResult(
+                            index=index, op=operation.op, status="error", detail=str(e)
+                        )
+                    )
+                    if command.mode == BatchMode.ATOMIC:
+                        raise _BatchAborted()
+                    continue
+                result.results.append(
+                    BatchOperationResult(
+                        index=index, op=operation.op, status="ok", detail=detail
+                    )
+                )
+    except _BatchAborted:
+        result.results.extend(
+            BatchOperationResult(index=index, op=operation.op, status="skipped")
+            for index, operation in enumerate(command.operations, start=1)
+            if index > len(result.results)
+        )
+        return result
+
+    # Inside a caller's session the batch is only committed with the session
+    result.committed = session is None
+    return result
@@ -1,13 +1,18 @@
 from datetime import datetime
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 from dataclasses import dataclass
 
-from ..data_types import SearchPaidPlayersCommand, Player, Tournament, SurfaceType
-from ..utils import get_connection, fuzzy_match_score
+from ..data_types import SearchPaidPlayersCommand, Player, Tournament
+from ..session import Session, transaction
+from ..parallel import parallel_top_matches
+from ..records import PlayerRecord
+from ..timestamps import from_timestamp
+from ..tournament_cache import cached_tournament
+from ..utils import match_candidates, normalize_name
 from ..init_db import init_db
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlayerPaymentInfo:
     """Class to hold player and payment information."""
     player: Player
@@ -15,13 +20,63 @@ class PlayerPaymentInfo:
     match_score: float = 1.0  # Default is perfect match
 
 
-def search_paid_players(command: SearchPaidPlayersCommand) -> Tuple[Tournament, List[PlayerPaymentInfo]]:
+PAID_PLAYERS_SQL = """
+    SELECT p.name, p.created, p.phone, p.email, tp.payment_date
+    FROM players p
+    JOIN tournament_players tp ON p.id = tp.player_id
+    WHERE tp.tournament_id = ? AND tp.has_paid = 1
+"""
+
+
+def _payment_info(row, match_score: float = 1.0) -> PlayerPaymentInfo:
+    # Candidate rows stay as text: only the selected ones are decoded
+    player = PlayerRecord(row[0], row[2], row[3], from_timestamp(row[1]))
+    return PlayerPaymentInfo(
+        player=player.to_model(),
+        payment_date=from_timestamp(row[4]),
+        match_score=match_score
+    )
+
+
+def _best_matches(
+    command: SearchPaidPlayersCommand, player_data
+) -> List[PlayerPaymentInfo]:
+    """Build the results for the best ``command.limit`` matches of the query.
+
+    ``player_data`` must be sorted by name, which breaks ties between equal
+    scores. Only the selected rows become PlayerPaymentInfo objects.
+    """
+    matches = parallel_top_matches(
+        command.name_query,
+        player_data,
+        command.match_threshold,
+        command.limit,
+        name_of=lambda row: row[0],
+        phonetic=command.phonetic,
+    )
+    return [_payment_info(row, match_score) for row, match_score in matches]
+
+
+def search_paid_players(
+    command: SearchPaidPlayersCommand, session: Optional[Session] = None
+) -> Tuple[Tournament, List[PlayerPaymentInfo]]:
     """Search for players who have paid for a specific tournament.
     
     Uses fuzzy matching on player names if a search query is provided.
+    The paid players whose names can't reach the threshold are ruled out
+    in one batch before scoring (see match_candidates), which never drops
+    a match. A blank query matches nobody.
+
+    Only the best ``command.limit`` matches are kept while scoring (see
+    top_player_matches), so names that cannot make the cut are rejected by
+    cheap length and character-count bounds instead of a full difflib
+    comparison. Very large candidate sets are scored on worker processes
+    (see parallel.py). Without a query, the limit is applied in SQL.
     
     Args:
         command: The search command with tournament ID and optional name query
+        session: Optional session to run in; committing is then left to
+            the session owner
         
     Returns:
         Tuple containing the tournament and a list of players who have paid
@@ -31,99 +86,32 @@ def search_paid_players(command: SearchPaidPlayersCommand) -> Tuple[Tournament,
     """
     init_db(command.db_uri)
     
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    try:
-        # First, get tournament details
-        cursor.execute(
-            """
-            SELECT id, name, location, date, surface, registration_deadline, created 
-            FROM tournaments WHERE id = ?
-            """,
-            (command.tournament_id,)
-        )
-        tournament_data = cursor.fetchone()
-        if not tournament_data:
-            raise ValueError(f"Tournament with ID {command.tournament_id} not found")
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
         
-        # Create Tournament object
-        tournament = Tournament(
-            id=tournament_data[0],
-            name=tournament_data[1],
-            location=tournament_data[2],
-            date=datetime.fromisoformat(tournament_data[3]).date(),
-            surface=SurfaceType(tournament_data[4]),
-            registration_deadline=datetime.fromisoformat(tournament_data[5]).date(),
-            created=datetime.fromisoformat(tournament_data[6])
-        )
+        # First, get tournament details
+        tournament = cached_tournament(tx, command.tournament_id).to_model()
         
         # Get players who have paid for this tournament
-        cursor.execute(
-            """
-            SELECT p.name, p.created, p.phone, p.email, tp.payment_date
-            FROM players p
-            JOIN tournament_players tp ON p.name = tp.player_name
-            WHERE tp.tournament_id = ? AND tp.has_paid = 1
-            ORDER BY p.name
-            """,
-            (command.tournament_id,)
-        )
-        player_data = cursor.fetchall()
-        
-        # If no players have paid, return empty list
-        if not player_data:
-            return tournament, []
-        
-        # Process all players
-        all_players = []
-        for row in player_data:
-            player = Player(
-                name=row[0],
-                created=datetime.fromisoformat(row[1]),
-                phone=row[2],
-                email=row[3]
-            )
-            payment_date = datetime.fromisoformat(row[4])
-            
-            # Only add the player if no search query or they match the search
-            if not command.name_query:
-                # No search, add all players
-                all_players.append(PlayerPaymentInfo(
-                    player=player,
-                    payment_date=payment_date
-                ))
-            else:
-                # Try various matching strategies
-                match_score = 0.0
-                
-                # 1. Full name match
-                name_match = fuzzy_match_score(command.name_query, player.name)
-                match_score = max(match_score, name_match)
-                
-                # 2. Check against name parts separately
-                name_parts = player.name.split()
-                for part in name_parts:
-                    part_match = fuzzy_match_score(command.name_query, part)
-                    match_score = max(match_score, part_match)
-                
-                # 3. Special case for first name searching
-                if len(command.name_query.split()) == 1 and command.name_query.lower() == name_parts[0].lower():
-                    match_score = max(match_score, 0.9)  # High score for first name match
-                
-                # Include player if they meet the threshold
-                if match_score >= command.match_threshold:
-                    all_players.append(PlayerPaymentInfo(
-                        player=player,
-                        payment_date=payment_date,
-                        match_score=match_score
-                    ))
-        
-        # Sort by match score (highest first), then by name
         if command.name_query:
-            all_players.sort(key=lambda p: (-p.match_score, p.player.name))
-        
-        # Apply limit
-        return tournament, all_players[:command.limit]
-    finally:
-        conn.close()
\ No newline at end of file
+            if not normalize_name(command.name_query):
+                return tournament, []
+            cursor.execute(PAID_PLAYERS_SQL + " ORDER BY tp.sort_name", (command.tournament_id,))
+        else:
+            cursor.execute(
+                PAID_PLAYERS_SQL + " ORDER BY tp.sort_name LIMIT ?",
+                (command.tournament_id, command.limit)
+            )
+        player_data = cursor.fetchall()
+    
+    if not command.name_query:
+        return tournament, [_payment_info(row) for row in player_data]
+
+    candidates = match_candidates(
+        command.name_query,
+        [row[0] for row in player_data],
+        command.match_threshold,
+        command.phonetic,
+    )
+    best_players = _best_matches(command, [player_data[index] for index in candidates])
+    return tournament, best_players
@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from ..data_types import Player, SearchPlayersCommand
+from ..init_db import init_db
+from ..name_index import get_name_index
+from ..records import PLAYER_COLUMNS, PlayerRecord, select
+from ..session import Session, transaction
+
+
+@dataclass
+class PlayerMatch:
+    """A player found by name, with how well the name matched."""
+    player: Player
+    match_score: float
+
+
+def search_players(
+    command: SearchPlayersCommand, session: Optional[Session] = None
+) -> List[PlayerMatch]:
+    """Find players whose name is similar to the query.
+
+    Names are matched against the in-memory name index of the database
+    (see name_index), so only the best matches are read from the players
+    table.
+
+    Args:
+        command: The command with the name query, threshold and limit
+        session: Optional session to run in; committing is then left to
+            the session owner
+
+    Returns:
+        The matching players, best match first
+    """
+    init_db(command.db_uri)
+
+    matches = get_name_index(command.db_uri).search(
+        command.name_query, command.match_threshold, command.limit, command.phonetic
+    )
+    if not matches:
+        return []
+
+    names = [name for name, _ in matches]
+    placeholders = ", ".join("?" * len(names))
+    with transaction(command.db_uri, session) as tx:
+        players = select(
+            tx.cursor(),
+            PlayerRecord.decode_model,
+            f"SELECT {PLAYER_COLUMNS} FROM players WHERE name IN ({placeholders})",
+            names,
+        ).fetchall()
+        by_name = {player.name: player for player in players}
+
+    results = []
+    for name, score in matches:
+        player = by_name.get(name)
+        # The index can lag behind writes made by other processes
+        if player is None:
+            continue
+        results.append(PlayerMatch(player=player, match_score=score))
+
+    return results
@@ -1,13 +1,18 @@
+from typing import Optional
 from ..data_types import UnregisterPlayerCommand
-from ..utils import get_connection
+from ..session import Session, transaction
 from ..init_db import init_db
+from ..tournament_cache import cached_tournament
+from ..utils import normalize_name
 
 
-def unregister_player(command: UnregisterPlayerCommand) -> str:
+def unregister_player(command: UnregisterPlayerCommand, session: Optional[Session] = None) -> str:
     """Unregister a player from a tournament.
     
     Args:
         command: The command with player and tournament details
+        session: Optional session to run in; committing is then left to
+            the session owner
         
     Returns:
         Success message
@@ -17,42 +22,36 @@ def unregister_player(command: UnregisterPlayerCommand) -> str:
     """
     init_db(command.db_uri)
     
-    conn = get_connection(command.db_uri)
-    cursor = conn.cursor()
-    
-    try:
+    with transaction(command.db_uri, session) as tx:
+        cursor = tx.cursor()
+        
         # Check if player is registered for this tournament
         cursor.execute(
             """
-            SELECT tournament_id, player_name FROM tournament_players 
-            WHERE tournament_id = ? AND player_name = ?
+            SELECT tp.player_id, p.name
+            FROM tournament_players tp
+            JOIN players p ON p.id = tp.player_id
+            WHERE tp.tournament_id = ? AND p.normalized_name = ?
             """,
-            (command.tournament_id, command.player_name)
+            (command.tournament_id, normalize_name(command.player_name))
         )
         existing = cursor.fetchone()
         if not existing:
             raise ValueError(
                 f"Player '{command.player_name}' is not registered for tournament {command.tournament_id}"
             )
+        player_id, player_name = existing
         
         # Get tournament name for response message
-        cursor.execute("SELECT name FROM tournaments WHERE id = ?", (command.tournament_id,))
-        tournament = cursor.fetchone()
-        tournament_name = tournament[0] if tournament else f"ID {command.tournament_id}"
+        tournament_name = cached_tournament(tx, command.tournament_id).name
         
         # Unregister the player
         cursor.execute(
             """
             DELETE FROM tournament_players 
-            WHERE tournament_id = ? AND player_name = ?
+            WHERE tournament_id = ? AND player_id = ?
             """,
-            (command.tournament_id, command.player_name)
+            (command.tournament_id, player_id)
         )
-        conn.commit()
         
-        return f"Player '{command.player_name}' unregistered from tournament '{tournament_name}'"
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
\ No newline at end of file
+    return f"Player '{player_name}' unregistered from tournament '{tournament_name}'"
@@ -1,7 +1,17 @@
-from pathlib import Path
+import threading
+from typing import Optional, Set
 
 from .constants import DEFAULT_DB_URI
-from .utils import get_connection
+from .migrations import LATEST_VERSION, migrate
+from .pool import connection
+from .utils import ensure_db_directory
+
+# Schema version expected by this code: the latest migration
+SCHEMA_VERSION = LATEST_VERSION
+
+# Database URIs whose schema has been verified by this process
+_initialized: Set[str] = set()
+_initialized_lock = threading.Lock()
 
 
 def init_db(db_uri: str = DEFAULT_DB_URI) -> None:
@@ -9,61 +19,44 @@ def init_db(db_uri: str = DEFAULT_DB_URI) -> None:
 
     For SQLite local database, creates directory if needed.
     For SQLiteCloud, connects and creates tables if needed.
+
+    The schema is checked once per database URI and process: the first call
+    compares ``PRAGMA user_version`` with SCHEMA_VERSION and only runs the
+    pending migrations when the database is new or outdated. Later calls
+    return immediately.
     """
-    # For local SQLite, ensure directory exists
-    if db_uri.startswith("file://"):
-        db_path = Path(db_uri.replace("file://", ""))
-        db_path.parent.mkdir(parents=True, exist_ok=True)
+    if db_uri in _initialized:
+        return
 
-    # Get connection using utility function
-    conn = get_connection(db_uri)
-    cursor = conn.cursor()
+    with _initialized_lock:
+        if db_uri in _initialized:
+            return
+        _ensure_schema(db_uri)
+        _initialized.add(db_uri)
 
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS players (
-        name TEXT PRIMARY KEY,
-        created TIMESTAMP,
-        phone TEXT,
-        email TEXT
-    )
-    """)
 
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS tournaments (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        name TEXT NOT NULL,
-        location TEXT NOT NULL,
-        date TEXT NOT NULL,
-        surface TEXT NOT NULL CHECK(surface IN ('grass', 'beach')),
-        registration_deadline TEXT NOT NULL,
-        created TIMESTAMP NOT NULL
-    )
-    """)
+def reset_schema_registry(db_uri: Optional[str] = None) -> None:
+    """Forget that a database (or every database) has been initialized.
 
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS tournament_players (
-        tournament_id INTEGER,
-        player_name TEXT,
-        registered_at TIMESTAMP NOT NULL,
-        has_paid BOOLEAN NOT NULL DEFAULT 0,
-        payment_date TIMESTAMP NULL,
-        PRIMARY KEY (tournament_id, player_name),
-        FOREIGN KEY (tournament_id) REFERENCES tournaments(id) ON DELETE CASCADE,
-        FOREIGN KEY (player_name) REFERENCES players(name) ON DELETE CASCADE
-    )
-    """)
+    Use this when a database file is deleted or replaced while the process
+    keeps running, so the next init_db call checks the schema again.
+    """
+    with _initialized_lock:
+        if db_uri is None:
+            _initialized.clear()
+        else:
+            _initialized.discard(db_uri)
+
+
+def _ensure_schema(db_uri: str) -> None:
+    # For local SQLite, ensure directory exists
+    ensure_db_directory(db_uri)
 
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS federation_payments (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        player_name TEXT NOT NULL,
-        payment_date TIMESTAMP NOT NULL,
-        amount DECIMAL(10, 2) NOT NULL,
-        notes TEXT,
-        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (player_name) REFERENCES players(name) ON DELETE CASCADE
-    )
-    """)
+    # Fast path: a single PRAGMA read on an up to date database
+    with connection(db_uri) as conn:
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] >= SCHEMA_VERSION:
+            return
 
-    conn.commit()
-    conn.close()
+    migrate(db_uri)
@@ -0,0 +1,73 @@
+# Schema migrations
+#
+# To change the schema, add a new mNNNN_<name>.py module defining a
+# `migration` with the next version number and append it to MIGRATIONS.
+# Never edit a migration that has already been released.
+from typing import List
+
+from ..constants import DEFAULT_DB_URI
+from ..pool import connection
+from ..utils import ensure_db_directory
+from .engine import (
+    Migration,
+    MigrationError,
+    MigrationState,
+    apply_migrations,
+    migration_states,
+)
+from . import (
+    m0001_initial_schema,
+    m0002_secondary_indexes,
+    m0003_normalized_player_names,
+    m0004_player_phonetic_codes,
+    m0005_integer_timestamps,
+    m0006_payment_amount_cents,
+    m0007_player_ids,
+    m0008_change_counters,
+    m0009_registration_name_order,
+)
+
+MIGRATIONS: List[Migration] = [
+    m0001_initial_schema.migration,
+    m0002_secondary_indexes.migration,
+    m0003_normalized_player_names.migration,
+    m0004_player_phonetic_codes.migration,
+    m0005_integer_timestamps.migration,
+    m0006_payment_amount_cents.migration,
+    m0007_player_ids.migration,
+    m0008_change_counters.migration,
+    m0009_registration_name_order.migration,
+]
+
+LATEST_VERSION = max(m.version for m in MIGRATIONS)
+
+__all__ = [
+    "LATEST_VERSION",
+    "MIGRATIONS",
+    "Migration",
+    "MigrationError",
+    "MigrationState",
+    "apply_migrations",
+    "migrate",
+    "migration_status",
+    "migration_states",
+]
+
+
+def migrate(db_uri: str = DEFAULT_DB_URI) -> List[Migration]:
+    """Apply all pending migrations to a database.
+
+    Returns:
+        The migrations that were applied (empty if already up to date)
+    """
+    # For local SQLite, ensure directory exists
+    ensure_db_directory(db_uri)
+
+    with connection(db_uri) as conn:
+        return apply_migrations(conn, MIGRATIONS)
+
+
+def migration_status(db_uri: str = DEFAULT_DB_URI) -> List[MigrationState]:
+    """List every known migration and whether it has been applied."""
+    with connection(db_uri) as conn:
+        return migration_states(conn, MIGRATIONS)
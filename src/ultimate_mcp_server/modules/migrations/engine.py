@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Optional, Sequence
+
+
+class MigrationError(RuntimeError):
+    """Raised when a migration fails. The failed migration is rolled back."""
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A single schema change.
+
+    ``upgrade`` receives a cursor inside an open transaction and must not
+    commit; the engine commits after recording the migration.
+
+    Migrations that rebuild a table (create a copy, drop the original,
+    rename the copy) set ``rebuilds_tables``: they run with foreign key
+    enforcement off, so dropping a parent table doesn't cascade to its
+    children, and the foreign keys are checked before committing.
+    """
+    version: int
+    name: str
+    upgrade: Callable[[object], None]
+    rebuilds_tables: bool = False
+
+
+@dataclass
+class MigrationState:
+    """A known migration and when it was applied (None if pending)."""
+    version: int
+    name: str
+    applied_at: Optional[datetime] = None
+
+    @property
+    def applied(self) -> bool:
+        return self.applied_at is not None
+
+
+def ensure_migrations_table(cursor) -> None:
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        applied_at TIMESTAMP NOT NULL
+    )
+    """)
+
+
+def table_columns(cursor, table: str) -> list:
+    """Column names of a table (empty if it doesn't exist)."""
+    cursor.execute(f"PRAGMA table_info({table})")
+    return [row[1] for row in cursor.fetchall()]
+
+
+def applied_migrations(cursor) -> dict:
+    """Map of applied version -> applied_at for the connected database."""
+    cursor.execute("SELECT version, applied_at FROM schema_migrations")
+    return {row[0]: row[1] for row in cursor.fetchall()}
+
+
+def check_foreign_keys(cursor) -> None:
+    """Raise if any row references a missing parent row."""
+    cursor.execute("PRAGMA foreign_key_check")
+    violations = cursor.fetchall()
+    if violations:
+        table, rowid, parent = violations[0][:3]
+        raise ValueError(
+            f"{len(violations)} rows reference missing rows, e.g. row {rowid} of "
+            f"{table} references a missing {parent} row"
+        )
+
+
+def apply_migrations(conn, migrations: Sequence[Migration]) -> List[Migration]:
+    """Apply every pending migration in version order.
+
+    Each migration runs in its own transaction together with its
+    schema_migrations row and the PRAGMA user_version bump, so a failure
+    leaves the database at the last successfully applied version.
+
+    Returns:
+        The migrations applied by this call
+    """
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA query_only")
+    row = cursor.fetchone()
+    if row and row[0]:
+        raise MigrationError(
+            "Database schema is out of date but the connection is read-only "
+            "(PRAGMA query_only); run `migrate` with a writable connection profile"
+        )
+    ensure_migrations_table(cursor)
+    conn.commit()
+
+    applied_now = []
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version in applied_migrations(cursor):
+            continue
+
+        foreign_keys = None
+        if migration.rebuilds_tables:
+            # Only takes effect outside a transaction
+            cursor.execute("PRAGMA foreign_keys")
+            foreign_keys = cursor.fetchone()[0]
+            cursor.execute("PRAGMA foreign_keys = OFF")
+        try:
+            # Take the write lock up front so concurrent migrators serialize
+            cursor.execute("BEGIN IMMEDIATE")
+            # Another process may have applied it while we were waiting
+            if migration.version in applied_migrations(cursor):
+                conn.rollback()
+                continue
+            migration.upgrade(cursor)
+            if migration.rebuilds_tables:
+                check_foreign_keys(cursor)
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, name, applied_at) VALUES (?, ?, ?)",
+                (migration.version, migration.name, datetime.now().isoformat(" ")),
+            )
+            cursor.execute(f"PRAGMA user_version = {migration.version}")
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise MigrationError(
+                f"Migration {migration.version:04d} ({migration.name}) failed: {e}"
+            ) from e
+        finally:
+            if foreign_keys:
+                cursor.execute("PRAGMA foreign_keys = ON")
+
+        applied_now.append(migration)
+
+    # Keep user_version in sync for databases whose migrations were all
+    # recorded but whose version was reset (e.g. restored from a dump)
+    latest = max((m.version for m in migrations), default=0)
+    cursor.execute("PRAGMA user_version")
+    if cursor.fetchone()[0] < latest:
+        cursor.execute(f"PRAGMA user_version = {latest}")
+        conn.commit()
+
+    return applied_now
+
+
+def migration_states(conn, migrations: Sequence[Migration]) -> List[MigrationState]:
+    """Describe every known migration and whether it has been applied."""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'schema_migrations'"
+    )
+    applied = applied_migrations(cursor) if cursor.fetchone() else {}
+    states = []
+    for migration in sorted(migrations, key=lambda m: m.version):
+        applied_at = applied.get(migration.version)
+        if isinstance(applied_at, str):
+            applied_at = datetime.fromisoformat(applied_at)
+        states.append(MigrationState(migration.version, migration.name, applied_at))
+    return states
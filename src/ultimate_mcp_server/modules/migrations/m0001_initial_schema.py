@@ -0,0 +1,54 @@
+"""Initial schema: players, tournaments, registrations and federation payments."""
+from .engine import Migration
+
+
+def upgrade(cursor) -> None:
+    # IF NOT EXISTS so databases created before migrations adopt this version
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS players (
+        name TEXT PRIMARY KEY,
+        created TIMESTAMP,
+        phone TEXT,
+        email TEXT
+    )
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS tournaments (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        location TEXT NOT NULL,
+        date TEXT NOT NULL,
+        surface TEXT NOT NULL CHECK(surface IN ('grass', 'beach')),
+        registration_deadline TEXT NOT NULL,
+        created TIMESTAMP NOT NULL
+    )
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS tournament_players (
+        tournament_id INTEGER,
+        player_name TEXT,
+        registered_at TIMESTAMP NOT NULL,
+        has_paid BOOLEAN NOT NULL DEFAULT 0,
+        payment_date TIMESTAMP NULL,
+        PRIMARY KEY (tournament_id, player_name),
+        FOREIGN KEY (tournament_id) REFERENCES tournaments(id) ON DELETE CASCADE,
+        FOREIGN KEY (player_name) REFERENCES players(name) ON DELETE CASCADE
+    )
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS federation_payments (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        player_name TEXT NOT NULL,
+        payment_date TIMESTAMP NOT NULL,
+        amount DECIMAL(10, 2) NOT NULL,
+        notes TEXT,
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (player_name) REFERENCES players(name) ON DELETE CASCADE
+    )
+    """)
+
+
+migration = Migration(version=1, name="initial_schema", upgrade=upgrade)
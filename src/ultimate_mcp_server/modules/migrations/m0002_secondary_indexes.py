@@ -0,0 +1,36 @@
+"""Secondary indexes for lookups by player and date.
+
+- tournament_players(player_name): list a player's tournaments, cascades
+  from players (the primary key only covers tournament_id lookups)
+- federation_payments(player_name, payment_date, created_at): a player's
+  payments in the order they are listed
+- tournaments(date): tournaments ordered or filtered by date
+
+Like m0001, this migration can run again on a database that already has
+its changes. The player_name indexes are skipped on tables whose
+player_name column was replaced by player_id (see m0007), which indexes
+that instead.
+"""
+from .engine import Migration, table_columns
+
+
+def upgrade(cursor) -> None:
+    if "player_name" in table_columns(cursor, "tournament_players"):
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_tournament_players_player_name
+        ON tournament_players(player_name)
+        """)
+
+    if "player_name" in table_columns(cursor, "federation_payments"):
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_federation_payments_player_date
+        ON federation_payments(player_name, payment_date, created_at)
+        """)
+
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_tournaments_date
+    ON tournaments(date)
+    """)
+
+
+migration = Migration(version=2, name="secondary_indexes", upgrade=upgrade)
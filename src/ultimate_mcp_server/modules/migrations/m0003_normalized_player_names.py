@@ -0,0 +1,46 @@
+"""Case- and accent-insensitive player name keys.
+
+Adds players.normalized_name (see utils.normalize_name) with a unique index,
+so "Jose", "josé" and "JOSÉ" all resolve to the same player in one indexed
+lookup, and two players can't differ only in case or accents. The column is
+filled in Python, since SQLite has no built-in way to strip accents; every
+writer of the players table sets it. Like m0001, this migration can run
+again on a database that already has its changes.
+"""
+from collections import defaultdict
+
+from ..utils import normalize_name
+from .engine import Migration, table_columns
+
+
+def _backfill(cursor) -> None:
+    cursor.execute("SELECT name FROM players")
+    names_by_key = defaultdict(list)
+    for (name,) in cursor.fetchall():
+        names_by_key[normalize_name(name)].append(name)
+
+    clashes = [names for names in names_by_key.values() if len(names) > 1]
+    if clashes:
+        listed = "; ".join(", ".join(repr(name) for name in names) for names in clashes)
+        raise ValueError(
+            f"Players differ only in case, accents or spaces ({listed}); "
+            "rename or remove the duplicates and run migrate again"
+        )
+
+    cursor.executemany(
+        "UPDATE players SET normalized_name = ? WHERE name = ?",
+        [(key, names[0]) for key, names in names_by_key.items()],
+    )
+
+
+def upgrade(cursor) -> None:
+    if "normalized_name" not in table_columns(cursor, "players"):
+        cursor.execute("ALTER TABLE players ADD COLUMN normalized_name TEXT")
+    _backfill(cursor)
+    cursor.execute("""
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_players_normalized_name
+    ON players(normalized_name)
+    """)
+
+
+migration = Migration(version=3, name="normalized_player_names", upgrade=upgrade)
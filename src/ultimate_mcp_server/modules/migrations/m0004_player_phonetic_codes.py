@@ -0,0 +1,47 @@
+"""Sound-alike codes of player names, for typo-tolerant search.
+
+player_phonetic_codes holds one row per distinct phonetic code of the words
+of each player's name (see phonetic.py), so a search for "Gonzales" can
+find "Juan González" with an indexed lookup on the code instead of
+comparing the query with every name. Like normalized_name, the codes are
+computed in Python and written by the commands that add players; rows go
+away with their player (ON DELETE CASCADE).
+
+Like m0001, this migration can run again on a database that already has
+its changes. Once the table references player_id (see m0007), the codes
+are already kept up to date and nothing is done.
+"""
+from ..phonetic import phonetic_codes
+from .engine import Migration, table_columns
+
+
+def upgrade(cursor) -> None:
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS player_phonetic_codes (
+        code TEXT NOT NULL,
+        player_name TEXT NOT NULL,
+        PRIMARY KEY (code, player_name),
+        FOREIGN KEY (player_name) REFERENCES players(name) ON DELETE CASCADE
+    ) WITHOUT ROWID
+    """)
+    if "player_name" not in table_columns(cursor, "player_phonetic_codes"):
+        return
+
+    # Cascading deletes look rows up by player
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_player_phonetic_codes_player_name
+    ON player_phonetic_codes(player_name)
+    """)
+
+    cursor.execute("SELECT name, normalized_name FROM players")
+    cursor.executemany(
+        "INSERT OR IGNORE INTO player_phonetic_codes (code, player_name) VALUES (?, ?)",
+        [
+            (code, name)
+            for name, normalized_name in cursor.fetchall()
+            for code in phonetic_codes(normalized_name)
+        ],
+    )
+
+
+migration = Migration(version=4, name="player_phonetic_codes", upgrade=upgrade)
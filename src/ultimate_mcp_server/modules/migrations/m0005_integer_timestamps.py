@@ -0,0 +1,98 @@
+"""Integer timestamps and dates.
+
+Timestamps were ISO 8601 text written by sqlite3's default datetime
+adapter (deprecated since Python 3.12), and tournament dates ISO 8601
+text. They become INTEGER microseconds and days since 1970-01-01 (see
+timestamps.py), which compare as plain integers: date filters and
+orderings need no string parsing, and the indexes on them are smaller.
+
+The TIMESTAMP columns have NUMERIC affinity, so they keep the integers
+they are given and are converted in place. The tournaments date columns
+were declared TEXT, which would turn integers back into text, so that
+table is rebuilt with INTEGER columns first, keeping its ids and its
+AUTOINCREMENT sequence. Only values still stored as text are converted,
+and they are matched by value rather than by rowid, which later WITHOUT
+ROWID tables (see m0007) lack, so like m0001 this migration can run again
+on a database that already has its changes.
+"""
+from datetime import datetime
+
+from ..timestamps import to_day, to_timestamp
+from .engine import Migration
+
+TIMESTAMP_COLUMNS = [
+    ("players", "created"),
+    ("tournaments", "created"),
+    ("tournament_players", "registered_at"),
+    ("tournament_players", "payment_date"),
+    ("federation_payments", "payment_date"),
+    ("federation_payments", "created_at"),
+]
+DATE_COLUMNS = [
+    ("tournaments", "date"),
+    ("tournaments", "registration_deadline"),
+]
+
+
+def _rebuild_tournaments(cursor) -> None:
+    cursor.execute("PRAGMA table_info(tournaments)")
+    if {row[1]: row[2] for row in cursor.fetchall()}["date"] == "INTEGER":
+        return
+
+    cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'tournaments'")
+    sequence = cursor.fetchone()
+
+    cursor.execute("""
+    CREATE TABLE tournaments_new (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        location TEXT NOT NULL,
+        date INTEGER NOT NULL,
+        surface TEXT NOT NULL CHECK(surface IN ('grass', 'beach')),
+        registration_deadline INTEGER NOT NULL,
+        created INTEGER NOT NULL
+    )
+    """)
+    cursor.execute("""
+    INSERT INTO tournaments_new
+    (id, name, location, date, surface, registration_deadline, created)
+    SELECT id, name, location, date, surface, registration_deadline, created
+    FROM tournaments
+    """)
+    cursor.execute("DROP TABLE tournaments")
+    cursor.execute("ALTER TABLE tournaments_new RENAME TO tournaments")
+    # Don't reuse the ids of deleted tournaments
+    cursor.execute("DELETE FROM sqlite_sequence WHERE name = 'tournaments'")
+    if sequence:
+        cursor.execute(
+            "INSERT INTO sqlite_sequence (name, seq) VALUES ('tournaments', ?)", (sequence[0],)
+        )
+    # Dropped along with the table (see m0002)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tournaments_date ON tournaments(date)")
+
+
+def _convert(cursor, table: str, column: str, encode) -> None:
+    cursor.execute(f"SELECT DISTINCT {column} FROM {table} WHERE typeof({column}) = 'text'")
+    updates = []
+    for (value,) in cursor.fetchall():
+        try:
+            updates.append((encode(datetime.fromisoformat(value)), value))
+        except ValueError:
+            raise ValueError(f"Invalid {table}.{column} value {value!r}")
+    cursor.executemany(
+        f"UPDATE {table} SET {column} = ? WHERE typeof({column}) = 'text' AND {column} = ?",
+        updates,
+    )
+
+
+def upgrade(cursor) -> None:
+    _rebuild_tournaments(cursor)
+    for table, column in TIMESTAMP_COLUMNS:
+        _convert(cursor, table, column, to_timestamp)
+    for table, column in DATE_COLUMNS:
+        _convert(cursor, table, column, lambda value: to_day(value.date()))
+
+
+migration = Migration(
+    version=5, name="integer_timestamps", upgrade=upgrade, rebuilds_tables=True
+)
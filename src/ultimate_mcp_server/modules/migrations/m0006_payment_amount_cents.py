@@ -0,0 +1,64 @@
+"""Federation payment amounts in integer cents.
+
+federation_payments.amount was declared DECIMAL(10, 2), which SQLite
+stores as REAL, so totals drifted with float rounding. The table is
+rebuilt with amount_cents INTEGER (see money.py), keeping its ids and its
+AUTOINCREMENT sequence. Integer timestamp columns (see m0005) replace
+the old TIMESTAMP ones and the CURRENT_TIMESTAMP default, which wrote
+text: every writer sets created_at.
+
+Besides the player's payments index (see m0002), the new table has
+idx_federation_payments_date on (payment_date, player_name,
+amount_cents), which covers the per-season totals. Like m0001, this
+migration can run again on a database that already has its changes.
+"""
+from .engine import Migration, table_columns
+
+
+def upgrade(cursor) -> None:
+    if "amount_cents" in table_columns(cursor, "federation_payments"):
+        return
+
+    cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'federation_payments'")
+    sequence = cursor.fetchone()
+
+    cursor.execute("""
+    CREATE TABLE federation_payments_new (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        player_name TEXT NOT NULL,
+        payment_date INTEGER NOT NULL,
+        amount_cents INTEGER NOT NULL,
+        notes TEXT,
+        created_at INTEGER NOT NULL,
+        FOREIGN KEY (player_name) REFERENCES players(name) ON DELETE CASCADE
+    )
+    """)
+    cursor.execute("""
+    INSERT INTO federation_payments_new
+    (id, player_name, payment_date, amount_cents, notes, created_at)
+    SELECT id, player_name, payment_date, CAST(ROUND(amount * 100) AS INTEGER), notes,
+           created_at
+    FROM federation_payments
+    """)
+    cursor.execute("DROP TABLE federation_payments")
+    cursor.execute("ALTER TABLE federation_payments_new RENAME TO federation_payments")
+    # Don't reuse the ids of deleted payments
+    cursor.execute("DELETE FROM sqlite_sequence WHERE name = 'federation_payments'")
+    if sequence:
+        cursor.execute(
+            "INSERT INTO sqlite_sequence (name, seq) VALUES ('federation_payments', ?)",
+            (sequence[0],),
+        )
+
+    # Dropped along with the table
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_federation_payments_player_date
+    ON federation_payments(player_name, payment_date, created_at)
+    """)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_federation_payments_date
+    ON federation_payments(payment_date, player_name, amount_cents)
+    """)
+
+
+migration = Migration(version=6, name="payment_amount_cents", upgrade=upgrade)
@@ -0,0 +1,177 @@
+"""Integer player ids.
+
+players was keyed by its name, so every registration, federation payment
+and phonetic code repeated the name, and every index on them held a copy
+of it. players gets an INTEGER PRIMARY KEY id, i.e. its rowid (existing
+players keep theirs), and name becomes a unique indexed column, so
+commands still look players up by name. The child tables are rebuilt to
+reference player_id instead:
+
+- tournament_players is a WITHOUT ROWID table clustered on its primary
+  key (tournament_id, player_id), so a tournament's registrations are one
+  range of the table itself, with idx_tournament_players_player_id for a
+  player's tournaments and for cascading deletes.
+- federation_payments keeps its ids and its AUTOINCREMENT sequence, and
+  its indexes (see m0006) start with or cover player_id.
+- player_phonetic_codes is keyed by (code, player_id).
+
+Each table is only rebuilt if it doesn't have its new columns yet, so like
+m0001 this migration can run again on a database that already has its
+changes.
+"""
+from .engine import Migration, table_columns
+
+
+def _check_players_exist(cursor, table: str) -> None:
+    cursor.execute(f"""
+    SELECT DISTINCT player_name FROM {table}
+    WHERE player_name NOT IN (SELECT name FROM players)
+    """)
+    missing = [row[0] for row in cursor.fetchall()]
+    if missing:
+        listed = ", ".join(repr(name) for name in missing)
+        raise ValueError(f"{table} references missing players ({listed})")
+
+
+def _rebuild_players(cursor) -> None:
+    if "id" in table_columns(cursor, "players"):
+        return
+
+    cursor.execute("""
+    CREATE TABLE players_new (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        created INTEGER,
+        phone TEXT,
+        email TEXT,
+        normalized_name TEXT
+    )
+    """)
+    cursor.execute("""
+    INSERT INTO players_new (id, name, created, phone, email, normalized_name)
+    SELECT rowid, name, created, phone, email, normalized_name
+    FROM players
+    """)
+    cursor.execute("DROP TABLE players")
+    cursor.execute("ALTER TABLE players_new RENAME TO players")
+
+
+def _rebuild_tournament_players(cursor) -> None:
+    if "player_id" in table_columns(cursor, "tournament_players"):
+        return
+    _check_players_exist(cursor, "tournament_players")
+
+    cursor.execute("""
+    CREATE TABLE tournament_players_new (
+        tournament_id INTEGER NOT NULL,
+        player_id INTEGER NOT NULL,
+        registered_at INTEGER NOT NULL,
+        has_paid BOOLEAN NOT NULL DEFAULT 0,
+        payment_date INTEGER NULL,
+        PRIMARY KEY (tournament_id, player_id),
+        FOREIGN KEY (tournament_id) REFERENCES tournaments(id) ON DELETE CASCADE,
+        FOREIGN KEY (player_id) REFERENCES players(id) ON DELETE CASCADE
+    ) WITHOUT ROWID
+    """)
+    cursor.execute("""
+    INSERT INTO tournament_players_new
+    (tournament_id, player_id, registered_at, has_paid, payment_date)
+    SELECT tp.tournament_id, p.id, tp.registered_at, tp.has_paid, tp.payment_date
+    FROM tournament_players tp
+    JOIN players p ON p.name = tp.player_name
+    """)
+    cursor.execute("DROP TABLE tournament_players")
+    cursor.execute("ALTER TABLE tournament_players_new RENAME TO tournament_players")
+
+
+def _rebuild_federation_payments(cursor) -> None:
+    if "player_id" in table_columns(cursor, "federation_payments"):
+        return
+    _check_players_exist(cursor, "federation_payments")
+
+    cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'federation_payments'")
+    sequence = cursor.fetchone()
+
+    cursor.execute("""
+    CREATE TABLE federation_payments_new (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        player_id INTEGER NOT NULL,
+        payment_date INTEGER NOT NULL,
+        amount_cents INTEGER NOT NULL,
+        notes TEXT,
+        created_at INTEGER NOT NULL,
+        FOREIGN KEY (player_id) REFERENCES players(id) ON DELETE CASCADE
+    )
+    """)
+    cursor.execute("""
+    INSERT INTO federation_payments_new
+    (id, player_id, payment_date, amount_cents, notes, created_at)
+    SELECT fp.id, p.id, fp.payment_date, fp.amount_cents, fp.notes, fp.created_at
+    FROM federation_payments fp
+    JOIN players p ON p.name = fp.player_name
+    """)
+    cursor.execute("DROP TABLE federation_payments")
+    cursor.execute("ALTER TABLE federation_payments_new RENAME TO federation_payments")
+    # Don't reuse the ids of deleted payments
+    cursor.execute("DELETE FROM sqlite_sequence WHERE name = 'federation_payments'")
+    if sequence:
+        cursor.execute(
+            "INSERT INTO sqlite_sequence (name, seq) VALUES ('federation_payments', ?)",
+            (sequence[0],),
+        )
+
+
+def _rebuild_player_phonetic_codes(cursor) -> None:
+    if "player_id" in table_columns(cursor, "player_phonetic_codes"):
+        return
+    _check_players_exist(cursor, "player_phonetic_codes")
+
+    cursor.execute("""
+    CREATE TABLE player_phonetic_codes_new (
+        code TEXT NOT NULL,
+        player_id INTEGER NOT NULL,
+        PRIMARY KEY (code, player_id),
+        FOREIGN KEY (player_id) REFERENCES players(id) ON DELETE CASCADE
+    ) WITHOUT ROWID
+    """)
+    cursor.execute("""
+    INSERT INTO player_phonetic_codes_new (code, player_id)
+    SELECT c.code, p.id
+    FROM player_phonetic_codes c
+    JOIN players p ON p.name = c.player_name
+    """)
+    cursor.execute("DROP TABLE player_phonetic_codes")
+    cursor.execute("ALTER TABLE player_phonetic_codes_new RENAME TO player_phonetic_codes")
+
+
+def upgrade(cursor) -> None:
+    _rebuild_players(cursor)
+    _rebuild_tournament_players(cursor)
+    _rebuild_federation_payments(cursor)
+    _rebuild_player_phonetic_codes(cursor)
+
+    # Dropped along with the tables (see m0002, m0003, m0004 and m0006)
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_players_name ON players(name)")
+    cursor.execute("""
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_players_normalized_name
+    ON players(normalized_name)
+    """)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_tournament_players_player_id
+    ON tournament_players(player_id)
+    """)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_federation_payments_player_date
+    ON federation_payments(player_id, payment_date, created_at)
+    """)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_federation_payments_date
+    ON federation_payments(payment_date, player_id, amount_cents)
+    """)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_player_phonetic_codes_player_id
+    ON player_phonetic_codes(player_id)
+    """)
+
+
+migration = Migration(version=7, name="player_ids", upgrade=upgrade, rebuilds_tables=True)
@@ -0,0 +1,38 @@
+"""Change counters, for in-process caches.
+
+change_counters holds one counter per cached table, bumped by triggers on
+every insert, update and delete, so a process can tell whether another
+one changed the table since it cached it (see tournament_cache.py). Local
+databases check PRAGMA data_version first and only read the counter after
+another connection committed something; SQLiteCloud connections read it
+every time. Like m0001, this migration can run again on a database that
+already has its changes.
+"""
+from .engine import Migration
+
+COUNTED_TABLES = ["tournaments"]
+
+
+def upgrade(cursor) -> None:
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS change_counters (
+        name TEXT PRIMARY KEY,
+        counter INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID
+    """)
+
+    for table in COUNTED_TABLES:
+        cursor.execute(
+            "INSERT OR IGNORE INTO change_counters (name, counter) VALUES (?, 0)", (table,)
+        )
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_counter
+            AFTER {event} ON {table}
+            BEGIN
+                UPDATE change_counters SET counter = counter + 1 WHERE name = '{table}';
+            END
+            """)
+
+
+migration = Migration(version=8, name="change_counters", upgrade=upgrade)
@@ -0,0 +1,40 @@
+"""Registrations in player name order.
+
+Rosters are listed by player name, a page at a time (see
+list_tournament_players). Since m0007, tournament_players only holds
+player_id, so every page joined the tournament's whole roster with
+players and sorted it by name. tournament_players gets a copy of the
+player's name, indexed with idx_tournament_players_sort_name on
+(tournament_id, sort_name, player_id), so a page is one range of that
+index. Joins still go through player_id; a trigger keeps the copy in step
+if a player is renamed.
+
+Like m0001, this migration can run again on a database that already has
+its changes.
+"""
+from .engine import Migration, table_columns
+
+
+def upgrade(cursor) -> None:
+    if "sort_name" not in table_columns(cursor, "tournament_players"):
+        cursor.execute("ALTER TABLE tournament_players ADD COLUMN sort_name TEXT")
+    cursor.execute("""
+    UPDATE tournament_players
+    SET sort_name = (SELECT name FROM players WHERE id = tournament_players.player_id)
+    WHERE sort_name IS NULL
+    """)
+
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_tournament_players_sort_name
+    ON tournament_players(tournament_id, sort_name, player_id)
+    """)
+    cursor.execute("""
+    CREATE TRIGGER IF NOT EXISTS tournament_players_player_rename
+    AFTER UPDATE OF name ON players
+    BEGIN
+        UPDATE tournament_players SET sort_name = new.name WHERE player_id = new.id;
+    END
+    """)
+
+
+migration = Migration(version=9, name="registration_name_order", upgrade=upgrade)
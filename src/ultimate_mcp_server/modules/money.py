@@ -0,0 +1,26 @@
+"""Storage format of payment amounts.
+
+Amounts are stored as INTEGER cents (see m0006_payment_amount_cents) and
+handled as Decimal everywhere else, so adding them up, in SQL or in
+Python, is exact: no float rounding drift in totals.
+"""
+from decimal import Decimal
+
+_CENT = Decimal("0.01")
+
+
+def to_cents(amount: Decimal) -> int:
+    """Stored form of an amount, which must be a whole number of cents.
+
+    Raises:
+        ValueError: If the amount has fractions of a cent
+    """
+    cents = amount * 100
+    if cents != cents.to_integral_value():
+        raise ValueError(f"Amount {amount} has fractions of a cent")
+    return int(cents)
+
+
+def from_cents(cents: int) -> Decimal:
+    """Decode a stored amount (see to_cents), e.g. 1050 -> Decimal("10.50")."""
+    return Decimal(cents) * _CENT
@@ -0,0 +1,243 @@
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .constants import DEFAULT_DB_URI
+from .init_db import init_db
+from .phonetic import phonetic_codes
+from .pool import connection
+from .parallel import parallel_top_matches
+from .utils import common_chars_needed, normalize_name, sound_alike_codes
+
+
+class _CharPostings:
+    """Strings by the characters they contain, to bound their similarity to a query."""
+
+    def __init__(self):
+        # Character -> {string: occurrences}
+        self._postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._lengths: Dict[str, int] = {}
+
+    def add(self, text: str) -> None:
+        self._lengths[text] = len(text)
+        for char, count in Counter(text).items():
+            self._postings[char][text] = count
+
+    def remove(self, text: str) -> None:
+        del self._lengths[text]
+        for char in set(text):
+            counts = self._postings[char]
+            del counts[text]
+            if not counts:
+                del self._postings[char]
+
+    def reaching(self, query: str, threshold: float) -> List[str]:
+        """Strings whose quick_ratio against a normalized query is at least ``threshold``.
+
+        Only the strings sharing one of the query's rarest characters are
+        read: the others share fewer characters than the threshold needs
+        (see common_chars_needed).
+        """
+        needed = common_chars_needed(query, threshold)
+        counts = Counter(query)
+        found: Set[str] = set()
+        rest = len(query)
+        for char in sorted(counts, key=lambda char: len(self._postings.get(char, ()))):
+            if rest < needed:
+                break
+            found.update(self._postings.get(char, ()))
+            rest -= counts[char]
+
+        postings = [(self._postings.get(char, {}), count) for char, count in counts.items()]
+        reaching = []
+        for text in found:
+            shared = sum(min(count, texts.get(text, 0)) for texts, count in postings)
+            # Same arithmetic as difflib, so bounds compare exactly with scores
+            if 2.0 * shared / (len(query) + self._lengths[text]) >= threshold:
+                reaching.append(text)
+        return reaching
+
+
+class NameIndex:
+    """In-memory index of player names, by character and by word sound.
+
+    Every rule of player_match_score but the phonetic floor scores at most
+    difflib's quick_ratio of the query against the full name or one of its
+    words (see _batch_candidates in utils.py). Fuzzy lookups only score the
+    names whose full name or a word reaches the threshold by that bound,
+    found through per-character postings, and, with phonetic scoring, the
+    names having every phonetic code of the query (see phonetic.py). Every
+    other name is below the threshold, so the results are the same as
+    scoring the whole roster.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        # Normalized names -> names, and the words of the normalized names -> names
+        self._keys: Dict[str, Set[str]] = defaultdict(set)
+        self._words: Dict[str, Set[str]] = defaultdict(set)
+        self._key_chars = _CharPostings()
+        self._word_chars = _CharPostings()
+        # Phonetic code -> names with a word of that code
+        self._codes: Dict[str, Set[str]] = defaultdict(set)
+        self._names: Set[str] = set()
+        self._lock = threading.Lock()
+        for name in names:
+            self._add(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def add(self, name: str) -> None:
+        with self._lock:
+            self._add(name)
+
+    def remove(self, name: str) -> None:
+        with self._lock:
+            if name not in self._names:
+                return
+            self._names.discard(name)
+            key = normalize_name(name)
+            self._unlink(self._keys, key, name, self._key_chars)
+            for word in set(key.split()):
+                self._unlink(self._words, word, name, self._word_chars)
+            for code in phonetic_codes(key):
+                self._unlink(self._codes, code, name)
+
+    def candidates(self, query: str, threshold: float, phonetic: bool = False) -> Set[str]:
+        """Names that may score at least ``threshold`` against a query."""
+        key = normalize_name(query)
+        codes = sound_alike_codes(key, threshold) if phonetic else []
+        with self._lock:
+            if threshold <= 0:
+                return set(self._names)
+
+            found: Set[str] = set()
+            for name_key in self._key_chars.reaching(key, threshold):
+                found.update(self._keys[name_key])
+            for word in self._word_chars.reaching(key, threshold):
+                found.update(self._words[word])
+            if codes:
+                found.update(set.intersection(*(self._codes.get(code, set()) for code in codes)))
+            return found
+
+    def search(
+        self, query: str, threshold: float = 0.6, limit: int = 10, phonetic: bool = False
+    ) -> List[Tuple[str, float]]:
+        """Find the names that best match a query.
+
+        Args:
+            query: The (possibly misspelled) name to look for
+            threshold: Minimum score (0-1) a name needs to be returned
+            limit: Maximum number of results
+            phonetic: Give sound-alike names the phonetic floor (see
+                player_match_score)
+
+        Returns:
+            (name, score) pairs, best match first, ties by name
+        """
+        if not query.strip():
+            return []
+
+        return parallel_top_matches(
+            query,
+            sorted(self.candidates(query, threshold, phonetic)),
+            threshold,
+            limit,
+            phonetic=phonetic,
+        )
+
+    def _add(self, name: str) -> None:
+        if name in self._names:
+            return
+        self._names.add(name)
+        key = normalize_name(name)
+        self._link(self._keys, key, name, self._key_chars)
+        for word in set(key.split()):
+            self._link(self._words, word, name, self._word_chars)
+        for code in phonetic_codes(key):
+            self._codes[code].add(name)
+
+    @staticmethod
+    def _link(
+        names_by: Dict[str, Set[str]], text: str, name: str, chars: _CharPostings
+    ) -> None:
+        if text not in names_by:
+            chars.add(text)
+        names_by[text].add(name)
+
+    @staticmethod
+    def _unlink(
+        names_by: Dict[str, Set[str]],
+        text: str,
+        name: str,
+        chars: Optional[_CharPostings] = None,
+    ) -> None:
+        names = names_by[text]
+        names.discard(name)
+        if not names:
+            del names_by[text]
+            if chars is not None:
+                chars.remove(text)
+
+
+# One index per database URI, built on first use
+_indexes: Dict[str, NameIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_name_index(db_uri: str = DEFAULT_DB_URI) -> NameIndex:
+    """Get the name index of a database, loading every player name on first use.
+
+    The index holds committed players only: writes made in a session reach
+    it through after_commit callbacks (see index_players_added).
+    """
+    index = _indexes.get(db_uri)
+    if index is not None:
+        return index
+
+    with _indexes_lock:
+        index = _indexes.get(db_uri)
+        if index is None:
+            init_db(db_uri)
+            with connection(db_uri) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT name FROM players")
+                index = NameIndex(row[0] for row in cursor.fetchall())
+            _indexes[db_uri] = index
+    return index
+
+
+def index_players_added(db_uri: str, names: Iterable[str]) -> None:
+    """Record committed new players in the index, if it has been built."""
+    # Taking the lock waits for an index being built, which may have read
+    # the players table before these names were committed
+    with _indexes_lock:
+        index = _indexes.get(db_uri)
+    if index is not None:
+        for name in names:
+            index.add(name)
+
+
+def index_players_removed(db_uri: str, names: Iterable[str]) -> None:
+    """Drop committed removed players from the index, if it has been built."""
+    with _indexes_lock:
+        index = _indexes.get(db_uri)
+    if index is not None:
+        for name in names:
+            index.remove(name)
+
+
+def reset_name_index(db_uri: Optional[str] = None) -> None:
+    """Forget the index of a database (or of every database).
+
+    The next search rebuilds it from the players table. Use it when players
+    were changed by another process.
+    """
+    with _indexes_lock:
+        if db_uri is None:
+            _indexes.clear()
+        else:
+            _indexes.pop(db_uri, None)
@@ -0,0 +1,55 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+
+class Keyset:
+    """Sort key of a paginated listing, and the opaque page tokens built from it.
+
+    Listings are ordered by an indexed, unique key (e.g. a player's name,
+    or a tournament's date then id). A page token holds the key of the last
+    item of a page; the next page starts right after it with an indexed
+    ``WHERE key > ?`` instead of skipping rows with OFFSET, so every page
+    costs the same whatever its position.
+    """
+
+    def __init__(self, name: str, size: int, key_of: Callable[[Any], Tuple]):
+        self.name = name
+        self.size = size  # Number of columns in the key
+        self.key_of = key_of
+
+    def next_token(self, items: Sequence[Any], limit: Optional[int]) -> Optional[str]:
+        """Token of the page after ``items``, or None if this was the last page.
+
+        A full page may be followed by an empty one: finding out would take
+        another query.
+        """
+        if not items or limit is None or len(items) < limit:
+            return None
+        return self.token_after(items[-1])
+
+    def token_after(self, item: Any) -> str:
+        """Token of the page starting right after ``item``."""
+        payload = json.dumps([self.name, *self.key_of(item)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode(self, token: str) -> Tuple:
+        """Key of the last item before the page a token points to.
+
+        Raises:
+            ValueError: If the token is malformed or belongs to another listing
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            name, *key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+            raise ValueError(f"Invalid page token '{token}'")
+        if name != self.name or len(key) != self.size:
+            raise ValueError(f"Page token '{token}' is not for {self.name}")
+        return tuple(key)
+
+
+def sql_limit(limit: Optional[int]) -> int:
+    """Value for a LIMIT clause, where None means every row."""
+    return -1 if limit is None else limit
@@ -0,0 +1,165 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from .constants import MATCH_PARALLEL_MIN_CANDIDATES, MATCH_PROCESSES
+from .utils import top_player_matches
+
+logger = logging.getLogger(__name__)
+
+
+def _chunk_top_matches(
+    name_query: str,
+    names: List[str],
+    offset: int,
+    threshold: float,
+    limit: int,
+    phonetic: bool,
+) -> List[Tuple[int, float]]:
+    """Worker side of ParallelMatcher: top matches of one chunk, by position."""
+    matches = top_player_matches(
+        name_query, range(len(names)), threshold, limit, names.__getitem__, phonetic
+    )
+    return [(offset + index, score) for index, score in matches]
+
+
+class ParallelMatcher:
+    """Runs top_player_matches on a process pool for large candidate sets.
+
+    Fuzzy scoring is pure Python, so threads can't share it out. Above
+    ``min_candidates`` names, the candidates are split into one chunk per
+    worker process, each worker keeps its own top ``limit``, and the
+    chunks' results are merged. Smaller searches run in the calling thread,
+    where sending the names to other processes would cost more than it
+    saves. The pool is started on first use and kept for later searches.
+    """
+
+    def __init__(
+        self,
+        processes: int = MATCH_PROCESSES,
+        min_candidates: int = MATCH_PARALLEL_MIN_CANDIDATES,
+    ):
+        self.processes = processes
+        self.min_candidates = min_candidates
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.processes > 1
+
+    def top_matches(
+        self,
+        name_query: str,
+        items: Sequence[Any],
+        threshold: float,
+        limit: int,
+        name_of: Callable[[Any], str] = lambda item: item,
+        phonetic: bool = False,
+    ) -> List[Tuple[Any, float]]:
+        """Same results as top_player_matches, possibly computed in worker processes.
+
+        Args:
+            name_query: The search query
+            items: The items to search, such as names or database rows
+            threshold: Minimum score (0-1) an item needs to be returned
+            limit: Maximum number of results
+            name_of: Gets the player name of an item
+            phonetic: Give sound-alike names the phonetic floor (see
+                player_match_score)
+
+        Returns:
+            (item, score) pairs, best match first
+        """
+        if not self.enabled or len(items) < max(self.min_candidates, self.processes):
+            return top_player_matches(name_query, items, threshold, limit, name_of, phonetic)
+
+        names = [name_of(item) for item in items]
+        chunk_size = -(-len(names) // self.processes)
+        try:
+            pool = self._executor()
+            futures = [
+                pool.submit(
+                    _chunk_top_matches,
+                    name_query,
+                    names[offset:offset + chunk_size],
+                    offset,
+                    threshold,
+                    limit,
+                    phonetic,
+                )
+                for offset in range(0, len(names), chunk_size)
+            ]
+            scored = [match for future in futures for match in future.result()]
+        except BrokenProcessPool:
+            logger.warning("Fuzzy match worker died, matching in-process", exc_info=True)
+            self.shutdown(wait=False)
+            return top_player_matches(name_query, items, threshold, limit, name_of, phonetic)
+
+        # Best score first, ties to the earliest item, like top_player_matches
+        scored.sort(key=lambda match: (-match[1], match[0]))
+        return [(items[position], score) for position, score in scored[:limit]]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes. A later search starts a fresh pool."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    # Forking a process that runs tool threads could copy held locks
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.processes,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._pool
+
+
+_matcher = ParallelMatcher()
+
+
+def get_matcher() -> ParallelMatcher:
+    """Get the process-wide parallel matcher."""
+    return _matcher
+
+
+def configure_matcher(
+    processes: Optional[int] = None, min_candidates: Optional[int] = None
+) -> ParallelMatcher:
+    """Replace the process-wide parallel matcher with new settings.
+
+    The previous matcher's worker processes are stopped.
+    """
+    global _matcher
+    previous = _matcher
+    _matcher = ParallelMatcher(
+        processes=processes if processes is not None else previous.processes,
+        min_candidates=(
+            min_candidates if min_candidates is not None else previous.min_candidates
+        ),
+    )
+    previous.shutdown(wait=False)
+    return _matcher
+
+
+def parallel_top_matches(
+    name_query: str,
+    items: Sequence[Any],
+    threshold: float,
+    limit: int,
+    name_of: Callable[[Any], str] = lambda item: item,
+    phonetic: bool = False,
+) -> List[Tuple[Any, float]]:
+    """top_player_matches on the process-wide matcher (see ParallelMatcher).
+
+    Example:
+        matches = parallel_top_matches("Jaun", rows, 0.6, 10, name_of=lambda row: row[0])
+    """
+    return _matcher.top_matches(name_query, items, threshold, limit, name_of, phonetic)
@@ -0,0 +1,106 @@
+from functools import lru_cache
+from typing import List
+
+from .constants import NAME_CACHE_SIZE
+
+VOWELS = frozenset("aeiou")
+FRONT_VOWELS = frozenset("ei")
+
+# Letters that always sound the same, whatever follows them
+SIMPLE_SOUNDS = {
+    "b": "B", "v": "B", "w": "B",
+    "d": "D", "t": "T",
+    "f": "F",
+    "j": "J",
+    "k": "K", "q": "K",
+    "l": "L", "m": "M", "n": "N", "p": "P", "r": "R",
+    "s": "S", "z": "S",
+}
+
+
+# Rosters reuse a small vocabulary of first names and surnames
+@lru_cache(maxsize=8192)
+def phonetic_code(word: str) -> str:
+    """Sound-alike code of a single normalized word (see normalize_name).
+
+    A Metaphone-style encoding tuned for Spanish names, with the common
+    English spellings the roster also has: b/v, c/k/q, c/s/z (seseo),
+    g/j before e and i, ll/y (yeísmo) and a silent h sound the same, a
+    leading i before a vowel sounds like y, and vowels are dropped unless
+    the word starts with one. So "Gonzales" and "Gonzalez", "Yago" and
+    "Iago", or "Cabi" and "Kavi" get the same code.
+    """
+    letters = [char for char in word if char.isalpha()]
+    code = []
+    i = 0
+    while i < len(letters):
+        char = letters[i]
+        next_char = letters[i + 1] if i + 1 < len(letters) else ""
+        after_next = letters[i + 2] if i + 2 < len(letters) else ""
+        step = 1
+        sound = ""
+
+        if next_char in VOWELS and (char == "y" or (char == "i" and i == 0)):
+            sound = "Y"
+        elif char in VOWELS or char == "y":
+            # Only a leading vowel sound is kept ("Hernández" starts with one)
+            sound = "" if code else "A"
+        elif char == "c":
+            if next_char == "h":
+                sound, step = "X", 2
+            elif next_char in FRONT_VOWELS:
+                sound = "S"
+            elif next_char == "k":
+                sound, step = "K", 2
+            else:
+                sound = "K"
+        elif char == "g":
+            if next_char in FRONT_VOWELS:
+                sound = "J"
+            elif next_char == "u" and after_next in FRONT_VOWELS:
+                # "gue", "gui": the u is silent
+                sound, step = "G", 2
+            else:
+                sound = "G"
+        elif char == "q":
+            # "que", "qui": the u is silent
+            sound, step = "K", 2 if next_char == "u" else 1
+        elif char == "l" and next_char == "l":
+            sound, step = "Y", 2
+        elif char == "s" and next_char == "h":
+            sound, step = "X", 2
+        elif char == "p" and next_char == "h":
+            sound, step = "F", 2
+        elif char == "t" and next_char == "h":
+            sound, step = "T", 2
+        elif char == "x":
+            sound = "S" if i == 0 else "KS"
+        elif char == "h":
+            sound = ""
+        else:
+            sound = SIMPLE_SOUNDS.get(char, "")
+
+        # Doubled letters ("rr", "ss", "nn") sound like one
+        if sound and not (code and code[-1] == sound):
+            code.append(sound)
+        i += step
+
+    return "".join(code)
+
+
+def phonetic_codes(normalized_name: str) -> List[str]:
+    """Distinct sound-alike codes of the words of a normalized name, in order."""
+    codes = []
+    for word in normalized_name.split():
+        code = phonetic_code(word)
+        if code and code not in codes:
+            codes.append(code)
+    return codes
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def phonetic_key(normalized_name: str) -> str:
+    """Sound-alike code of a whole normalized name: its word codes, space-separated."""
+    return " ".join(
+        code for code in (phonetic_code(word) for word in normalized_name.split()) if code
+    )
@@ -0,0 +1,186 @@
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Optional, Tuple
+
+from .constants import DEFAULT_DB_URI, DB_POOL_SIZE, DB_POOL_IDLE_TIMEOUT
+from .profiles import get_profile
+from .utils import get_connection
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """A pool of reusable connections to a single database URI.
+
+    Works with both sqlite3 and sqlitecloud connections, since it only relies
+    on the DB-API ``cursor``/``rollback``/``close`` methods.
+
+    - Up to ``max_size`` idle connections are kept. When more connections are
+      checked out at the same time, the extra ones are closed on release
+      instead of being returned to the pool.
+    - Every checkout runs a cheap health check and transparently replaces
+      connections that went stale (e.g. a dropped SQLiteCloud socket).
+    - Connections idle for longer than ``idle_timeout`` seconds are closed.
+    - New connections get the PRAGMAs of the pool's connection ``profile``
+      (see profiles.py); None means the SQLITE_PROFILE default.
+    """
+
+    def __init__(
+        self,
+        db_uri: str = DEFAULT_DB_URI,
+        max_size: int = DB_POOL_SIZE,
+        idle_timeout: float = DB_POOL_IDLE_TIMEOUT,
+        profile: Optional[str] = None,
+    ):
+        self.db_uri = db_uri
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.profile = profile
+        # (connection, released_at) pairs, oldest on the left
+        self._idle: Deque[Tuple[object, float]] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Check out a healthy connection, opening a new one if needed."""
+        while True:
+            with self._lock:
+                expired = self._pop_expired()
+                conn = self._idle.pop()[0] if self._idle else None
+            for stale in expired:
+                _close_quietly(stale)
+            if conn is None:
+                return get_connection(self.db_uri, self.profile)
+            if _is_healthy(conn):
+                return conn
+            logger.info("Discarding unhealthy pooled connection to %s", self.db_uri)
+            _close_quietly(conn)
+
+    def release(self, conn) -> None:
+        """Return a connection to the pool.
+
+        Any transaction left open by the caller is rolled back so the next
+        holder starts from a clean state.
+        """
+        try:
+            conn.rollback()
+        except Exception:
+            _close_quietly(conn)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append((conn, time.monotonic()))
+                return
+        _close_quietly(conn)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+        for conn in idle:
+            _close_quietly(conn)
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def _pop_expired(self):
+        """Remove idle connections past the idle timeout. Caller holds the lock."""
+        expired = []
+        deadline = time.monotonic() - self.idle_timeout
+        while self._idle and self._idle[0][1] < deadline:
+            expired.append(self._idle.popleft()[0])
+        return expired
+
+
+def _is_healthy(conn) -> bool:
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+        return True
+    except Exception:
+        return False
+
+
+def _close_quietly(conn) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_uri: str = DEFAULT_DB_URI) -> ConnectionPool:
+    """Get the process-wide pool for a database URI, creating it on first use."""
+    pool = _pools.get(db_uri)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(db_uri, ConnectionPool(db_uri))
+    return pool
+
+
+def configure_pool(
+    db_uri: str = DEFAULT_DB_URI,
+    max_size: Optional[int] = None,
+    idle_timeout: Optional[float] = None,
+    profile: Optional[str] = None,
+) -> ConnectionPool:
+    """Override the pool settings for a database URI.
+
+    Changing the profile closes the idle connections, so every connection
+    handed out afterwards has the new PRAGMAs applied.
+    """
+    pool = get_pool(db_uri)
+    if max_size is not None:
+        pool.max_size = max_size
+    if idle_timeout is not None:
+        pool.idle_timeout = idle_timeout
+    if profile is not None and profile != pool.profile:
+        # Validate before switching
+        get_profile(profile)
+        pool.profile = profile
+        pool.close()
+    return pool
+
+
+def close_pools() -> None:
+    """Close every pooled connection in the process."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_pools)
+
+
+@contextmanager
+def connection(db_uri: str = DEFAULT_DB_URI) -> Iterator[object]:
+    """Borrow a pooled connection for the duration of a ``with`` block.
+
+    The caller is responsible for committing. Uncommitted work is rolled back
+    when the connection goes back to the pool, including when the block
+    raises.
+
+    Example:
+        with connection(command.db_uri) as conn:
+            cursor = conn.cursor()
+            cursor.execute(...)
+            conn.commit()
+    """
+    pool = get_pool(db_uri)
+    conn = pool.acquire()
+    try:
+        yield conn
+    finally:
+        pool.release(conn)
@@ -0,0 +1,112 @@
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .constants import DEFAULT_DB_PROFILE
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConnectionProfile:
+    """A named set of PRAGMAs applied to every new connection.
+
+    Fields left as None keep SQLite's default for that setting.
+    """
+    name: str
+    journal_mode: Optional[str] = None
+    synchronous: Optional[str] = None
+    # Negative values are KiB, positive values are pages (SQLite semantics)
+    cache_size: Optional[int] = None
+    mmap_size: Optional[int] = None
+    temp_store: Optional[str] = None
+    busy_timeout: Optional[int] = None  # milliseconds
+    foreign_keys: bool = True
+    query_only: bool = False
+
+    def pragmas(self, local: bool = True) -> List[str]:
+        """PRAGMA statements for this profile.
+
+        Storage-level settings (journaling, sync, cache, mmap, temp store)
+        only make sense for local files; SQLiteCloud manages those on the
+        server, so remote connections only get the per-connection ones.
+        """
+        statements = []
+        if local:
+            if self.journal_mode is not None:
+                statements.append(f"PRAGMA journal_mode = {self.journal_mode}")
+            if self.synchronous is not None:
+                statements.append(f"PRAGMA synchronous = {self.synchronous}")
+            if self.cache_size is not None:
+                statements.append(f"PRAGMA cache_size = {self.cache_size}")
+            if self.mmap_size is not None:
+                statements.append(f"PRAGMA mmap_size = {self.mmap_size}")
+            if self.temp_store is not None:
+                statements.append(f"PRAGMA temp_store = {self.temp_store}")
+            if self.busy_timeout is not None:
+                statements.append(f"PRAGMA busy_timeout = {self.busy_timeout}")
+        statements.append(f"PRAGMA foreign_keys = {'ON' if self.foreign_keys else 'OFF'}")
+        if self.query_only:
+            statements.append("PRAGMA query_only = ON")
+        return statements
+
+
+PROFILES: Dict[str, ConnectionProfile] = {
+    # Safe default: WAL with a full fsync on every commit
+    "durable": ConnectionProfile(
+        name="durable",
+        journal_mode="WAL",
+        synchronous="FULL",
+        cache_size=-8000,  # 8 MB
+        busy_timeout=5000,
+    ),
+    # Single machine, throughput first: commits survive application
+    # crashes but the last transactions may be lost on power failure
+    "fast-local": ConnectionProfile(
+        name="fast-local",
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size=-64000,  # 64 MB
+        mmap_size=268435456,  # 256 MB
+        temp_store="MEMORY",
+        busy_timeout=5000,
+    ),
+    # Reporting against a database written by someone else
+    "read-only-analytics": ConnectionProfile(
+        name="read-only-analytics",
+        cache_size=-131072,  # 128 MB
+        mmap_size=1073741824,  # 1 GB
+        temp_store="MEMORY",
+        busy_timeout=10000,
+        query_only=True,
+    ),
+}
+
+
+def get_profile(name: Optional[str] = None) -> ConnectionProfile:
+    """Look up a connection profile by name (defaults to SQLITE_PROFILE).
+
+    Raises:
+        ValueError: If the profile doesn't exist
+    """
+    name = name or DEFAULT_DB_PROFILE
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown connection profile '{name}'. Available: {', '.join(PROFILES)}"
+        )
+
+
+def apply_profile(conn, profile: ConnectionProfile, local: bool = True) -> None:
+    """Apply a profile's PRAGMAs to a freshly opened connection."""
+    cursor = conn.cursor()
+    for statement in profile.pragmas(local=local):
+        try:
+            cursor.execute(statement)
+            # journal_mode returns a row; drain it so the statement completes
+            cursor.fetchall()
+        except Exception as e:
+            if local:
+                raise
+            logger.warning("Could not apply '%s' on remote connection: %s", statement, e)
@@ -0,0 +1,223 @@
+"""Lightweight read-side records, decoded straight from query rows.
+
+The iter_* functions stream these instead of pydantic models: a record is
+a tuple, so it has no per-instance dict and costs no validation. Call
+``to_model()`` where a full model is needed, e.g. to return it from a tool.
+
+Rows come from our own schema, so they are trusted: each row is decoded
+into a record by the cursor's row_factory as it is fetched, and
+``to_model()`` builds the model without validating it again (see
+trusted_model). Pydantic validation is kept for what comes from outside,
+i.e. the Command models.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Sequence
+
+from .data_types import FederationPayment, Player, SurfaceType, Tournament
+from .money import from_cents
+from .timestamps import from_day, from_timestamp
+from .utils import normalize_name
+
+# Rows pulled from the cursor at a time while streaming
+FETCH_BATCH_SIZE = 500
+
+PLAYER_COLUMNS = "name, phone, email, created"
+TOURNAMENT_COLUMNS = "id, name, location, date, surface, registration_deadline, created"
+# Columns of federation_payments "fp" joined with the name of their players "p"
+PAYMENT_COLUMNS = "fp.id, p.name, fp.payment_date, fp.amount_cents, fp.notes, fp.created_at"
+# Columns of players "p" followed by the payment status of their registration "tp"
+REGISTRATION_COLUMNS = (
+    "p.name, p.phone, p.email, p.created, tp.has_paid, tp.payment_date, tp.player_id"
+)
+
+# Decodes a (cursor, row) pair, like sqlite3's Cursor.row_factory
+RowFactory = Callable[[Any, Sequence], Any]
+
+_object_setattr = object.__setattr__
+
+
+def trusted_model(model_type, values: Dict[str, Any]):
+    """Build a pydantic model from trusted values, without validating them.
+
+    A leaner ``model_construct`` for the models decoded from our own rows:
+    every field is given, so its per-field default handling is skipped.
+    The models have no private attributes or post-init hooks.
+    """
+    model = model_type.__new__(model_type)
+    _object_setattr(model, "__dict__", values)
+    _object_setattr(model, "__pydantic_fields_set__", set(values))
+    _object_setattr(model, "__pydantic_extra__", None)
+    _object_setattr(model, "__pydantic_private__", None)
+    return model
+
+
+def select(cursor, row_factory: RowFactory, sql: str, params: Sequence = ()):
+    """Run a query whose rows come out decoded by ``row_factory``.
+
+    The query runs on a new cursor of the same connection, and so in the
+    same transaction, with ``row_factory`` (e.g. PlayerRecord.decode) as its
+    row_factory.
+
+    Returns:
+        The cursor, to fetch the decoded rows from
+    """
+    records = cursor.connection.cursor()
+    records.row_factory = row_factory
+    records.execute(sql, params)
+    return records
+
+
+def iter_rows(cursor, batch_size: Optional[int] = None) -> Iterator[Sequence]:
+    """Rows of the cursor's current query, fetched ``batch_size`` at a time.
+
+    Defaults to FETCH_BATCH_SIZE rows per fetch.
+    """
+    batch_size = batch_size or FETCH_BATCH_SIZE
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from rows
+
+
+def iter_records(cursor, row_factory: RowFactory, sql: str, params: Sequence = ()) -> Iterator:
+    """Stream the decoded rows of a query (see select), fetched in batches."""
+    return iter_rows(select(cursor, row_factory, sql, params))
+
+
+class PlayerRecord(NamedTuple):
+    name: str
+    phone: str
+    email: Optional[str]
+    created: datetime
+
+    @classmethod
+    def decode(cls, cursor, row: Sequence) -> "PlayerRecord":
+        """Row factory for PLAYER_COLUMNS."""
+        return cls(row[0], row[1], row[2], from_timestamp(row[3]))
+
+    @staticmethod
+    def decode_model(cursor, row: Sequence) -> Player:
+        """Row factory for PLAYER_COLUMNS that builds the model directly."""
+        return trusted_model(
+            Player,
+            {"name": row[0], "phone": row[1], "email": row[2], "created": from_timestamp(row[3])},
+        )
+
+    def to_model(self) -> Player:
+        return trusted_model(Player, dict(zip(self._fields, self)))
+
+
+class TournamentRecord(NamedTuple):
+    id: int
+    name: str
+    location: str
+    date: date
+    surface: SurfaceType
+    registration_deadline: date
+    created: datetime
+
+    @classmethod
+    def decode(cls, cursor, row: Sequence) -> "TournamentRecord":
+        """Row factory for TOURNAMENT_COLUMNS."""
+        return cls(
+            row[0],
+            row[1],
+            row[2],
+            from_day(row[3]),
+            SurfaceType(row[4]),
+            from_day(row[5]),
+            from_timestamp(row[6]),
+        )
+
+    @classmethod
+    def decode_model(cls, cursor, row: Sequence) -> Tournament:
+        """Row factory for TOURNAMENT_COLUMNS that builds the model."""
+        # Tournament listings are short: reuse the record decoding
+        return cls.decode(cursor, row).to_model()
+
+    def to_model(self) -> Tournament:
+        return trusted_model(Tournament, dict(zip(self._fields, self)))
+
+
+class RegistrationRecord(NamedTuple):
+    """A player registered for a tournament, with their payment status."""
+    player: PlayerRecord
+    has_paid: bool
+    payment_date: Optional[datetime]
+    player_id: int
+
+    @classmethod
+    def decode(cls, cursor, row: Sequence) -> "RegistrationRecord":
+        """Row factory for REGISTRATION_COLUMNS."""
+        return cls(
+            PlayerRecord(row[0], row[1], row[2], from_timestamp(row[3])),
+            bool(row[4]),
+            from_timestamp(row[5]) if row[5] is not None else None,
+            row[6],
+        )
+
+
+class PaymentRecord(NamedTuple):
+    id: int
+    player_name: str
+    payment_date: datetime
+    amount: Decimal
+    notes: Optional[str]
+    created_at: datetime
+
+    @classmethod
+    def decode(cls, cursor, row: Sequence) -> "PaymentRecord":
+        """Row factory for PAYMENT_COLUMNS."""
+        return cls(
+            row[0],
+            row[1],
+            from_timestamp(row[2]),
+            from_cents(row[3]),
+            row[4],
+            from_timestamp(row[5]),
+        )
+
+    @classmethod
+    def decode_model(cls, cursor, row: Sequence) -> FederationPayment:
+        """Row factory for PAYMENT_COLUMNS that builds the model."""
+        # A player's payments are few: reuse the record decoding
+        return cls.decode(cursor, row).to_model()
+
+    def to_model(self) -> FederationPayment:
+        return trusted_model(FederationPayment, dict(zip(self._fields, self)))
+
+
+def fetch_player(cursor, player_name: str) -> PlayerRecord:
+    """Look up a player by name, ignoring case and accents.
+
+    Raises:
+        ValueError: If the player doesn't exist
+    """
+    player = select(
+        cursor,
+        PlayerRecord.decode,
+        f"SELECT {PLAYER_COLUMNS} FROM players WHERE normalized_name = ?",
+        (normalize_name(player_name),),
+    ).fetchone()
+    if not player:
+        raise ValueError(f"Player '{player_name}' not found")
+    return player
+
+
+def fetch_tournament(cursor, tournament_id: int) -> TournamentRecord:
+    """Look up a tournament by ID.
+
+    Raises:
+        ValueError: If the tournament doesn't exist
+    """
+    tournament = select(
+        cursor,
+        TournamentRecord.decode,
+        f"SELECT {TOURNAMENT_COLUMNS} FROM tournaments WHERE id = ?",
+        (tournament_id,),
+    ).fetchone()
+    if not tournament:
+        raise ValueError(f"Tournament with ID {tournament_id} not found")
+    return tournament
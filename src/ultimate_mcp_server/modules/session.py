@@ -0,0 +1,201 @@
+import logging
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+from .constants import DEFAULT_DB_URI
+from .init_db import init_db
+from .pool import get_pool
+
+logger = logging.getLogger(__name__)
+
+
+class Session:
+    """A unit of work: one pooled connection and one transaction.
+
+    Functionality functions accept an optional session. Without one, each
+    call opens its own transaction and commits it. With one, the calls share
+    the session's transaction and nothing is written until the session
+    commits, so a group of operations costs a single connection checkout
+    and a single commit.
+
+    Used as a context manager, the session commits when the block exits
+    normally and rolls back when it raises:
+
+        with Session(db_uri) as session:
+            for name in names:
+                register_player(RegisterPlayerCommand(...), session=session)
+                mark_payment(MarkPaymentCommand(...), session=session)
+
+    Each command runs inside its own savepoint, so a command that fails
+    (e.g. with a ValueError for an unknown player) leaves no partial writes
+    behind and the session can carry on with the next one.
+
+    Commands that keep in-process state in step with the database (such as
+    the name index) register ``after_commit`` callbacks, which only run
+    once their writes are committed, and ``after_rollback`` callbacks, which
+    run if their writes are rolled back instead.
+    """
+
+    def __init__(self, db_uri: str = DEFAULT_DB_URI, immediate: bool = False):
+        """
+        Args:
+            db_uri: Database the session works on
+            immediate: Take the write lock when the transaction starts
+                (BEGIN IMMEDIATE) instead of on the first write. Use it for
+                sessions that write, so concurrent writers wait on
+                busy_timeout up front rather than failing midway.
+        """
+        self.db_uri = db_uri
+        self.immediate = immediate
+        self._conn = None
+        self._in_transaction = False
+        self._savepoint_depth = 0
+        self._after_commit: List[Callable[[], None]] = []
+        self._after_rollback: List[Callable[[], None]] = []
+
+    def __enter__(self) -> "Session":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.close()
+
+    @property
+    def connection(self):
+        """The underlying DB-API connection (opened on demand)."""
+        if self._conn is None:
+            self.open()
+        return self._conn
+
+    def open(self) -> None:
+        """Check out a connection from the pool."""
+        if self._conn is None:
+            init_db(self.db_uri)
+            self._conn = get_pool(self.db_uri).acquire()
+
+    def close(self) -> None:
+        """Return the connection to the pool, discarding uncommitted work."""
+        conn, self._conn = self._conn, None
+        self._in_transaction = False
+        self._savepoint_depth = 0
+        self._after_commit.clear()
+        self._rolled_back(0)
+        if conn is not None:
+            get_pool(self.db_uri).release(conn)
+
+    def cursor(self):
+        """Get a cursor inside the session's transaction, starting it if needed."""
+        conn = self.connection
+        cursor = conn.cursor()
+        if not self._in_transaction:
+            cursor.execute("BEGIN IMMEDIATE" if self.immediate else "BEGIN")
+            self._in_transaction = True
+        return cursor
+
+    def commit(self) -> None:
+        """Commit the work done so far. Later work starts a new transaction."""
+        if self._conn is not None and self._in_transaction:
+            self._conn.commit()
+        self._in_transaction = False
+        self._after_rollback.clear()
+
+        callbacks, self._after_commit = self._after_commit, []
+        _run_callbacks(callbacks, "after_commit")
+
+    def rollback(self) -> None:
+        """Discard the work done since the last commit."""
+        if self._conn is not None and self._in_transaction:
+            self._conn.rollback()
+        self._in_transaction = False
+        self._savepoint_depth = 0
+        self._after_commit.clear()
+        self._rolled_back(0)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once the current transaction commits.
+
+        Callbacks are dropped if the transaction, or the savepoint they were
+        registered in, is rolled back. Errors they raise are logged, since
+        the data is already committed by then.
+        """
+        self._after_commit.append(callback)
+
+    def after_rollback(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` if the current transaction is rolled back.
+
+        That includes rolling back the savepoint the callback was registered
+        in, and closing the session before it commits. Callbacks are dropped
+        once the transaction commits. Errors they raise are logged.
+        """
+        self._after_rollback.append(callback)
+
+    def _rolled_back(self, first: int) -> None:
+        """Run the after_rollback callbacks registered from index ``first`` on."""
+        callbacks = self._after_rollback[first:]
+        del self._after_rollback[first:]
+        _run_callbacks(callbacks, "after_rollback")
+
+    @contextmanager
+    def savepoint(self) -> Iterator["Session"]:
+        """Run a block in a savepoint, undoing only its writes if it raises."""
+        cursor = self.cursor()
+        self._savepoint_depth += 1
+        name = f"sp_{self._savepoint_depth}"
+        callbacks_before = len(self._after_commit)
+        rollback_callbacks_before = len(self._after_rollback)
+        cursor.execute(f"SAVEPOINT {name}")
+        try:
+            yield self
+        except BaseException:
+            if self._in_transaction:
+                cursor.execute(f"ROLLBACK TO {name}")
+                cursor.execute(f"RELEASE {name}")
+                del self._after_commit[callbacks_before:]
+                self._rolled_back(rollback_callbacks_before)
+            raise
+        else:
+            if self._in_transaction:
+                cursor.execute(f"RELEASE {name}")
+        finally:
+            self._savepoint_depth = max(self._savepoint_depth - 1, 0)
+
+
+def _run_callbacks(callbacks: List[Callable[[], None]], kind: str) -> None:
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception:
+            logger.exception("%s callback failed", kind)
+
+
+@contextmanager
+def transaction(
+    db_uri: str, session: Optional[Session] = None, immediate: bool = False
+) -> Iterator[Session]:
+    """Run a functionality call in the caller's session, or in its own one.
+
+    With a session, the block runs in a savepoint of the session's
+    transaction and committing is left to the session's owner. Without one,
+    a new session (BEGIN IMMEDIATE if ``immediate``) is opened and committed
+    when the block succeeds.
+
+    Raises:
+        ValueError: If the session belongs to a different database
+    """
+    if session is None:
+        with Session(db_uri, immediate=immediate) as own_session:
+            yield own_session
+        return
+
+    if session.db_uri != db_uri:
+        raise ValueError(
+            f"Session is bound to {session.db_uri}, but the command targets {db_uri}"
+        )
+    with session.savepoint():
+        yield session
@@ -0,0 +1,40 @@
+"""Storage format of timestamps and dates.
+
+Timestamps are stored as INTEGER microseconds since 1970-01-01 00:00 and
+dates as INTEGER days since 1970-01-01 (see m0005_integer_timestamps).
+Both compare and sort as plain integers, so date filters and orderings
+are index range scans with no string parsing. In the sqlite3 shell they
+read as ``datetime(created / 1000000, 'unixepoch')`` and
+``date(date * 86400, 'unixepoch')``.
+
+Timestamps are naive local times, as returned by ``datetime.now()``, and
+are stored as they are, without a time zone conversion. Aware datetimes
+are converted to local time first.
+"""
+from datetime import date, datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_DAY = _EPOCH.toordinal()
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_timestamp(value: datetime) -> int:
+    """Stored form of a timestamp: microseconds since 1970-01-01."""
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_timestamp(value: int) -> datetime:
+    """Decode a stored timestamp (see to_timestamp)."""
+    return _EPOCH + _MICROSECOND * value
+
+
+def to_day(value: date) -> int:
+    """Stored form of a date: days since 1970-01-01."""
+    return value.toordinal() - _EPOCH_DAY
+
+
+def from_day(value: int) -> date:
+    """Decode a stored date (see to_day)."""
+    return date.fromordinal(value + _EPOCH_DAY)
@@ -0,0 +1,210 @@
+"""In-process cache of tournament rows, by id.
+
+Most commands that take a tournament id read its row first, to check that
+it exists or for its name or registration deadline, and there are only a
+few dozen tournaments. The cache keeps those rows, tagged with the
+tournaments change counter (see m0008_change_counters) they were read at,
+and only serves them to transactions that see the same counter:
+
+- On local databases, PRAGMA data_version tells whether another
+  connection, in this process or another one, committed anything since a
+  connection last read the counter, so the counter is only read again
+  after that happens.
+- On SQLiteCloud the counter is read on every lookup.
+
+add_tournament, update_tournament and remove_tournament empty the cache
+once they commit (see tournaments_changed). The cache holds committed rows
+only: a transaction that changed tournaments reads them from the database
+until it commits.
+"""
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from .constants import TOURNAMENT_CACHE_SIZE
+from .data_types import CacheStats
+from .records import TournamentRecord, fetch_tournament
+from .session import Session
+
+# Connections whose last counter read is remembered, per database; more
+# than a pool's worth means connections were replaced, so start over
+_MAX_SEEN_CONNECTIONS = 64
+
+
+class TournamentCache:
+    """Tournament records of one database, valid for one change counter value."""
+
+    def __init__(self, db_uri: str, max_size: int = TOURNAMENT_CACHE_SIZE):
+        self.db_uri = db_uri
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._tournaments: OrderedDict[int, TournamentRecord] = OrderedDict()
+        # Change counter the cached records were read at (None when empty)
+        self._counter: Optional[int] = None
+        # connection -> (data_version, counter) it last saw
+        self._seen: Dict[object, Tuple[int, int]] = {}
+        self._check_data_version = urlparse(db_uri).scheme != "sqlitecloud"
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tournaments)
+
+    def get(self, session: Session, tournament_id: int) -> TournamentRecord:
+        """Look up a tournament as the session's transaction sees it.
+
+        Raises:
+            ValueError: If the tournament doesn't exist
+        """
+        cursor = session.cursor()
+        if session in _changing_sessions:
+            return fetch_tournament(cursor, tournament_id)
+
+        counter = self._read_counter(session.connection, cursor)
+        with self._lock:
+            if counter == self._counter:
+                tournament = self._tournaments.get(tournament_id)
+                if tournament is not None:
+                    self._tournaments.move_to_end(tournament_id)
+                    self.hits += 1
+                    return tournament
+            self.misses += 1
+
+        tournament = fetch_tournament(cursor, tournament_id)
+        self._store(counter, tournament)
+        return tournament
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tournaments.clear()
+            self._counter = None
+            self._seen.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            name="tournaments",
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._tournaments),
+            max_size=self.max_size,
+        )
+
+    def _read_counter(self, conn, cursor) -> int:
+        if self._check_data_version:
+            cursor.execute("PRAGMA data_version")
+            data_version = cursor.fetchone()[0]
+            with self._lock:
+                seen = self._seen.get(conn)
+            if seen is not None and seen[0] == data_version:
+                return seen[1]
+
+        cursor.execute("SELECT counter FROM change_counters WHERE name = 'tournaments'")
+        counter = cursor.fetchone()[0]
+        if self._check_data_version:
+            with self._lock:
+                if len(self._seen) >= _MAX_SEEN_CONNECTIONS:
+                    self._seen.clear()
+                self._seen[conn] = (data_version, counter)
+        return counter
+
+    def _store(self, counter: int, tournament: TournamentRecord) -> None:
+        with self._lock:
+            if self._counter is None or counter > self._counter:
+                self._tournaments.clear()
+                self._counter = counter
+            elif counter < self._counter:
+                # Read in a transaction that started before a later change
+                return
+            self._tournaments[tournament.id] = tournament
+            self._tournaments.move_to_end(tournament.id)
+            while len(self._tournaments) > self.max_size:
+                self._tournaments.popitem(last=False)
+
+
+# One cache per database URI, and the sessions with uncommitted changes to
+# tournaments, with the number of changes each one has yet to commit or
+# roll back
+_caches: Dict[str, TournamentCache] = {}
+_changing_sessions: "weakref.WeakKeyDictionary[Session, int]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_tournament_cache(db_uri: str) -> TournamentCache:
+    """Get the tournament cache of a database, creating it on first use."""
+    cache = _caches.get(db_uri)
+    if cache is not None:
+        return cache
+
+    with _caches_lock:
+        return _caches.setdefault(db_uri, TournamentCache(db_uri))
+
+
+def cached_tournament(session: Session, tournament_id: int) -> TournamentRecord:
+    """Look up a tournament by ID, from the cache when it is up to date.
+
+    A drop-in for records.fetch_tournament for callers that hold a session.
+
+    Raises:
+        ValueError: If the tournament doesn't exist
+    """
+    return get_tournament_cache(session.db_uri).get(session, tournament_id)
+
+
+def tournaments_changed(session: Session) -> None:
+    """Record that the session's transaction added, changed or removed tournaments.
+
+    Until it commits, the session reads tournaments from its transaction
+    instead of the cache; once it commits, the cache of its database is
+    emptied. If the change is rolled back, with its savepoint or the whole
+    transaction, the session goes back to the cache unless it made other
+    changes that are still pending.
+    """
+    with _caches_lock:
+        _changing_sessions[session] = _changing_sessions.get(session, 0) + 1
+
+    def committed() -> None:
+        with _caches_lock:
+            _changing_sessions.pop(session, None)
+        reset_tournament_cache(session.db_uri)
+
+    def rolled_back() -> None:
+        with _caches_lock:
+            pending = _changing_sessions.pop(session, 0) - 1
+            if pending > 0:
+                _changing_sessions[session] = pending
+
+    session.after_commit(committed)
+    session.after_rollback(rolled_back)
+
+
+def reset_tournament_cache(db_uri: Optional[str] = None) -> None:
+    """Empty the tournament cache of a database (or of every database).
+
+    Changes made by other processes are noticed without it; use it when
+    the database file itself was replaced, e.g. by restoring a backup.
+    """
+    with _caches_lock:
+        caches = list(_caches.values()) if db_uri is None else [_caches.get(db_uri)]
+    for cache in caches:
+        if cache is not None:
+            cache.clear()
+
+
+def tournament_cache_stats() -> List[CacheStats]:
+    """Hit and miss counters of the tournament caches, added up over databases."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    if not caches:
+        return []
+    stats = [cache.stats() for cache in caches]
+    return [
+        CacheStats(
+            name="tournaments",
+            hits=sum(s.hits for s in stats),
+            misses=sum(s.misses for s in stats),
+            size=sum(s.size for s in stats),
+            max_size=sum(s.max_size for s in stats),
+        )
+    ]
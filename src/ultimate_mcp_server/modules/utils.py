@@ -1,64 +1,294 @@
 import os
 import sqlite3
 import sqlitecloud
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from heapq import heappush, heapreplace
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 import difflib
+import unicodedata
 
-from .constants import DEFAULT_DB_URI
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional (the "fast" extra); batch scoring then skips its pre-filter
+    np = None
 
-def get_connection(db_uri: str = DEFAULT_DB_URI):
+from .constants import DEFAULT_DB_URI, NAME_CACHE_SIZE, SCORE_CACHE_QUERIES, SCORE_CACHE_SIZE
+from .data_types import CacheStats
+from .phonetic import phonetic_code, phonetic_codes, phonetic_key
+from .profiles import apply_profile, get_profile
+
+# Score of a name that sounds like the query (see phonetic.py)
+PHONETIC_MATCH_SCORE = 0.8
+# Shorter query codes (e.g. "Bo" -> "B") would sound like too many names
+MIN_PHONETIC_CODE_LENGTH = 2
+# Character counts compared per NumPy block in batch scoring (queries x names x letters)
+BATCH_BLOCK_CELLS = 1 << 22
+
+def get_connection(db_uri: str = DEFAULT_DB_URI, profile: Optional[str] = None):
     """Get a database connection based on the URI scheme.
     
     Supports two URI schemes:
     - sqlitecloud:// for SQLiteCloud connections
     - file:// for local SQLite database files
     
+    This always opens a new connection. Functionality modules should use
+    ``pool.connection()`` instead, which reuses connections per URI.
+    Local connections are created with ``check_same_thread=False`` so the
+    pool can hand them out to any thread (one holder at a time).
+    
     Args:
         db_uri: The database URI to connect to
+        profile: Name of the PRAGMA profile to apply (see profiles.py),
+            defaults to the SQLITE_PROFILE environment variable
         
     Returns:
         A database connection object
     """
-    # Handle test database paths provided as strings
-    if isinstance(db_uri, (str, Path)) and 'temp' in str(db_uri).lower():
-        return sqlite3.connect(db_uri)
-    
+    connection_profile = get_profile(profile)
+
     # Parse the URI to determine which connection type to use
     parsed_uri = urlparse(db_uri)
     
     if parsed_uri.scheme == 'sqlitecloud':
         # SQLiteCloud connection
-        return sqlitecloud.connect(db_uri)
+        conn = sqlitecloud.connect(db_uri)
+        apply_profile(conn, connection_profile, local=False)
+        return conn
+
+    # Handle test database paths provided as strings
+    if isinstance(db_uri, (str, Path)) and 'temp' in str(db_uri).lower():
+        db_path = db_uri
     elif parsed_uri.scheme == 'file':
         # Local SQLite connection
         # Remove the leading '/' for Windows compatibility
         db_path = parsed_uri.path
         if os.name == 'nt' and db_path.startswith('/'):
             db_path = db_path[1:]
-        return sqlite3.connect(db_path)
     else:
         # Assume it's a file path for backward compatibility
-        return sqlite3.connect(db_uri)
+        db_path = db_uri
+
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    apply_profile(conn, connection_profile, local=True)
+    return conn
+
+
+def ensure_db_directory(db_uri: str = DEFAULT_DB_URI) -> None:
+    """Create the parent directory of a local (file://) database if needed."""
+    if db_uri.startswith("file://"):
+        db_path = Path(db_uri.replace("file://", ""))
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+
+# Rosters and search queries repeat the same names over and over
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def normalize_name(name: str) -> str:
+    """Key under which a player name is stored and compared.
+
+    Casefolds, strips diacritics and collapses whitespace, so "José  Núñez",
+    "jose nunez" and "JOSE NUÑEZ" all give "jose nunez". Players are looked
+    up by this key (players.normalized_name), and fuzzy matching compares
+    normalized names too.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def name_tokens(normalized_name: str) -> Tuple[str, ...]:
+    """Words of a normalized name (see normalize_name)."""
+    return tuple(normalized_name.split())
+
+
+_NAME_CACHES = (normalize_name, name_tokens, phonetic_code, phonetic_key)
+
+# ScoreCache key: a normalized query and whether sound-alike names get the floor
+ScoreKey = Tuple[str, bool]
+
+
+class ScoreCache:
+    """LRU cache of player_match_score results, grouped by normalized query.
+
+    Scores only depend on the query, the name and whether phonetic scoring
+    is on, so they never go stale; each query's plain and phonetic scores
+    are kept apart, under its (query, phonetic) key.
+
+    Agents tend to repeat a search (or page through it), and each repeat
+    finds its scores here instead of running difflib again. The least
+    recently searched queries are dropped once more than ``max_queries``
+    are cached or their scores add up to more than ``max_size``.
+
+    A score computed with a ``min_score`` bar may be a lower bound rather
+    than the exact value (see fuzzy_match_score), so it is kept with its
+    bar and only reused when it is exact or the new bar is at least as high.
+    """
+
+    def __init__(self, max_queries: int = SCORE_CACHE_QUERIES, max_size: int = SCORE_CACHE_SIZE):
+        self.max_queries = max_queries
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # (query, phonetic) -> {name: (score, min_score it was computed with)}
+        self._queries: OrderedDict[ScoreKey, Dict[str, Tuple[float, float]]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def scores_for(self, key: ScoreKey) -> Dict[str, Tuple[float, float]]:
+        """Cached scores of a (normalized query, phonetic) key, marking it as recently used."""
+        with self._lock:
+            scores = self._queries.get(key)
+            if scores is None:
+                scores = self._queries[key] = {}
+                self._evict(keep=key)
+            else:
+                self._queries.move_to_end(key)
+            return scores
+
+    def store(self, key: ScoreKey, scores: Dict[str, Tuple[float, float]],
+              new_scores: Dict[str, Tuple[float, float]], hits: int, misses: int) -> None:
+        """Add the scores computed by one search and count its cache hits and misses."""
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            if self._queries.get(key) is not scores:
+                # Evicted or cleared while the search ran
+                return
+            for name, entry in new_scores.items():
+                if name not in scores:
+                    if self._size >= self.max_size:
+                        self._evict(keep=key)
+                        if self._size >= self.max_size:
+                            break
+                    self._size += 1
+                scores[name] = entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._queries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            name="match_scores",
+            hits=self.hits,
+            misses=self.misses,
+            size=self._size,
+            max_size=self.max_size,
+        )
+
+    def _evict(self, keep: ScoreKey) -> None:
+        while self._queries and (
+            len(self._queries) > self.max_queries or self._size >= self.max_size
+        ):
+            oldest = next(iter(self._queries))
+            if oldest == keep:
+                break
+            self._size -= len(self._queries.pop(oldest))
 
 
-def fuzzy_match_score(str1: str, str2: str) -> float:
+_score_cache = ScoreCache()
+
+
+def cache_stats() -> List[CacheStats]:
+    """Hit and miss counters of the fuzzy search caches of this process.
+
+    Shows whether repeated searches reuse work: normalized names, their
+    word lists and phonetic codes, and the scores of recent queries.
+    """
+    stats = []
+    for func in _NAME_CACHES:
+        info = func.cache_info()
+        stats.append(
+            CacheStats(
+                name=func.__name__,
+                hits=info.hits,
+                misses=info.misses,
+                size=info.currsize,
+                max_size=info.maxsize,
+            )
+        )
+    stats.append(_score_cache.stats())
+    return stats
+
+
+def clear_caches() -> None:
+    """Empty the fuzzy search caches and reset their counters."""
+    for func in _NAME_CACHES:
+        func.cache_clear()
+    _score_cache.clear()
+
+
+def find_player(cursor, name: str) -> Optional[Tuple[int, str]]:
+    """Id and stored name of the player a name refers to, ignoring case and accents.
+
+    A single lookup on the unique players.normalized_name index.
+
+    Returns:
+        The player's id and name as stored, or None if there is no such player
+    """
+    cursor.execute(
+        "SELECT id, name FROM players WHERE normalized_name = ?", (normalize_name(name),)
+    )
+    row = cursor.fetchone()
+    return (row[0], row[1]) if row else None
+
+
+def save_phonetic_codes(cursor, names: Iterable[str]) -> None:
+    """Store the sound-alike codes of newly added players (player_phonetic_codes).
+
+    search_paid_players reads them to find the sound-alike candidates that
+    share too few characters with the query (NameIndex computes its codes in
+    memory). Players are never renamed, so the codes only need writing on
+    insert; they are deleted along with their player.
+    """
+    cursor.executemany(
+        """
+        INSERT OR IGNORE INTO player_phonetic_codes (code, player_id)
+        SELECT ?, id FROM players WHERE name = ?
+        """,
+        [(code, name) for name in names for code in phonetic_codes(normalize_name(name))],
+    )
+
+
+def fuzzy_match_score(str1: str, str2: str, min_score: float = 0.0) -> float:
     """Calculate a similarity score between two strings.
     
     Handles partial matches by checking if the first string is contained
     in the second string, in addition to using difflib for fuzzy matching.
+    Both strings are normalized first (see normalize_name), so case, accents
+    and extra spaces don't affect the score.
+    
+    With ``min_score``, difflib's cheap upper bounds (real_quick_ratio, which
+    only compares lengths, then quick_ratio, which compares character
+    counts) are checked first, and pairs that cannot reach ``min_score``
+    get 0.0 without computing the full ratio.
     
     Args:
         str1: First string to compare (query)
         str2: Second string to compare (target)
+        min_score: Scores below this are not needed exactly
         
     Returns:
-        A float between 0 and 1, where 1 means perfect match
+        A float between 0 and 1, where 1 means perfect match. Scores of at
+        least ``min_score`` are always exact.
     """
     # Normalize strings for better matching
-    s1 = str1.lower().strip()
-    s2 = str2.lower().strip()
-    
+    return _normalized_match_score(normalize_name(str1), normalize_name(str2), min_score)
+
+
+def _normalized_match_score(s1: str, s2: str, min_score: float) -> float:
+    """fuzzy_match_score for strings that are already normalized."""
     # Check for exact match
     if s1 == s2:
         return 1.0
@@ -70,8 +300,8 @@ def fuzzy_match_score(str1: str, str2: str) -> float:
         return 0.9 * (len(s1) / len(s2))
     
     # For names, also check if individual parts match
-    words1 = s1.split()
-    words2 = s2.split()
+    words1 = name_tokens(s1)
+    words2 = name_tokens(s2)
     
     if len(words1) == 1 and len(words2) > 1:
         # If the query is a single word, check if it matches any part of the target name
@@ -84,4 +314,399 @@ def fuzzy_match_score(str1: str, str2: str) -> float:
                 return 0.75 * (min(len(s1), len(word)) / max(len(s1), len(word)))
     
     # Use difflib's SequenceMatcher for general fuzzy matching
-    return difflib.SequenceMatcher(None, s1, s2).ratio()
\ No newline at end of file
+    matcher = difflib.SequenceMatcher(None, s1, s2)
+    if min_score > 0 and (
+        matcher.real_quick_ratio() < min_score or matcher.quick_ratio() < min_score
+    ):
+        return 0.0
+    return matcher.ratio()
+
+def player_match_score(
+    name_query: str, name: str, min_score: float = 0.0, phonetic: bool = False
+) -> float:
+    """Best fuzzy score of a search query against a player's name.
+
+    Scores the query against the full name and against each part of it, so
+    searching for a first name or a surname alone still matches well.
+
+    With ``phonetic``, a name whose words sound like the query (same
+    phonetic codes, e.g. "Gonzales" for "Juan González") scores at least
+    PHONETIC_MATCH_SCORE. This floor also raises names that already
+    matched, so it is off by default: a sound-alike name whose plain fuzzy
+    score is below 0.8 then scores 0.8, which can let it pass a higher
+    threshold and rank above names it would otherwise rank below.
+
+    Args:
+        name_query: The search query
+        name: The player's full name
+        min_score: Scores below this are not needed exactly (see
+            fuzzy_match_score), which lets hopeless names be skipped early
+        phonetic: Raise the score of sound-alike names to PHONETIC_MATCH_SCORE
+
+    Returns:
+        A float between 0 and 1, where 1 means perfect match. Scores of at
+        least ``min_score`` are always exact.
+    """
+    query = normalize_name(name_query)
+    key = (query, phonetic)
+    scores = _score_cache.scores_for(key)
+    new_scores: Dict[str, Tuple[float, float]] = {}
+    score, hit = _cached_match_score(
+        query, normalize_name(name), min_score, phonetic, scores, new_scores
+    )
+    _score_cache.store(key, scores, new_scores, int(hit), int(not hit))
+    return score
+
+
+def _cached_match_score(
+    query: str,
+    name: str,
+    min_score: float,
+    phonetic: bool,
+    scores: Dict[str, Tuple[float, float]],
+    new_scores: Dict[str, Tuple[float, float]],
+) -> Tuple[float, bool]:
+    """player_match_score of normalized strings, looked up in a query's cached scores.
+
+    Computed scores are added to ``new_scores``, for ScoreCache.store.
+
+    Returns:
+        The score, and whether it came from the cache
+    """
+    cached = scores.get(name)
+    if cached is not None:
+        score, bar = cached
+        # Exact, or below a bar at most as high as this one
+        if score >= bar or min_score >= bar:
+            return score, True
+    score = _player_match_score(query, name, min_score, phonetic)
+    new_scores[name] = (score, min_score)
+    return score, False
+
+
+def _player_match_score(
+    query: str, name: str, min_score: float, phonetic: bool = False
+) -> float:
+    """player_match_score for strings that are already normalized."""
+    name_parts = name_tokens(name)
+
+    # 1. Special case for first name searching
+    match_score = 0.0
+    if name_parts and len(name_tokens(query)) == 1 and query == name_parts[0]:
+        match_score = 0.9  # High score for first name match
+
+    # 2. Sound-alike words, in the same order as in the query. This floor
+    # also raises the score of names the plain fuzzy score already matched.
+    if phonetic and _sounds_like(query, name):
+        match_score = max(match_score, PHONETIC_MATCH_SCORE)
+
+    # 3. Full name match, then each name part separately. A part only needs
+    # an exact score if it can beat the best one so far.
+    for target in (name,) + name_parts:
+        match_score = max(
+            match_score, _normalized_match_score(query, target, max(min_score, match_score))
+        )
+
+    return match_score
+
+
+def _sounds_like(query: str, name: str) -> bool:
+    """Whether the words of a normalized name sound like a normalized query, in order."""
+    query_key = phonetic_key(query)
+    if len(query_key.replace(" ", "")) < MIN_PHONETIC_CODE_LENGTH:
+        return False
+    return f" {query_key} " in f" {phonetic_key(name)} "
+
+
+def top_player_matches(
+    name_query: str,
+    items: Iterable[Any],
+    threshold: float,
+    limit: int,
+    name_of: Callable[[Any], str] = lambda item: item,
+    phonetic: bool = False,
+) -> List[Tuple[Any, float]]:
+    """Best ``limit`` items whose name scores at least ``threshold`` against a query.
+
+    Keeps a heap of the best ``limit`` matches seen so far. Once it is full,
+    its lowest score becomes the bar the next names must reach, so most of
+    them are rejected by player_match_score's early-exit bounds instead of
+    being scored in full. Ties go to the item seen first, so pass the items
+    in the order ties should be broken (e.g. sorted by name). Scores of
+    names this query was already matched against come from the ScoreCache.
+
+    Args:
+        name_query: The search query
+        items: The items to search, such as names or database rows
+        threshold: Minimum score (0-1) an item needs to be returned
+        limit: Maximum number of results
+        name_of: Gets the player name of an item
+        phonetic: Give sound-alike names the phonetic floor (see
+            player_match_score)
+
+    Returns:
+        (item, score) pairs, best match first
+    """
+    if limit <= 0:
+        return []
+
+    query = normalize_name(name_query)
+    key = (query, phonetic)
+    scores = _score_cache.scores_for(key)
+    new_scores: Dict[str, Tuple[float, float]] = {}
+    hits = misses = 0
+
+    def score_of(item: Any, bar: float) -> float:
+        nonlocal hits, misses
+        score, hit = _cached_match_score(
+            query, normalize_name(name_of(item)), bar, phonetic, scores, new_scores
+        )
+        hits += hit
+        misses += not hit
+        return score
+
+    matches = _select_top(items, threshold, limit, score_of)
+    _score_cache.store(key, scores, new_scores, hits, misses)
+    return matches
+
+
+def _select_top(
+    items: Iterable[Any],
+    threshold: float,
+    limit: int,
+    score_of: Callable[[Any, float], float],
+) -> List[Tuple[Any, float]]:
+    """Heap selection behind top_player_matches, for any scoring function.
+
+    ``score_of(item, bar)`` only needs to be exact for scores of at least
+    ``bar``, like player_match_score with ``min_score``.
+    """
+    if limit <= 0:
+        return []
+
+    # Min-heap of (score, -position, item): the root is the worst match kept
+    heap: List[Tuple[float, int, Any]] = []
+    for position, item in enumerate(items):
+        full = len(heap) == limit
+        bar = max(threshold, heap[0][0]) if full else threshold
+        score = score_of(item, bar)
+        if score < threshold:
+            continue
+        if not full:
+            heappush(heap, (score, -position, item))
+        elif score > heap[0][0]:
+            heapreplace(heap, (score, -position, item))
+
+    heap.sort(reverse=True)
+    return [(item, score) for score, _, item in heap]
+
+
+def batch_match_scores(
+    queries: Sequence[str],
+    targets: Sequence[str],
+    min_score: float = 0.0,
+    phonetic: bool = False,
+) -> List[List[float]]:
+    """player_match_score of every query against every target.
+
+    For reconciling whole lists, such as the payers of a bank export
+    against the roster. With NumPy installed, pairs that cannot reach
+    ``min_score`` are ruled out in bulk first (see _batch_candidates);
+    the remaining ones are scored exactly like player_match_score. Batch
+    scores bypass the per-query ScoreCache, which is sized for searches.
+
+    Args:
+        queries: The names to look up
+        targets: The names to look them up in
+        min_score: Scores below this are reported as 0.0
+        phonetic: Give sound-alike names the phonetic floor (see
+            player_match_score)
+
+    Returns:
+        One row per query, with one score per target in target order
+    """
+    query_keys = [normalize_name(query) for query in queries]
+    target_keys = [normalize_name(target) for target in targets]
+    matrix = []
+    for query, candidates in zip(
+        query_keys, _batch_candidates(query_keys, target_keys, min_score, phonetic)
+    ):
+        row = [0.0] * len(target_keys)
+        for index in candidates:
+            score = _player_match_score(query, target_keys[index], min_score, phonetic)
+            if score >= min_score:
+                row[index] = score
+        matrix.append(row)
+    return matrix
+
+
+def batch_top_matches(
+    queries: Sequence[str],
+    targets: Sequence[str],
+    threshold: float = 0.6,
+    limit: int = 10,
+    phonetic: bool = False,
+) -> List[List[Tuple[str, float]]]:
+    """Best ``limit`` targets of each query, like top_player_matches for many queries.
+
+    Ties go to the target listed first. See batch_match_scores for how
+    pairs are pruned.
+
+    Args:
+        queries: The names to look up
+        targets: The names to look them up in
+        threshold: Minimum score (0-1) a target needs to be returned
+        limit: Maximum number of results per query
+        phonetic: Give sound-alike names the phonetic floor (see
+            player_match_score)
+
+    Returns:
+        One list of (target, score) pairs per query, best match first
+    """
+    query_keys = [normalize_name(query) for query in queries]
+    target_keys = [normalize_name(target) for target in targets]
+    results = []
+    for query, candidates in zip(
+        query_keys, _batch_candidates(query_keys, target_keys, threshold, phonetic)
+    ):
+        matches = _select_top(
+            candidates,
+            threshold,
+            limit,
+            lambda index, bar: _player_match_score(query, target_keys[index], bar, phonetic),
+        )
+        results.append([(targets[index], score) for index, score in matches])
+    return results
+
+
+def match_candidates(
+    query: str, targets: Sequence[str], threshold: float, phonetic: bool = False
+) -> List[int]:
+    """Indexes of the targets that may score at least ``threshold`` against a query.
+
+    A pre-filter that never drops a match: targets are only ruled out when
+    the character-count upper bound of every rule of player_match_score
+    (see _batch_candidates) is below the threshold. Indexes are in target
+    order; without NumPy every target is a candidate.
+    """
+    target_keys = [normalize_name(target) for target in targets]
+    return next(
+        _batch_candidates([normalize_name(query)], target_keys, threshold, phonetic)
+    )
+
+
+def common_chars_needed(query: str, threshold: float) -> int:
+    """Characters a name must share with a normalized query to score ``threshold``.
+
+    Shared characters are counted with repeats, as in difflib's
+    quick_ratio. Every rule of player_match_score but the phonetic floor
+    scores at most the quick_ratio of the query against the full name or
+    one of its words (see _batch_candidates), and a word shares at most the
+    C characters the full name does, so a name scores at most
+    2 * C / (len(query) + C). Names sharing fewer characters than this can
+    be skipped without scoring them, unless phonetic scoring is on and
+    they sound like the query (see sound_alike_codes).
+
+    Returns:
+        A count from 0 to len(query), or len(query) + 1 if the threshold
+        can't be reached
+    """
+    length = len(query)
+    for common in range(length + 1):
+        if (2.0 * common / (length + common) if common else 0.0) >= threshold:
+            return common
+    return length + 1
+
+
+def sound_alike_codes(query: str, threshold: float) -> List[str]:
+    """Codes a name needs to get the phonetic floor for a normalized query.
+
+    A name whose words sound like the query's has every one of the query's
+    word codes (see phonetic_codes). Empty when the floor can't reach the
+    threshold or the query is too short to sound like anything.
+    """
+    if threshold > PHONETIC_MATCH_SCORE:
+        return []
+    if len(phonetic_key(query).replace(" ", "")) < MIN_PHONETIC_CODE_LENGTH:
+        return []
+    return phonetic_codes(query)
+
+
+def _batch_candidates(
+    query_keys: List[str], target_keys: List[str], threshold: float, phonetic: bool = False
+) -> Iterator[List[int]]:
+    """Indexes of the targets each normalized query may score at least ``threshold`` against.
+
+    Every rule of player_match_score except the phonetic floor scores at
+    most difflib's quick_ratio of the query against the full name or one of
+    its words: the share of characters the two have in common, counted
+    with repeats. NumPy computes that bound for all pairs at once from
+    per-string character counts, and with ``phonetic`` the phonetic floor
+    is checked through the words' codes. Without NumPy every target is a
+    candidate.
+    """
+    if np is None or threshold <= 0 or not target_keys:
+        for _ in query_keys:
+            yield list(range(len(target_keys)))
+        return
+
+    # Each target is compared as a whole and word by word; starts[i] is the
+    # row of target i's full name, followed by the rows of its words
+    variants: List[str] = []
+    starts = []
+    for key in target_keys:
+        starts.append(len(variants))
+        variants.append(key)
+        variants.extend(name_tokens(key))
+    vocabulary = {
+        char: column
+        for column, char in enumerate(sorted(set("".join(query_keys)) | set("".join(variants))))
+    }
+    query_counts = _char_counts(query_keys, vocabulary)
+    variant_counts = _char_counts(variants, vocabulary)
+    query_lengths = query_counts.sum(axis=1)
+    variant_lengths = variant_counts.sum(axis=1)
+
+    # Names that sound like a query get the phonetic floor whatever their letters
+    codes_index: Dict[str, set] = {}
+    if phonetic and threshold <= PHONETIC_MATCH_SCORE:
+        for index, key in enumerate(target_keys):
+            for code in phonetic_codes(key):
+                codes_index.setdefault(code, set()).add(index)
+
+    block = max(1, BATCH_BLOCK_CELLS // variant_counts.size) if variant_counts.size else 1
+    for first in range(0, len(query_keys), block):
+        counts = query_counts[first:first + block]
+        common = np.minimum(counts[:, None, :], variant_counts[None, :, :]).sum(axis=2)
+        lengths = query_lengths[first:first + block, None] + variant_lengths[None, :]
+        # Same arithmetic as difflib, so bounds compare exactly with scores
+        bounds = np.where(lengths > 0, 2.0 * common / np.maximum(lengths, 1), 1.0)
+        name_bounds = np.maximum.reduceat(bounds, starts, axis=1)
+        for query, reachable in zip(query_keys[first:first + block], name_bounds >= threshold):
+            candidates = set(np.flatnonzero(reachable).tolist())
+            if codes_index:
+                candidates.update(_sound_alike_targets(query, target_keys, codes_index))
+            yield sorted(candidates)
+
+
+def _sound_alike_targets(
+    query: str, target_keys: List[str], codes_index: Dict[str, set]
+) -> Iterable[int]:
+    """Targets getting player_match_score's phonetic floor for a normalized query."""
+    query_key = phonetic_key(query)
+    if len(query_key.replace(" ", "")) < MIN_PHONETIC_CODE_LENGTH:
+        return ()
+    codes = query_key.split()
+    sharing = set.intersection(*(codes_index.get(code, set()) for code in codes))
+    return [index for index in sharing if _sounds_like(query, target_keys[index])]
+
+
+def _char_counts(texts: List[str], vocabulary: Dict[str, int]):
+    """Matrix of how many times each character of ``vocabulary`` occurs in each text."""
+    counts = np.zeros((len(texts), len(vocabulary)), dtype=np.int16)
+    rows = np.repeat(np.arange(len(texts)), [len(text) for text in texts])
+    columns = np.fromiter(
+        (vocabulary[char] for text in texts for char in text), dtype=np.intp, count=len(rows)
+    )
+    np.add.at(counts, (rows, columns), 1)
+    return counts
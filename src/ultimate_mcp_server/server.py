@@ -1,7 +1,8 @@
 import logging
 from contextlib import asynccontextmanager
+from decimal import Decimal
 from pathlib import Path
-from typing import Dict, Any, AsyncIterator
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 
 from mcp.server.fastmcp import FastMCP, Context
 from pydantic import BaseModel, Field
@@ -12,6 +13,7 @@ from .modules.data_types import (
     RemovePlayerCommand,
     BackupCommand,
     ImportPlayersCommand,
+    ExportPlayersCommand,
     AddTournamentCommand,
     ListTournamentsCommand,
     UpdateTournamentCommand,
@@ -25,21 +27,32 @@ from .modules.data_types import (
     AddFederationPaymentCommand,
     RemoveLastFederationPaymentCommand,
     ListFederationPaymentsCommand,
+    FederationPaymentTotalsCommand,
     SearchPaidPlayersCommand,
+    SearchPlayersCommand,
+    BatchCommand,
+    BatchMode,
+    BatchOperation,
+    FederationPayment,
+    Player,
     SurfaceType,
 )
 from .modules.functionality.add_player import add_player
-from .modules.functionality.list_players import list_players
+from .modules.functionality.list_players import PLAYERS_PAGE, list_player_records
 from .modules.functionality.remove_player import remove_player
 from .modules.functionality.backup import backup
 from .modules.functionality.import_players import import_players
+from .modules.functionality.export_players import export_players
 from .modules.functionality.add_tournament import add_tournament
-from .modules.functionality.list_tournaments import list_tournaments
+from .modules.functionality.list_tournaments import TOURNAMENTS_PAGE, list_tournaments
 from .modules.functionality.update_tournament import update_tournament
 from .modules.functionality.remove_tournament import remove_tournament
 from .modules.functionality.register_player import register_player
 from .modules.functionality.unregister_player import unregister_player
-from .modules.functionality.list_tournament_players import list_tournament_players
+from .modules.functionality.list_tournament_players import (
+    REGISTRATIONS_PAGE,
+    list_tournament_player_records,
+)
 from .modules.functionality.list_player_tournaments import list_player_tournaments
 from .modules.functionality.mark_payment import mark_payment
 from .modules.functionality.clear_payment import clear_payment
@@ -47,9 +60,32 @@ from .modules.functionality.add_federation_payment import add_federation_payment
 from .modules.functionality.remove_last_federation_payment import (
     remove_last_federation_payment,
 )
-from .modules.functionality.list_federation_payments import list_federation_payments
+from .modules.functionality.list_federation_payments import (
+    PAYMENTS_PAGE,
+    list_federation_payments,
+)
+from .modules.functionality.federation_payment_totals import (
+    PaymentTotals,
+    federation_payment_totals,
+)
 from .modules.functionality.search_paid_players import search_paid_players
-from .modules.constants import DEFAULT_DB_URI
+from .modules.functionality.search_players import search_players
+from .modules.functionality.run_batch import BATCH_OPERATIONS, run_batch
+from .modules.constants import (
+    DEFAULT_DB_URI,
+    DEFAULT_DB_PROFILE,
+    MATCH_PARALLEL_MIN_CANDIDATES,
+    MATCH_PROCESSES,
+    TOOL_CONCURRENCY,
+    TOOL_MAX_WORKERS,
+    TOOL_TIMEOUT,
+)
+from .modules.executor import configure_executor, get_executor, run_tool
+from .modules.parallel import configure_matcher, get_matcher
+from .modules.pool import configure_pool
+from .modules.session import Session
+from .modules.tournament_cache import tournament_cache_stats
+from .modules.utils import cache_stats
 from datetime import date as date_type, datetime
 
 logger = logging.getLogger(__name__)
@@ -61,6 +97,26 @@ class ServerConfig(BaseModel):
     db_uri: str = Field(
         default=DEFAULT_DB_URI, description="Database URI (sqlitecloud:// or file://)"
     )
+    db_profile: str = Field(
+        default=DEFAULT_DB_PROFILE,
+        description="SQLite connection profile (durable, fast-local, read-only-analytics)",
+    )
+    tool_max_workers: int = Field(
+        default=TOOL_MAX_WORKERS, description="Threads running blocking database work"
+    )
+    tool_concurrency: int = Field(
+        default=TOOL_CONCURRENCY, description="Maximum tool calls running at once"
+    )
+    tool_timeout: float = Field(
+        default=TOOL_TIMEOUT, description="Default tool timeout in seconds (0 disables)"
+    )
+    match_processes: int = Field(
+        default=MATCH_PROCESSES, description="Processes scoring large fuzzy searches (1 disables)"
+    )
+    match_parallel_min_candidates: int = Field(
+        default=MATCH_PARALLEL_MIN_CANDIDATES,
+        description="Names a fuzzy search must score before it uses the worker processes",
+    )
 
 
 @asynccontextmanager
@@ -69,13 +125,53 @@ async def server_lifespan(mcp_server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     # Server startup
     logger.info("Starting Ultimate Team MCP server")
 
+    config = ServerConfig()
+    configure_pool(config.db_uri, profile=config.db_profile)
+    logger.info("Using '%s' connection profile", config.db_profile)
+    configure_executor(
+        max_workers=config.tool_max_workers,
+        max_concurrency=config.tool_concurrency,
+        default_timeout=config.tool_timeout,
+    )
+    configure_matcher(
+        processes=config.match_processes,
+        min_candidates=config.match_parallel_min_candidates,
+    )
+
     # Return empty context - we'll pass db_uri to each tool function
     yield {
-        "db_uri": DEFAULT_DB_URI,
+        "db_uri": config.db_uri,
+        "db_profile": config.db_profile,
     }
 
     # Server shutdown
     logger.info("Shutting down Ultimate Team MCP server")
+    get_executor().shutdown(wait=False, cancel_futures=True)
+    get_matcher().shutdown(wait=False)
+
+
+def _join_page(lines: List[str], next_token: Optional[str]) -> str:
+    """Join a listing's lines, telling how to get the next page if there may be one."""
+    if next_token:
+        lines.append(f'More results may follow: call again with after="{next_token}"')
+    return "\n".join(lines)
+
+
+def _federation_payments_with_totals(
+    command: ListFederationPaymentsCommand,
+) -> Tuple[Player, List[FederationPayment], PaymentTotals]:
+    """A page of a player's federation payments and the totals over all of them.
+
+    Both are read in one transaction, so the totals match the page.
+    """
+    with Session(command.db_uri) as session:
+        player, payments = list_federation_payments(command, session)
+        # Added up by SQLite, over every payment of the player, not just this page
+        totals = federation_payment_totals(
+            FederationPaymentTotalsCommand(player_name=player.name, db_uri=command.db_uri),
+            session,
+        )
+    return player, payments, totals
 
 
 # Create the FastMCP server instance
@@ -89,7 +185,7 @@ mcp = FastMCP(
 
 # Add tool for adding a player
 @mcp.tool(name="add-player")
-def add_player_tool(
+async def add_player_tool(
     ctx: Context,
     name: str = Field(..., description="Player's name"),
     phone: str = Field(..., description="Player's phone number"),
@@ -102,21 +198,24 @@ def add_player_tool(
         email=email,
         db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
-    player = add_player(command)
+    player = await run_tool("add-player", add_player, command)
     return f"Player '{player.name}' added successfully"
 
 
 # Add tool for listing players
 @mcp.tool(name="list-players")
-def list_players_tool(
+async def list_players_tool(
     ctx: Context,
     limit: int = Field(1000, description="Maximum number of players to list"),
+    after: Optional[str] = Field(
+        None, description="Page token printed by the previous call, to get the next page"
+    ),
 ) -> str:
-    """List players in the database."""
+    """List players in the database, by name."""
     command = ListPlayersCommand(
-        limit=limit, db_uri=ctx.request_context.lifespan_context["db_uri"]
+        limit=limit, after=after, db_uri=ctx.request_context.lifespan_context["db_uri"]
     )
-    players = list_players(command)
+    players = await run_tool("list-players", list_player_records, command)
 
     if not players:
         return "No players found"
@@ -126,12 +225,49 @@ def list_players_tool(
         email_display = f", Email: {player.email}" if player.email else ""
         result.append(f"- {player.name} (Phone: {player.phone}{email_display})")
 
+    return _join_page(result, PLAYERS_PAGE.next_token(players, limit))
+
+
+@mcp.tool(name="search-players")
+async def search_players_tool(
+    ctx: Context,
+    name: str = Field(..., description="Name to search for (fuzzy matching)"),
+    threshold: float = Field(
+        0.6, description="Match threshold (0-1), higher = stricter matching"
+    ),
+    limit: int = Field(10, description="Maximum number of results"),
+    phonetic: bool = Field(
+        False, description="Score names that sound like the query at least 80%"
+    ),
+) -> str:
+    """Find players by name, tolerating typos and partial names."""
+    command = SearchPlayersCommand(
+        name_query=name,
+        match_threshold=threshold,
+        limit=limit,
+        phonetic=phonetic,
+        db_uri=ctx.request_context.lifespan_context["db_uri"],
+    )
+    matches = await run_tool("search-players", search_players, command)
+
+    if not matches:
+        return f"No players matching '{name}' found"
+
+    result = [f"Players matching '{name}' ({len(matches)}):"]
+    for match in matches:
+        player = match.player
+        email_display = f", Email: {player.email}" if player.email else ""
+        match_percentage = int(match.match_score * 100)
+        result.append(
+            f"- {player.name} (Match: {match_percentage}%, Phone: {player.phone}{email_display})"
+        )
+
     return "\n".join(result)
 
 
 # Add tool for removing a player
 @mcp.tool(name="remove-player")
-def remove_player_tool(
+async def remove_player_tool(
     ctx: Context,
     name: str = Field(..., description="Player's name to remove"),
 ) -> str:
@@ -139,13 +275,13 @@ def remove_player_tool(
     command = RemovePlayerCommand(
         name=name, db_uri=ctx.request_context.lifespan_context["db_uri"]
     )
-    remove_player(command)
+    await run_tool("remove-player", remove_player, command)
     return f"Player '{name}' removed successfully"
 
 
 # Add tool for backing up the database
 @mcp.tool(name="backup")
-def backup_tool(
+async def backup_tool(
     ctx: Context,
     backup_path: str = Field(..., description="Path to save the backup file"),
 ) -> str:
@@ -154,54 +290,86 @@ def backup_tool(
         backup_path=Path(backup_path),
         db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
-    result = backup(command)
+    result = await run_tool("backup", backup, command)
     return result
 
 
 # Add tool for importing players
 @mcp.tool(name="import-players")
-def import_players_tool(
+async def import_players_tool(
     ctx: Context,
     csv_path: str = Field(..., description="Path to CSV file with player data"),
+    diff: bool = Field(False, description="List every player that is inserted or updated"),
+    dry_run: bool = Field(
+        False, description="Only report what would change, without writing anything"
+    ),
 ) -> str:
     """
     Import players from a CSV file, updating existing players.
 
+    Only new players and players whose phone or email changed are written.
+
     CSV must have headers. The following headers are recognized:
     - name/nombre: The player's name (required)
     - phone/telefono: The player's phone number (required)
     - email: The player's email address (optional)
     """
     command = ImportPlayersCommand(
-        csv_path=Path(csv_path), db_uri=ctx.request_context.lifespan_context["db_uri"]
+        csv_path=Path(csv_path),
+        diff=diff,
+        dry_run=dry_run,
+        db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
 
-    players, errors = import_players(command)
+    result = await run_tool("import-players", import_players, command)
+
+    heading = "Dry run, nothing was written" if result.dry_run else "Import complete"
+    output = [
+        f"{heading}: {result.inserted} inserted, {result.updated} updated, "
+        f"{result.unchanged} unchanged, {result.failed} failures."
+    ]
+    if result.changes:
+        output.append(f"\nChanges ({len(result.changes)}):")
+        output.extend(change.describe() for change in result.changes)
+    if result.errors:
+        output.append(f"\nEncountered {result.failed} errors:")
+        for error in result.errors:
+            output.append(f"- {error}")
+        if result.failed > len(result.errors):
+            output.append(f"- ... and {result.failed - len(result.errors)} more")
 
-    result = []
-    if players:
-        result.append(f"Successfully imported/updated {len(players)} players:")
-        for player in players:
-            email_display = f", Email: {player.email}" if player.email else ""
-            result.append(f"- {player.name} (Phone: {player.phone}{email_display})")
+    return "\n".join(output)
 
-    if errors:
-        result.append(f"\nEncountered {len(errors)} errors:")
-        for error in errors:
-            result.append(f"- {error}")
 
-    result.append(
-        f"\nImport complete: {len(players)} successes, {len(errors)} failures."
-    )
+# Add tool for exporting players
+@mcp.tool(name="export-players")
+async def export_players_tool(
+    ctx: Context,
+    csv_path: str = Field(..., description="Path of the CSV file to write"),
+    tournament_id: Optional[int] = Field(
+        None, description="Export this tournament's registrations, with their payment status"
+    ),
+) -> str:
+    """
+    Export players to a CSV file that import-players can read back.
 
-    return "\n".join(result)
+    The file has name, phone and email columns, plus has_paid and
+    payment_date when exporting a tournament's registrations.
+    """
+    command = ExportPlayersCommand(
+        csv_path=Path(csv_path),
+        tournament_id=tournament_id,
+        db_uri=ctx.request_context.lifespan_context["db_uri"],
+    )
+    count = await run_tool("export-players", export_players, command)
+    return f"Exported {count} players to {csv_path}"
 
 
 # Tournament Management Tools
 
 
 @mcp.tool(name="add-tournament")
-def add_tournament_tool(
+async def add_tournament_tool(
     ctx: Context,
     name: str = Field(..., description="Tournament name"),
     location: str = Field(..., description="Tournament location"),
@@ -228,21 +396,24 @@ def add_tournament_tool(
         db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
 
-    result = add_tournament(command)
+    result = await run_tool("add-tournament", add_tournament, command)
     return f"Added tournament: {result.name} (ID: {result.id})"
 
 
 @mcp.tool(name="list-tournaments")
-def list_tournaments_tool(
+async def list_tournaments_tool(
     ctx: Context,
     limit: int = Field(1000, description="Maximum number of tournaments to list"),
+    after: Optional[str] = Field(
+        None, description="Page token printed by the previous call, to get the next page"
+    ),
 ) -> str:
-    """List tournaments in the database."""
+    """List tournaments in the database, by date."""
     command = ListTournamentsCommand(
-        limit=limit, db_uri=ctx.request_context.lifespan_context["db_uri"]
+        limit=limit, after=after, db_uri=ctx.request_context.lifespan_context["db_uri"]
     )
 
-    tournaments = list_tournaments(command)
+    tournaments = await run_tool("list-tournaments", list_tournaments, command)
 
     if not tournaments:
         return "No tournaments found"
@@ -256,11 +427,11 @@ def list_tournaments_tool(
         result.append(f"  Registration Deadline: {tournament.registration_deadline}")
         result.append("")
 
-    return "\n".join(result)
+    return _join_page(result, TOURNAMENTS_PAGE.next_token(tournaments, limit))
 
 
 @mcp.tool(name="update-tournament")
-def update_tournament_tool(
+async def update_tournament_tool(
     ctx: Context,
     id: int = Field(..., description="Tournament ID"),
     name: str = Field(None, description="Tournament name"),
@@ -297,12 +468,12 @@ def update_tournament_tool(
         db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
 
-    result = update_tournament(command)
+    result = await run_tool("update-tournament", update_tournament, command)
     return f"Updated tournament: {result.name} (ID: {result.id})"
 
 
 @mcp.tool(name="remove-tournament")
-def remove_tournament_tool(
+async def remove_tournament_tool(
     ctx: Context,
     id: int = Field(..., description="Tournament ID to remove"),
 ) -> str:
@@ -311,7 +482,7 @@ def remove_tournament_tool(
         id=id, db_uri=ctx.request_context.lifespan_context["db_uri"]
     )
 
-    result = remove_tournament(command)
+    result = await run_tool("remove-tournament", remove_tournament, command)
     return result
 
 
@@ -319,7 +490,7 @@ def remove_tournament_tool(
 
 
 @mcp.tool(name="register-player")
-def register_player_tool(
+async def register_player_tool(
     ctx: Context,
     tournament_id: int = Field(..., description="Tournament ID"),
     player_name: str = Field(..., description="Name of the player to register"),
@@ -331,12 +502,12 @@ def register_player_tool(
         db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
 
-    result = register_player(command)
+    result = await run_tool("register-player", register_player, command)
     return f"Player '{result.player_name}' registered for tournament ID {result.tournament_id}"
 
 
 @mcp.tool(name="unregister-player")
-def unregister_player_tool(
+async def unregister_player_tool(
     ctx: Context,
     tournament_id: int = Field(..., description="Tournament ID"),
     player_name: str = Field(..., description="Name of the player to unregister"),
@@ -348,24 +519,30 @@ def unregister_player_tool(
         db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
 
-    result = unregister_player(command)
+    result = await run_tool("unregister-player", unregister_player, command)
     return result
 
 
 @mcp.tool(name="list-tournament-players")
-def list_tournament_players_tool(
+async def list_tournament_players_tool(
     ctx: Context,
     tournament_id: int = Field(..., description="Tournament ID"),
     limit: int = Field(1000, description="Maximum number of players to list"),
+    after: Optional[str] = Field(
+        None, description="Page token printed by the previous call, to get the next page"
+    ),
 ) -> str:
-    """List all players registered for a tournament."""
+    """List all players registered for a tournament, by name."""
     command = ListTournamentPlayersCommand(
         tournament_id=tournament_id,
         limit=limit,
+        after=after,
         db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
 
-    tournament, players = list_tournament_players(command)
+    tournament, players = await run_tool(
+        "list-tournament-players", list_tournament_player_records, command
+    )
 
     result = [f"Tournament: {tournament.name} (ID: {tournament.id})"]
     result.append(f"Location: {tournament.location}")
@@ -391,23 +568,27 @@ def list_tournament_players_tool(
         result.append(f"- {player.name} {payment_status}{payment_date}")
         result.append(f"  Phone: {player.phone}{email_display}")
 
-    return "\n".join(result)
+    return _join_page(result, REGISTRATIONS_PAGE.next_token(players, limit))
 
 
 @mcp.tool(name="list-player-tournaments")
-def list_player_tournaments_tool(
+async def list_player_tournaments_tool(
     ctx: Context,
     player_name: str = Field(..., description="Name of the player"),
     limit: int = Field(1000, description="Maximum number of tournaments to list"),
+    after: Optional[str] = Field(
+        None, description="Page token printed by the previous call, to get the next page"
+    ),
 ) -> str:
-    """List all tournaments a player is registered for."""
+    """List all tournaments a player is registered for, by date."""
     command = ListPlayerTournamentsCommand(
         player_name=player_name,
         limit=limit,
+        after=after,
         db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
 
-    player, tournaments = list_player_tournaments(command)
+    player, tournaments = await run_tool("list-player-tournaments", list_player_tournaments, command)
 
     result = [f"Player: {player.name}"]
     result.append(f"Phone: {player.phone}")
@@ -425,14 +606,14 @@ def list_player_tournaments_tool(
         result.append(f"  Surface: {tournament.surface.value}")
         result.append("")
 
-    return "\n".join(result)
+    return _join_page(result, TOURNAMENTS_PAGE.next_token(tournaments, limit))
 
 
 # Tournament Payment Tools
 
 
 @mcp.tool(name="mark-payment")
-def mark_payment_tool(
+async def mark_payment_tool(
     ctx: Context,
     tournament_id: int = Field(..., description="Tournament ID"),
     player_name: str = Field(..., description="Name of the player"),
@@ -456,14 +637,14 @@ def mark_payment_tool(
         db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
 
-    result = mark_payment(command)
+    result = await run_tool("mark-payment", mark_payment, command)
 
     payment_date_str = result.payment_date.strftime("%Y-%m-%d %H:%M")
     return f"Player '{result.player_name}' marked as paid for tournament ID {result.tournament_id}\nPayment date: {payment_date_str}"
 
 
 @mcp.tool(name="clear-payment")
-def clear_payment_tool(
+async def clear_payment_tool(
     ctx: Context,
     tournament_id: int = Field(..., description="Tournament ID"),
     player_name: str = Field(..., description="Name of the player"),
@@ -475,12 +656,12 @@ def clear_payment_tool(
         db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
 
-    result = clear_payment(command)
+    result = await run_tool("clear-payment", clear_payment, command)
     return f"Payment status cleared for player '{result.player_name}' in tournament ID {result.tournament_id}"
 
 
 @mcp.tool(name="search-paid-players")
-def search_paid_players_tool(
+async def search_paid_players_tool(
     ctx: Context,
     tournament_id: int = Field(..., description="Tournament ID"),
     name: str = Field("", description="Name to search for (fuzzy matching)"),
@@ -488,6 +669,9 @@ def search_paid_players_tool(
         0.6, description="Match threshold (0-1), higher = stricter matching"
     ),
     limit: int = Field(100, description="Maximum number of results"),
+    phonetic: bool = Field(
+        False, description="Score names that sound like the query at least 80%"
+    ),
 ) -> str:
     """Search for players who have paid for a tournament, with fuzzy name matching."""
     command = SearchPaidPlayersCommand(
@@ -495,10 +679,11 @@ def search_paid_players_tool(
         name_query=name,
         match_threshold=threshold,
         limit=limit,
+        phonetic=phonetic,
         db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
 
-    tournament, players = search_paid_players(command)
+    tournament, players = await run_tool("search-paid-players", search_paid_players, command)
 
     result = [f"Tournament: {tournament.name} (ID: {tournament.id})"]
     result.append(f"Location: {tournament.location}")
@@ -542,10 +727,10 @@ def search_paid_players_tool(
 
 
 @mcp.tool(name="add-federation-payment")
-def add_federation_payment_tool(
+async def add_federation_payment_tool(
     ctx: Context,
     player_name: str = Field(..., description="Name of the player"),
-    amount: float = Field(..., description="Payment amount"),
+    amount: Decimal = Field(..., description="Payment amount, e.g. 25.50"),
     payment_date: str = Field(
         None, description="Payment date (YYYY-MM-DD), defaults to today"
     ),
@@ -569,7 +754,7 @@ def add_federation_payment_tool(
         db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
 
-    result = add_federation_payment(command)
+    result = await run_tool("add-federation-payment", add_federation_payment, command)
 
     output = [f"Federation payment added for player '{result.player_name}'"]
     output.append(f"Payment ID: {result.id}")
@@ -582,7 +767,7 @@ def add_federation_payment_tool(
 
 
 @mcp.tool(name="remove-last-federation-payment")
-def remove_last_federation_payment_tool(
+async def remove_last_federation_payment_tool(
     ctx: Context,
     player_name: str = Field(..., description="Name of the player"),
 ) -> str:
@@ -591,7 +776,7 @@ def remove_last_federation_payment_tool(
         player_name=player_name, db_uri=ctx.request_context.lifespan_context["db_uri"]
     )
 
-    result = remove_last_federation_payment(command)
+    result = await run_tool("remove-last-federation-payment", remove_last_federation_payment, command)
 
     if result:
         output = [f"Removed federation payment for player '{result.player_name}'"]
@@ -606,19 +791,25 @@ def remove_last_federation_payment_tool(
 
 
 @mcp.tool(name="list-federation-payments")
-def list_federation_payments_tool(
+async def list_federation_payments_tool(
     ctx: Context,
     player_name: str = Field(..., description="Name of the player"),
     limit: int = Field(100, description="Maximum number of payments to list"),
+    after: Optional[str] = Field(
+        None, description="Page token printed by the previous call, to get the next page"
+    ),
 ) -> str:
-    """List all federation payments for a player."""
+    """List all federation payments for a player, newest first."""
     command = ListFederationPaymentsCommand(
         player_name=player_name,
         limit=limit,
+        after=after,
         db_uri=ctx.request_context.lifespan_context["db_uri"],
     )
 
-    player, payments = list_federation_payments(command)
+    player, payments, totals = await run_tool(
+        "list-federation-payments", _federation_payments_with_totals, command
+    )
 
     output = [f"Player: {player.name}"]
     output.append(f"Phone: {player.phone}")
@@ -632,9 +823,6 @@ def list_federation_payments_tool(
     # Print federation payments
     output.append(f"\nFederation Payments ({len(payments)}):")
 
-    # Calculate total
-    total_amount = sum(payment.amount for payment in payments)
-
     for payment in payments:
         output.append(
             f"- ID: {payment.id}, Date: {payment.payment_date.strftime('%Y-%m-%d')}"
@@ -643,7 +831,84 @@ def list_federation_payments_tool(
         if payment.notes:
             output.append(f"  Notes: {payment.notes}")
 
-    output.append(f"\nTotal Payments: {total_amount:.2f}")
+    output.append(f"\nTotal Payments ({totals.payments}): {totals.amount:.2f}")
+    return _join_page(output, PAYMENTS_PAGE.next_token(payments, limit))
+
+
+@mcp.tool(name="federation-payment-totals")
+async def federation_payment_totals_tool(
+    ctx: Context,
+    season: Optional[int] = Field(
+        None, description="Season to add up, e.g. 2025, or all time if not given"
+    ),
+    player_name: Optional[str] = Field(None, description="Only add up this player's payments"),
+) -> str:
+    """Add up federation payments per player and for the whole team."""
+    command = FederationPaymentTotalsCommand(
+        player_name=player_name,
+        season=season,
+        db_uri=ctx.request_context.lifespan_context["db_uri"],
+    )
+
+    totals = await run_tool("federation-payment-totals", federation_payment_totals, command)
+
+    period = f"season {season}" if season is not None else "all time"
+    output = [f"Federation payments, {period}:"]
+    for total in totals.players:
+        output.append(f"- {total.player_name}: {total.amount:.2f} ({total.payments} payments)")
+    output.append(f"\nTotal ({totals.payments} payments): {totals.amount:.2f}")
+    return "\n".join(output)
+
+
+@mcp.tool(name="batch")
+async def batch_tool(
+    ctx: Context,
+    operations: List[BatchOperation] = Field(
+        ...,
+        description=(
+            "Operations to run in order. Each one is {\"op\": <tool name>, \"args\": {...}} "
+            "with the fields of the command behind that tool (db_uri excluded), e.g. "
+            "{\"op\": \"register-player\", \"args\": {\"tournament_id\": 1, \"player_name\": \"Ana\"}}. "
+            f"Supported operations: {', '.join(BATCH_OPERATIONS)}"
+        ),
+    ),
+    mode: BatchMode = Field(
+        BatchMode.ATOMIC,
+        description=(
+            "atomic: all or nothing, stop at the first error; "
+            "continue: keep going and commit the operations that succeeded"
+        ),
+    ),
+) -> str:
+    """Run many write operations (add players, register them, mark payments...) in a single transaction."""
+    command = BatchCommand(
+        operations=operations,
+        mode=mode,
+        db_uri=ctx.request_context.lifespan_context["db_uri"],
+    )
+    result = await run_tool("batch", run_batch, command)
+
+    status = "committed" if result.committed else "rolled back"
+    output = [
+        f"Batch ({result.mode.value}): {result.succeeded} ok, {result.failed} failed, {status}"
+    ]
+    for op_result in result.results:
+        detail = f": {op_result.detail}" if op_result.detail else ""
+        output.append(f"{op_result.index}. {op_result.op} {op_result.status}{detail}")
+    return "\n".join(output)
+
+
+@mcp.tool(name="cache-stats")
+async def cache_stats_tool() -> str:
+    """Show how often fuzzy name searches and tournament lookups hit their caches."""
+    output = ["Fuzzy search and tournament caches:"]
+    for stats in cache_stats() + tournament_cache_stats():
+        lookups = stats.hits + stats.misses
+        hit_rate = f"{stats.hits / lookups:.0%}" if lookups else "n/a"
+        output.append(
+            f"- {stats.name}: {stats.hits} hits, {stats.misses} misses "
+            f"(hit rate {hit_rate}), {stats.size}/{stats.max_size} entries"
+        )
     return "\n".join(output)
 
 
@@ -4,6 +4,11 @@ from pathlib import Path
 
 import pytest
 
+from ultimate_mcp_server.modules.init_db import reset_schema_registry
+from ultimate_mcp_server.modules.name_index import reset_name_index
+from ultimate_mcp_server.modules.pool import close_pools
+from ultimate_mcp_server.modules.tournament_cache import reset_tournament_cache
+
 @pytest.fixture
 def temp_db_uri():
     # Create a temporary file for the database
@@ -13,7 +18,18 @@ def temp_db_uri():
     
     yield temp_db_uri
     
+    # Drop pooled connections and cached schema state for the temporary database
+    close_pools()
+    reset_schema_registry(temp_db_uri)
+    reset_name_index(temp_db_uri)
+    reset_tournament_cache(temp_db_uri)
+    
     # Extract the path from the URI and clean up
     db_path = temp_db_path
     if os.path.exists(db_path):
-        os.unlink(db_path)
\ No newline at end of file
+        os.unlink(db_path)
+    # WAL mode leaves -wal/-shm files next to the database
+    for suffix in ("-wal", "-shm"):
+        sidecar = Path(f"{db_path}{suffix}")
+        if sidecar.exists():
+            sidecar.unlink()
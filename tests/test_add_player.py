@@ -39,3 +39,12 @@ def test_add_player(temp_db_uri):
     assert player2.phone == "+0987654321"
     assert player2.email is None
     assert player2.created is not None
+
+
+def test_add_player_rejects_accent_and_case_variants(temp_db_uri):
+    add_player(AddPlayerCommand(name="José Núñez", phone="+1", db_uri=temp_db_uri))
+
+    with pytest.raises(ValueError) as excinfo:
+        add_player(AddPlayerCommand(name="jose  NUNEZ", phone="+2", db_uri=temp_db_uri))
+
+    assert "already exists as 'José Núñez'" in str(excinfo.value)
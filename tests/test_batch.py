@@ -0,0 +1,179 @@
+from datetime import date, timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from ultimate_mcp_server.modules.data_types import (
+    AddPlayerCommand,
+    AddTournamentCommand,
+    BatchCommand,
+    BatchMode,
+    ListPlayersCommand,
+    ListTournamentPlayersCommand,
+    SurfaceType,
+)
+from ultimate_mcp_server.modules.functionality.add_player import add_player
+from ultimate_mcp_server.modules.functionality.add_tournament import add_tournament
+from ultimate_mcp_server.modules.functionality.list_players import list_players
+from ultimate_mcp_server.modules.functionality.list_tournament_players import (
+    list_tournament_players,
+)
+from ultimate_mcp_server.modules.functionality.run_batch import run_batch
+from ultimate_mcp_server.modules.session import Session
+
+
+def _tournament_id(db_uri):
+    tournament = add_tournament(
+        AddTournamentCommand(
+            name="Test Tournament",
+            location="Test Location",
+            date=date.today() + timedelta(days=30),
+            surface=SurfaceType.GRASS,
+            registration_deadline=date.today() + timedelta(days=15),
+            db_uri=db_uri,
+        )
+    )
+    return tournament.id
+
+
+def _setup_operations(tournament_id, names):
+    operations = []
+    for i, name in enumerate(names):
+        operations += [
+            {"op": "add-player", "args": {"name": name, "phone": f"+{i}"}},
+            {
+                "op": "register-player",
+                "args": {"tournament_id": tournament_id, "player_name": name},
+            },
+            {
+                "op": "mark-payment",
+                "args": {"tournament_id": tournament_id, "player_name": name},
+            },
+        ]
+    return operations
+
+
+def test_batch_runs_all_operations(temp_db_uri):
+    """Test that a batch adds, registers and marks players as paid in one go."""
+    tournament_id = _tournament_id(temp_db_uri)
+
+    result = run_batch(
+        BatchCommand(
+            operations=_setup_operations(tournament_id, ["Ana", "Luis", "Marta"]),
+            db_uri=temp_db_uri,
+        )
+    )
+
+    assert result.committed
+    assert (result.succeeded, result.failed) == (9, 0)
+    assert result.results[0].detail == "Ana"
+    assert result.results[1].detail == f"Ana -> tournament {tournament_id}"
+
+    _, players = list_tournament_players(
+        ListTournamentPlayersCommand(tournament_id=tournament_id, db_uri=temp_db_uri)
+    )
+    assert [(p.player.name, p.has_paid) for p in players] == [
+        ("Ana", True),
+        ("Luis", True),
+        ("Marta", True),
+    ]
+
+
+def test_atomic_batch_rolls_back_on_error(temp_db_uri):
+    """Test that an atomic batch writes nothing when one operation fails."""
+    tournament_id = _tournament_id(temp_db_uri)
+    operations = _setup_operations(tournament_id, ["Ana"]) + [
+        {
+            "op": "register-player",
+            "args": {"tournament_id": tournament_id, "player_name": "Nobody"},
+        },
+        {"op": "add-player", "args": {"name": "Luis", "phone": "+9"}},
+    ]
+
+    result = run_batch(BatchCommand(operations=operations, db_uri=temp_db_uri))
+
+    assert not result.committed
+    assert [r.status for r in result.results] == ["ok", "ok", "ok", "error", "skipped"]
+    assert "Nobody" in result.results[3].detail
+    assert list_players(ListPlayersCommand(db_uri=temp_db_uri)) == []
+
+
+def test_continue_batch_keeps_successful_operations(temp_db_uri):
+    """Test that continue mode reports failures and commits everything else."""
+    add_player(AddPlayerCommand(name="Ana", phone="+1", db_uri=temp_db_uri))
+    operations = [
+        {"op": "add-player", "args": {"name": "Ana", "phone": "+2"}},
+        {"op": "add-player", "args": {"name": "Luis", "phone": "+3"}},
+        {"op": "remove-player", "args": {"name": "Nobody"}},
+    ]
+
+    result = run_batch(
+        BatchCommand(operations=operations, mode=BatchMode.CONTINUE, db_uri=temp_db_uri)
+    )
+
+    assert result.committed
+    assert [r.status for r in result.results] == ["error", "ok", "error"]
+    assert "already exists" in result.results[0].detail
+    assert "Nobody" in result.results[2].detail
+    players = list_players(ListPlayersCommand(db_uri=temp_db_uri))
+    assert [(p.name, p.phone) for p in players] == [("Ana", "+1"), ("Luis", "+3")]
+
+
+@pytest.mark.parametrize(
+    "operation, problem",
+    [
+        ({"op": "add-player", "args": {"name": "Marta"}}, "phone"),
+        ({"op": "list-players", "args": {}}, "list-players"),
+        ({"op": "register-player", "args": {"tournament_id": "x", "player_name": "Ana"}},
+         "tournament_id"),
+    ],
+)
+def test_batch_rejects_invalid_operations_up_front(operation, problem):
+    """Test that operations are checked against their command model before anything runs."""
+    with pytest.raises(ValidationError, match=problem):
+        BatchCommand(operations=[operation])
+
+
+def test_batch_operation_schema_lists_command_fields():
+    """Test that the batch schema shows each operation's arguments, without db_uri."""
+    definitions = BatchCommand.model_json_schema()["$defs"]
+
+    register_args = definitions["RegisterPlayerArgs"]
+    assert set(register_args["properties"]) == {"tournament_id", "player_name"}
+    assert register_args["required"] == ["tournament_id", "player_name"]
+    assert definitions["AddPlayerOperation"]["properties"]["op"]["const"] == "add-player"
+
+
+def test_batch_ignores_db_uri_in_arguments(temp_db_uri, tmp_path):
+    """Test that operations can't target a different database than the batch."""
+    other_uri = f"file://{tmp_path / 'other.db'}"
+    result = run_batch(
+        BatchCommand(
+            operations=[
+                {"op": "add-player", "args": {"name": "Ana", "phone": "+1", "db_uri": other_uri}}
+            ],
+            db_uri=temp_db_uri,
+        )
+    )
+
+    assert result.committed
+    assert [p.name for p in list_players(ListPlayersCommand(db_uri=temp_db_uri))] == ["Ana"]
+
+
+def test_atomic_batch_in_session_only_undoes_its_own_work(temp_db_uri):
+    """Test that a failed batch inside a caller's session keeps the session's earlier work."""
+    with Session(temp_db_uri) as session:
+        add_player(AddPlayerCommand(name="Ana", phone="+1", db_uri=temp_db_uri), session=session)
+        result = run_batch(
+            BatchCommand(
+                operations=[
+                    {"op": "add-player", "args": {"name": "Luis", "phone": "+2"}},
+                    {"op": "remove-player", "args": {"name": "Nobody"}},
+                ],
+                db_uri=temp_db_uri,
+            ),
+            session=session,
+        )
+        assert not result.committed
+
+    assert [p.name for p in list_players(ListPlayersCommand(db_uri=temp_db_uri))] == ["Ana"]
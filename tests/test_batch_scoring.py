@@ -0,0 +1,74 @@
+import itertools
+
+import pytest
+
+from ultimate_mcp_server.modules import utils
+from ultimate_mcp_server.modules.utils import (
+    batch_match_scores,
+    batch_top_matches,
+    player_match_score,
+    top_player_matches,
+)
+
+FIRST_NAMES = ["Juan", "María", "Pedro", "Ana", "Cabi", "Lucía", "José", "Iago"]
+SURNAMES = ["García", "González", "Pérez", "Ortiz", "Núñez", "Gil", "Jiménez"]
+TARGETS = [f"{first} {last}" for first, last in itertools.product(FIRST_NAMES, SURNAMES)]
+QUERIES = [
+    "Juan", "Jaun Garcia", "Kavi", "Gonzales", "maria perez", "Ana Gil", "Yago",
+    "Gimenez Jose", "Lucia", "Xyz", "", "Pedro Nuñez Ortiz",
+]
+
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def prefilter(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(utils, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize("min_score", [0.0, 0.6, 0.85])
+def test_batch_match_scores_match_pairwise_scores(prefilter, min_score):
+    matrix = batch_match_scores(QUERIES, TARGETS, min_score)
+
+    assert len(matrix) == len(QUERIES)
+    for query, row in zip(QUERIES, matrix):
+        expected = [player_match_score(query, target) for target in TARGETS]
+        assert row == [score if score >= min_score else 0.0 for score in expected]
+
+
+@pytest.mark.parametrize("threshold, limit", [(0.6, 5), (0.8, 3), (0.3, 100)])
+def test_batch_top_matches_match_single_searches(prefilter, threshold, limit):
+    results = batch_top_matches(QUERIES, TARGETS, threshold, limit)
+
+    assert results == [top_player_matches(query, TARGETS, threshold, limit) for query in QUERIES]
+
+
+def test_batch_top_matches_finds_sound_alikes(prefilter):
+    assert batch_top_matches(["Kavi"], TARGETS, threshold=0.8, limit=2, phonetic=True) == [
+        [("Cabi García", 0.8), ("Cabi González", 0.8)]
+    ]
+    assert batch_top_matches(["Kavi"], TARGETS, threshold=0.8, limit=2) == [[]]
+
+
+def test_batch_scoring_empty_inputs(prefilter):
+    assert batch_match_scores([], TARGETS) == []
+    assert batch_match_scores(["Juan"], []) == [[]]
+    assert batch_top_matches(["Juan"], [], 0.6, 5) == [[]]
+
+
+def test_numpy_prefilter_prunes_hopeless_pairs(monkeypatch):
+    pytest.importorskip("numpy")
+    # Force several query blocks
+    monkeypatch.setattr(utils, "BATCH_BLOCK_CELLS", 1)
+    keys = [utils.normalize_name(name) for name in TARGETS]
+    candidates = list(
+        utils._batch_candidates(["xyz", "juan", "kavi"], keys, 0.6, phonetic=True)
+    )
+
+    assert candidates[0] == []
+    assert 0 < len(candidates[1]) < len(TARGETS)
+    assert [keys[index] for index in candidates[2] if keys[index].startswith("cabi")] == [
+        key for key in keys if key.startswith("cabi")
+    ]
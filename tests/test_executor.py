@@ -0,0 +1,190 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from ultimate_mcp_server.modules.data_types import AddPlayerCommand, ListPlayersCommand
+from ultimate_mcp_server.modules.executor import (
+    ToolExecutor,
+    ToolTimeoutError,
+    parse_timeouts,
+)
+from ultimate_mcp_server.modules.functionality.add_player import add_player
+from ultimate_mcp_server.modules.functionality.list_players import list_players
+
+
+def test_runs_off_the_event_loop_thread(temp_db_uri):
+    """Test that tool functions run on a worker thread and return their result."""
+    executor = ToolExecutor(max_workers=2, max_concurrency=2)
+    loop_thread = threading.get_ident()
+
+    async def main():
+        await executor.run(
+            "add-player",
+            add_player,
+            AddPlayerCommand(name="Player 1", phone="+1111111111", db_uri=temp_db_uri),
+        )
+        return await executor.run(
+            "list-players",
+            lambda command: (threading.get_ident(), list_players(command)),
+            ListPlayersCommand(db_uri=temp_db_uri),
+        )
+
+    try:
+        worker_thread, players = asyncio.run(main())
+    finally:
+        executor.shutdown()
+
+    assert worker_thread != loop_thread
+    assert [p.name for p in players] == ["Player 1"]
+
+
+def test_calls_run_in_parallel():
+    """Test that concurrent calls don't wait for each other."""
+    executor = ToolExecutor(max_workers=4, max_concurrency=4)
+
+    async def main():
+        start = time.perf_counter()
+        await asyncio.gather(*(executor.run("slow", time.sleep, 0.2) for _ in range(4)))
+        return time.perf_counter() - start
+
+    try:
+        elapsed = asyncio.run(main())
+    finally:
+        executor.shutdown()
+
+    assert elapsed < 0.6
+
+
+def test_concurrency_limit():
+    """Test that no more than max_concurrency calls run at the same time."""
+    executor = ToolExecutor(max_workers=8, max_concurrency=2)
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    async def main():
+        await asyncio.gather(*(executor.run("work", work) for _ in range(6)))
+
+    try:
+        asyncio.run(main())
+    finally:
+        executor.shutdown()
+
+    assert peak == 2
+
+
+def test_per_tool_timeout():
+    """Test that a slow call fails with a timeout without blocking other tools."""
+    executor = ToolExecutor(
+        max_workers=2, max_concurrency=2, default_timeout=5, timeouts={"slow": 0.05}
+    )
+
+    async def main():
+        with pytest.raises(ToolTimeoutError, match="slow"):
+            await executor.run("slow", time.sleep, 0.5)
+        return await executor.run("fast", lambda: "done")
+
+    try:
+        assert asyncio.run(main()) == "done"
+    finally:
+        executor.shutdown()
+
+
+def test_timeout_lookup():
+    """Test default, overridden and disabled timeouts."""
+    executor = ToolExecutor(
+        default_timeout=30, timeouts={"backup": 0, "list-players": 5, "batch": 5}
+    )
+
+    assert executor.timeout_for("list-tournaments") == 30
+    assert executor.timeout_for("list-players") == 5
+    assert executor.timeout_for("export-players") == 300
+    assert executor.timeout_for("backup") is None
+    # Writes always run to completion
+    assert executor.timeout_for("add-player") is None
+    assert executor.timeout_for("import-players") is None
+    assert executor.timeout_for("batch") is None
+
+
+def test_timed_out_call_keeps_its_slot():
+    """Test that a timed-out call holds its concurrency slot until its thread is done."""
+    executor = ToolExecutor(
+        max_workers=2, max_concurrency=1, default_timeout=5, timeouts={"slow": 0.05}
+    )
+    finished = []
+
+    def slow():
+        time.sleep(0.3)
+        finished.append("slow")
+
+    async def main():
+        with pytest.raises(ToolTimeoutError):
+            await executor.run("slow", slow)
+        return await executor.run("fast", lambda: list(finished))
+
+    try:
+        assert asyncio.run(main()) == ["slow"]
+    finally:
+        executor.shutdown()
+
+
+def test_write_tools_are_not_timed_out(temp_db_uri):
+    """Test that a slow write finishes and commits instead of timing out."""
+    executor = ToolExecutor(max_workers=1, max_concurrency=1, default_timeout=0.05)
+
+    def slow_add_player(command):
+        time.sleep(0.2)
+        return add_player(command)
+
+    async def main():
+        await executor.run(
+            "add-player",
+            slow_add_player,
+            AddPlayerCommand(name="Player 1", phone="+1111111111", db_uri=temp_db_uri),
+        )
+
+    try:
+        asyncio.run(main())
+    finally:
+        executor.shutdown()
+
+    players = list_players(ListPlayersCommand(db_uri=temp_db_uri))
+    assert [p.name for p in players] == ["Player 1"]
+
+
+def test_exceptions_propagate():
+    """Test that errors raised by tool functions reach the caller unchanged."""
+    executor = ToolExecutor(max_workers=1, max_concurrency=1)
+
+    def fail():
+        raise ValueError("Player 'Nobody' not found")
+
+    try:
+        with pytest.raises(ValueError, match="Nobody"):
+            asyncio.run(executor.run("remove-player", fail))
+    finally:
+        executor.shutdown()
+
+
+def test_parse_timeouts():
+    """Test parsing of the TOOL_TIMEOUTS setting."""
+    assert parse_timeouts("") == {}
+    assert parse_timeouts("import-players=600, backup=120.5") == {
+        "import-players": 600.0,
+        "backup": 120.5,
+    }
+    with pytest.raises(ValueError):
+        parse_timeouts("backup")
+    with pytest.raises(ValueError):
+        parse_timeouts("backup=soon")
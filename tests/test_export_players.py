@@ -0,0 +1,201 @@
+import csv
+from datetime import date, datetime, timedelta
+
+import pytest
+from click.testing import CliRunner
+
+from ultimate_mcp_server.cli import cli
+from ultimate_mcp_server.modules import records
+from ultimate_mcp_server.modules.data_types import (
+    AddFederationPaymentCommand,
+    AddPlayerCommand,
+    AddTournamentCommand,
+    ExportPlayersCommand,
+    ImportPlayersCommand,
+    ListFederationPaymentsCommand,
+    ListPlayersCommand,
+    ListTournamentPlayersCommand,
+    MarkPaymentCommand,
+    RegisterPlayerCommand,
+    SurfaceType,
+)
+from ultimate_mcp_server.modules.functionality.add_federation_payment import (
+    add_federation_payment,
+)
+from ultimate_mcp_server.modules.functionality.add_player import add_player
+from ultimate_mcp_server.modules.functionality.add_tournament import add_tournament
+from ultimate_mcp_server.modules.functionality.export_players import export_players
+from ultimate_mcp_server.modules.functionality.import_players import import_players
+from ultimate_mcp_server.modules.functionality.list_federation_payments import (
+    iter_federation_payments,
+    list_federation_payments,
+)
+from ultimate_mcp_server.modules.functionality.list_players import iter_players, list_players
+from ultimate_mcp_server.modules.functionality.list_tournament_players import (
+    iter_tournament_players,
+)
+from ultimate_mcp_server.modules.functionality.mark_payment import mark_payment
+from ultimate_mcp_server.modules.functionality.register_player import register_player
+
+
+@pytest.fixture
+def roster(temp_db_uri, monkeypatch):
+    # Small batches, so the iterators cross several fetchmany calls
+    monkeypatch.setattr(records, "FETCH_BATCH_SIZE", 2)
+    names = [f"Player {i:02d}" for i in range(7)]
+    for i, name in enumerate(names):
+        email = f"p{i}@example.com" if i % 2 else None
+        add_player(AddPlayerCommand(name=name, phone=f"+{i}", email=email, db_uri=temp_db_uri))
+    return names
+
+
+@pytest.fixture
+def tournament(temp_db_uri, roster):
+    start = date.today() + timedelta(days=30)
+    tournament = add_tournament(
+        AddTournamentCommand(
+            name="Spring Open",
+            location="Madrid",
+            date=start,
+            surface=SurfaceType.BEACH,
+            registration_deadline=start,
+            db_uri=temp_db_uri,
+        )
+    )
+    for name in roster[:3]:
+        register_player(
+            RegisterPlayerCommand(tournament_id=tournament.id, player_name=name, db_uri=temp_db_uri)
+        )
+    mark_payment(
+        MarkPaymentCommand(
+            tournament_id=tournament.id,
+            player_name=roster[1],
+            payment_date=datetime(2025, 3, 1, 12, 0),
+            db_uri=temp_db_uri,
+        )
+    )
+    return tournament
+
+
+def test_iter_players_matches_list_players(temp_db_uri, roster):
+    command = ListPlayersCommand(limit=None, db_uri=temp_db_uri)
+
+    streamed = list(iter_players(command))
+
+    assert [record.to_model() for record in streamed] == list_players(command)
+    assert [record.name for record in streamed] == roster
+
+
+def test_iter_players_respects_limit(temp_db_uri, roster):
+    command = ListPlayersCommand(limit=5, db_uri=temp_db_uri)
+
+    assert [record.name for record in iter_players(command)] == roster[:5]
+
+
+def test_iter_tournament_players(temp_db_uri, roster, tournament):
+    registrations = list(
+        iter_tournament_players(
+            ListTournamentPlayersCommand(tournament_id=tournament.id, db_uri=temp_db_uri)
+        )
+    )
+
+    assert [r.player.name for r in registrations] == roster[:3]
+    assert [r.has_paid for r in registrations] == [False, True, False]
+    assert registrations[1].payment_date == datetime(2025, 3, 1, 12, 0)
+
+
+def test_iter_tournament_players_unknown_tournament(temp_db_uri):
+    registrations = iter_tournament_players(
+        ListTournamentPlayersCommand(tournament_id=999, db_uri=temp_db_uri)
+    )
+
+    with pytest.raises(ValueError, match="Tournament with ID 999 not found"):
+        next(registrations)
+
+
+def test_iter_federation_payments(temp_db_uri, roster):
+    for day in range(1, 4):
+        add_federation_payment(
+            AddFederationPaymentCommand(
+                player_name=roster[0],
+                payment_date=datetime(2025, 1, day),
+                amount=10.5,
+                db_uri=temp_db_uri,
+            )
+        )
+    command = ListFederationPaymentsCommand(player_name=roster[0], db_uri=temp_db_uri)
+
+    streamed = [payment.to_model() for payment in iter_federation_payments(command)]
+
+    assert streamed == list_federation_payments(command)[1]
+    assert [p.payment_date.day for p in streamed] == [3, 2, 1]
+
+
+def test_export_players_round_trip(temp_db_uri, roster, tmp_path):
+    csv_path = tmp_path / "out" / "players.csv"
+
+    count = export_players(ExportPlayersCommand(csv_path=csv_path, db_uri=temp_db_uri))
+
+    assert count == len(roster)
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["name", "phone", "email"]
+    assert rows[1] == ["Player 00", "+0", ""]
+    assert rows[2] == ["Player 01", "+1", "p1@example.com"]
+
+    # Importing the export back changes nothing
+    result = import_players(ImportPlayersCommand(csv_path=csv_path, db_uri=temp_db_uri))
+    assert (result.inserted, result.updated, result.unchanged) == (0, 0, len(roster))
+
+
+def test_export_tournament_players(temp_db_uri, roster, tournament, tmp_path):
+    csv_path = tmp_path / "registrations.csv"
+
+    count = export_players(
+        ExportPlayersCommand(csv_path=csv_path, tournament_id=tournament.id, db_uri=temp_db_uri)
+    )
+
+    assert count == 3
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["has_paid"] for row in rows] == ["no", "yes", "no"]
+    assert rows[1]["payment_date"] == "2025-03-01T12:00:00"
+
+
+def test_export_unknown_tournament_leaves_no_file(temp_db_uri, tmp_path):
+    csv_path = tmp_path / "registrations.csv"
+
+    with pytest.raises(ValueError, match="not found"):
+        export_players(
+            ExportPlayersCommand(csv_path=csv_path, tournament_id=999, db_uri=temp_db_uri)
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cli_streams_pages(temp_db_uri, roster):
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["list-players", "--limit", "4", "--db-uri", temp_db_uri])
+    assert result.exit_code == 0
+    assert "- Player 03" in result.output and "Player 04" not in result.output
+    token = result.output.split("--after ")[1].strip()
+
+    result = runner.invoke(
+        cli, ["list-players", "--limit", "4", "--after", token, "--db-uri", temp_db_uri]
+    )
+    assert result.exit_code == 0
+    assert "- Player 04" in result.output and "- Player 06" in result.output
+    assert "--after" not in result.output
+
+
+def test_cli_list_tournament_players(temp_db_uri, roster, tournament):
+    result = CliRunner().invoke(
+        cli,
+        ["list-tournament-players", "-t", str(tournament.id), "--db-uri", temp_db_uri],
+    )
+
+    assert result.exit_code == 0
+    assert "Tournament: Spring Open" in result.output
+    assert "- Player 01 [PAID] on 2025-03-01" in result.output
+    assert "3 players listed" in result.output
@@ -1,17 +1,35 @@
+import importlib
+
 import pytest
 from datetime import datetime
+from decimal import Decimal
 import sqlite3
 
+from click.testing import CliRunner
+from pydantic import ValidationError
+
 from ultimate_mcp_server.modules.data_types import (
     AddPlayerCommand,
     AddFederationPaymentCommand,
     RemoveLastFederationPaymentCommand,
-    ListFederationPaymentsCommand
+    ListFederationPaymentsCommand,
+    FederationPaymentTotalsCommand,
 )
+from ultimate_mcp_server.cli import cli
 from ultimate_mcp_server.modules.functionality.add_player import add_player
 from ultimate_mcp_server.modules.functionality.add_federation_payment import add_federation_payment
 from ultimate_mcp_server.modules.functionality.remove_last_federation_payment import remove_last_federation_payment
 from ultimate_mcp_server.modules.functionality.list_federation_payments import list_federation_payments
+from ultimate_mcp_server.modules.functionality.federation_payment_totals import (
+    federation_payment_totals,
+    PaymentTotal,
+)
+
+# The functionality package exports a function of the same name
+totals_module = importlib.import_module(
+    "ultimate_mcp_server.modules.functionality.federation_payment_totals"
+)
+from ultimate_mcp_server.modules.timestamps import from_timestamp
 
 
 @pytest.fixture
@@ -56,9 +74,10 @@ def test_add_federation_payment(temp_db_uri, test_player):
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     cursor.execute("""
-        SELECT id, player_name, payment_date, amount, notes
-        FROM federation_payments
-        WHERE id = ?
+        SELECT fp.id, p.name, fp.payment_date, fp.amount_cents, fp.notes
+        FROM federation_payments fp
+        JOIN players p ON p.id = fp.player_id
+        WHERE fp.id = ?
     """, (result.id,))
     row = cursor.fetchone()
     conn.close()
@@ -66,8 +85,8 @@ def test_add_federation_payment(temp_db_uri, test_player):
     assert row is not None
     assert row[0] == result.id
     assert row[1] == test_player.name
-    assert datetime.fromisoformat(row[2]) == payment_date
-    assert row[3] == amount
+    assert from_timestamp(row[2]) == payment_date
+    assert row[3] == 5000  # Stored in cents
     assert row[4] == notes
 
 
@@ -217,4 +236,101 @@ def test_player_not_found(temp_db_uri):
     with pytest.raises(ValueError) as excinfo:
         list_federation_payments(list_command)
     
-    assert "not found" in str(excinfo.value)
\ No newline at end of file
+    assert "not found" in str(excinfo.value)
+
+def _pay(db_uri, player_name, payment_date, amount):
+    return add_federation_payment(
+        AddFederationPaymentCommand(
+            player_name=player_name, payment_date=payment_date, amount=amount, db_uri=db_uri
+        )
+    )
+
+
+def test_amounts_are_exact(temp_db_uri, test_player):
+    """Amounts are Decimals that add up without float drift."""
+    for _ in range(3):
+        _pay(temp_db_uri, test_player.name, datetime(2025, 1, 1), 0.1)
+
+    _, payments = list_federation_payments(
+        ListFederationPaymentsCommand(player_name=test_player.name, db_uri=temp_db_uri)
+    )
+    totals = federation_payment_totals(
+        FederationPaymentTotalsCommand(player_name="test player", db_uri=temp_db_uri)
+    )
+
+    assert [payment.amount for payment in payments] == [Decimal("0.10")] * 3
+    assert totals.players == [PaymentTotal("Test Player", 3, Decimal("0.30"))]
+    assert str(totals.amount) == "0.30"
+
+
+def test_amounts_must_be_whole_cents(temp_db_uri, test_player):
+    with pytest.raises(ValidationError):
+        AddFederationPaymentCommand(
+            player_name=test_player.name,
+            payment_date=datetime.now(),
+            amount="10.005",
+            db_uri=temp_db_uri,
+        )
+
+
+def test_federation_payment_totals(temp_db_uri, test_player, monkeypatch):
+    """Totals per player, per season and for the whole team."""
+    add_player(AddPlayerCommand(name="Ana", phone="+1", db_uri=temp_db_uri))
+    _pay(temp_db_uri, test_player.name, datetime(2024, 8, 31, 12), 20)
+    _pay(temp_db_uri, test_player.name, datetime(2024, 9, 1, 12), 30.5)
+    _pay(temp_db_uri, "Ana", datetime(2025, 3, 1, 12), 45)
+
+    def totals(**kwargs):
+        return federation_payment_totals(
+            FederationPaymentTotalsCommand(db_uri=temp_db_uri, **kwargs)
+        )
+
+    everything = totals()
+    assert everything.players == [
+        PaymentTotal("Ana", 1, Decimal("45.00")),
+        PaymentTotal("Test Player", 2, Decimal("50.50")),
+    ]
+    assert (everything.payments, everything.amount) == (3, Decimal("95.50"))
+    ana = totals(player_name="ana")
+    assert (ana.payments, ana.amount) == (1, Decimal("45.00"))
+
+    # Calendar year seasons by default
+    assert totals(season=2024).amount == Decimal("50.50")
+    assert totals(season=2025, player_name="ana").players == [
+        PaymentTotal("Ana", 1, Decimal("45.00"))
+    ]
+
+    # September to August seasons
+    monkeypatch.setattr(totals_module, "SEASON_START_MONTH", 9)
+    assert totals(season=2023).amount == Decimal("20.00")
+    assert totals(season=2024).players == [
+        PaymentTotal("Ana", 1, Decimal("45.00")),
+        PaymentTotal("Test Player", 1, Decimal("30.50")),
+    ]
+
+    # A player without payments in the season still gets a zero total
+    assert totals(season=2030, player_name="Ana").players == [
+        PaymentTotal("Ana", 0, Decimal("0.00"))
+    ]
+    with pytest.raises(ValueError, match="not found"):
+        totals(player_name="Nobody")
+
+
+def test_cli_totals_cover_every_page(temp_db_uri, test_player):
+    for day in range(1, 4):
+        _pay(temp_db_uri, test_player.name, datetime(2025, 1, day), "10.10")
+    runner = CliRunner()
+
+    result = runner.invoke(
+        cli,
+        ["list-federation-payments", "-p", test_player.name, "-l", "2", "--db-uri", temp_db_uri],
+    )
+    assert result.exit_code == 0, result.output
+    assert "Total Payments (3): 30.30" in result.output
+
+    result = runner.invoke(
+        cli, ["federation-payment-totals", "--season", "2025", "--db-uri", temp_db_uri]
+    )
+    assert result.exit_code == 0, result.output
+    assert "- Test Player: 30.30 (3 payments)" in result.output
+    assert "Total (3 payments): 30.30" in result.output
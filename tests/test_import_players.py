@@ -1,8 +1,14 @@
 import csv
+import importlib
 import os
 import tempfile
 from pathlib import Path
 
+import pytest
+from click.testing import CliRunner
+
+from ultimate_mcp_server.cli import cli
+
 
 from ultimate_mcp_server.modules.data_types import (
     ImportPlayersCommand,
@@ -29,11 +35,11 @@ def test_import_players(temp_db_uri):
         command = ImportPlayersCommand(csv_path=csv_path, db_uri=temp_db_uri)
 
         # Import the players
-        players, errors = import_players(command)
+        result = import_players(command)
 
         # Check that all players were imported
-        assert len(players) == 3
-        assert len(errors) == 0
+        assert (result.inserted, result.updated, result.unchanged) == (3, 0, 0)
+        assert len(result.errors) == 0
 
         # Check that the players are in the database
         list_command = ListPlayersCommand(db_uri=temp_db_uri)
@@ -60,6 +66,7 @@ def test_import_players(temp_db_uri):
             writer.writerow(
                 ["Player 1", "+9999999999", "updated@example.com"]
             )  # Updated
+            writer.writerow(["Player 2", "+2222222222", "player2@example.com"])  # Same
             writer.writerow(["Player 4", "+4444444444", "player4@example.com"])  # New
 
         try:
@@ -69,11 +76,12 @@ def test_import_players(temp_db_uri):
             )
 
             # Import/update the players
-            updated_players, update_errors = import_players(update_command)
+            update_result = import_players(update_command)
 
             # Check that the players were imported/updated
-            assert len(updated_players) == 2
-            assert len(update_errors) == 0
+            assert (update_result.inserted, update_result.updated) == (1, 1)
+            assert update_result.unchanged == 1
+            assert len(update_result.errors) == 0
 
             # Check that the database has the expected players
             updated_db_players = list_players(list_command)
@@ -116,11 +124,13 @@ def test_import_players(temp_db_uri):
             )
 
             # Import with errors
-            error_players, error_messages = import_players(error_command)
+            error_result = import_players(error_command)
 
             # Check that only valid players were imported
-            assert len(error_players) == 1
-            assert len(error_messages) == 2
+            assert error_result.inserted == 1
+            assert error_result.failed == 2
+            assert len(error_result.errors) == 2
+            assert error_result.errors[0].startswith("Line 3:")
 
             # Check that the database has the expected players
             final_db_players = list_players(list_command)
@@ -142,3 +152,123 @@ def test_import_players(temp_db_uri):
         if os.path.exists(csv_path):
             os.unlink(csv_path)
 
+
+
+def _write_csv(path, header, rows):
+    with open(path, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def test_import_players_in_chunks(temp_db_uri, tmp_path, monkeypatch):
+    """Test that counts stay correct across chunks and for names repeated in the file."""
+    module = importlib.import_module(
+        "ultimate_mcp_server.modules.functionality.import_players"
+    )
+    monkeypatch.setattr(module, "IMPORT_CHUNK_SIZE", 3)
+    csv_path = tmp_path / "players.csv"
+    rows = [[f"Player {i}", f"+{i}", ""] for i in range(10)]
+    # Same name again in the same chunk and in a later chunk
+    rows.insert(2, ["Player 0", "+100", ""])
+    rows.append(["Player 1", "+1", ""])
+    _write_csv(csv_path, ["name", "PHONE", "Email"], rows)
+
+    result = import_players(ImportPlayersCommand(csv_path=csv_path, db_uri=temp_db_uri))
+
+    assert (result.inserted, result.updated, result.unchanged) == (10, 1, 1)
+    players = {p.name: p for p in list_players(ListPlayersCommand(db_uri=temp_db_uri))}
+    assert len(players) == 10
+    assert players["Player 0"].phone == "+100"
+
+    # Importing the same file again only replays the two changes to Player 0
+    again = import_players(ImportPlayersCommand(csv_path=csv_path, db_uri=temp_db_uri))
+    assert (again.inserted, again.updated, again.unchanged) == (0, 2, 10)
+
+
+def test_import_players_requires_name_and_phone_columns(temp_db_uri, tmp_path):
+    """Test that a CSV without the required columns is rejected up front."""
+    csv_path = tmp_path / "players.csv"
+    _write_csv(csv_path, ["Nombre", "Email"], [["Player 1", "player1@example.com"]])
+
+    with pytest.raises(ValueError, match="phone"):
+        import_players(ImportPlayersCommand(csv_path=csv_path, db_uri=temp_db_uri))
+
+
+def test_import_players_dry_run(temp_db_uri, tmp_path):
+    """Test that a dry run reports the change set without writing it."""
+    csv_path = tmp_path / "players.csv"
+    _write_csv(
+        csv_path,
+        ["Nombre", "Telefono", "Email"],
+        [["Player 1", "+1", "p1@example.com"], ["Player 2", "+2", ""]],
+    )
+    import_players(ImportPlayersCommand(csv_path=csv_path, db_uri=temp_db_uri))
+
+    _write_csv(
+        csv_path,
+        ["Nombre", "Telefono", "Email"],
+        [
+            ["Player 1", "+1", "p1@example.com"],  # Unchanged
+            ["Player 2", "+2", "p2@example.com"],  # Email added
+            ["Player 3", "+3", ""],  # New
+        ],
+    )
+    result = import_players(
+        ImportPlayersCommand(csv_path=csv_path, dry_run=True, db_uri=temp_db_uri)
+    )
+
+    assert result.dry_run
+    assert (result.inserted, result.updated, result.unchanged) == (1, 1, 1)
+    assert [change.describe() for change in result.changes] == [
+        "~ Player 2: email - -> p2@example.com",
+        "+ Player 3 (Phone: +3)",
+    ]
+    players = list_players(ListPlayersCommand(db_uri=temp_db_uri))
+    assert [(p.name, p.email) for p in players] == [
+        ("Player 1", "p1@example.com"),
+        ("Player 2", None),
+    ]
+
+    # The real import applies exactly the reported changes
+    applied = import_players(
+        ImportPlayersCommand(csv_path=csv_path, diff=True, db_uri=temp_db_uri)
+    )
+    assert applied.changes == result.changes
+    assert len(list_players(ListPlayersCommand(db_uri=temp_db_uri))) == 3
+
+
+def test_import_players_cli_dry_run(temp_db_uri, tmp_path):
+    """Test the --dry-run option of the import-players command."""
+    csv_path = tmp_path / "players.csv"
+    _write_csv(csv_path, ["Nombre", "Telefono"], [["Player 1", "+1"]])
+
+    output = CliRunner().invoke(
+        cli, ["import-players", str(csv_path), "--dry-run", "--db-uri", temp_db_uri]
+    ).output
+
+    assert "+ Player 1 (Phone: +1)" in output
+    assert "Dry run, nothing was written: 1 inserted" in output
+    assert list_players(ListPlayersCommand(db_uri=temp_db_uri)) == []
+
+
+def test_import_players_matches_names_ignoring_accents(temp_db_uri, tmp_path):
+    """Test that a differently accented name updates the stored player."""
+    csv_path = tmp_path / "players.csv"
+    _write_csv(csv_path, ["name", "phone"], [["José Núñez", "+1"]])
+    import_players(ImportPlayersCommand(csv_path=csv_path, db_uri=temp_db_uri))
+
+    _write_csv(
+        csv_path, ["name", "phone"], [["jose nunez", "+2"], ["Ana Gil", "+3"], ["ANA GIL", "+3"]]
+    )
+    result = import_players(
+        ImportPlayersCommand(csv_path=csv_path, diff=True, db_uri=temp_db_uri)
+    )
+
+    assert (result.inserted, result.updated, result.unchanged) == (1, 1, 1)
+    assert [change.describe() for change in result.changes] == [
+        "~ José Núñez: phone +1 -> +2",
+        "+ Ana Gil (Phone: +3)",
+    ]
+    players = {p.name: p.phone for p in list_players(ListPlayersCommand(db_uri=temp_db_uri))}
+    assert players == {"José Núñez": "+2", "Ana Gil": "+3"}
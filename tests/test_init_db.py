@@ -3,7 +3,11 @@ import sqlite3
 from urllib.parse import urlparse
 
 
-from ultimate_mcp_server.modules.init_db import init_db
+from ultimate_mcp_server.modules.init_db import (
+    SCHEMA_VERSION,
+    init_db,
+    reset_schema_registry,
+)
 
 
 def test_init_db(temp_db_uri):
@@ -40,10 +44,47 @@ def test_init_db(temp_db_uri):
     columns = {row[1]: row[2] for row in cursor.fetchall()}
 
     # Check that the expected columns exist with the correct types
+    assert columns["id"] == "INTEGER"
     assert columns["name"] == "TEXT"
-    assert columns["created"] == "TIMESTAMP"
+    assert columns["created"] == "INTEGER"
     assert columns["phone"] == "TEXT"
     assert columns["email"] == "TEXT"
 
     conn.close()
 
+
+
+def test_init_db_sets_schema_version(temp_db_uri):
+    init_db(temp_db_uri)
+
+    db_path = urlparse(temp_db_uri).path
+    conn = sqlite3.connect(db_path)
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    conn.close()
+
+    assert version == SCHEMA_VERSION
+
+
+def test_init_db_runs_once_per_database(temp_db_uri):
+    init_db(temp_db_uri)
+
+    # Drop a table behind the registry's back
+    db_path = urlparse(temp_db_uri).path
+    conn = sqlite3.connect(db_path)
+    conn.execute("DROP TABLE federation_payments")
+    conn.execute("DELETE FROM schema_migrations")
+    conn.execute("PRAGMA user_version = 0")
+    conn.commit()
+
+    # Later calls skip the schema check entirely
+    init_db(temp_db_uri)
+    tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+    assert "federation_payments" not in tables
+
+    # After a reset the schema is checked, and repaired, again
+    reset_schema_registry(temp_db_uri)
+    init_db(temp_db_uri)
+    tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+    assert "federation_payments" in tables
+
+    conn.close()
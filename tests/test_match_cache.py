@@ -0,0 +1,83 @@
+import pytest
+
+from ultimate_mcp_server.modules.utils import (
+    ScoreCache,
+    cache_stats,
+    clear_caches,
+    name_tokens,
+    normalize_name,
+    player_match_score,
+    top_player_matches,
+)
+
+NAMES = ["Juan García", "Juana Pérez", "Pedro López", "Ana Gil", "Julián Ruiz", "Jaime Sanz"]
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    clear_caches()
+    yield
+    clear_caches()
+
+
+def _stats():
+    return {stats.name: stats for stats in cache_stats()}
+
+
+def test_name_caches_count_hits():
+    assert name_tokens(normalize_name(" José  Núñez ")) == ("jose", "nunez")
+    assert name_tokens(normalize_name(" José  Núñez ")) == ("jose", "nunez")
+
+    stats = _stats()
+    assert (stats["normalize_name"].hits, stats["normalize_name"].misses) == (1, 1)
+    assert (stats["name_tokens"].hits, stats["name_tokens"].misses) == (1, 1)
+    assert stats["normalize_name"].size == 1
+
+
+def test_repeated_search_reuses_scores():
+    first = top_player_matches("Juan", NAMES, threshold=0.6, limit=3)
+    stats = _stats()["match_scores"]
+    assert (stats.hits, stats.misses, stats.size) == (0, len(NAMES), len(NAMES))
+
+    # Same query, different spelling: every score comes from the cache
+    assert top_player_matches(" JUAN ", NAMES, threshold=0.6, limit=3) == first
+    stats = _stats()["match_scores"]
+    assert (stats.hits, stats.misses, stats.size) == (len(NAMES), len(NAMES), len(NAMES))
+
+
+def test_cached_scores_match_uncached():
+    expected = {
+        (query, name, bar): player_match_score(query, name, bar)
+        for query in ["Juan", "Jaun Garcia", "Ana"]
+        for name in NAMES
+        for bar in [0.0, 0.6, 0.95]
+    }
+    clear_caches()
+
+    # Warm the cache with high bars first, so low-bar lookups can't reuse
+    # the lower bounds they left behind
+    for (query, name, bar), score in sorted(expected.items(), key=lambda item: -item[0][2]):
+        if score >= bar:
+            assert player_match_score(query, name, bar) == score
+        else:
+            assert player_match_score(query, name, bar) < bar
+    for (query, name, bar), score in expected.items():
+        if bar == 0.0:
+            assert player_match_score(query, name, bar) == score
+
+
+def test_score_cache_evicts_least_recent_queries():
+    cache = ScoreCache(max_queries=2, max_size=3)
+    juan = cache.scores_for(("juan", False))
+    cache.store(("juan", False), juan, {"juan garcia": (1.0, 0.0)}, 0, 1)
+    ana = cache.scores_for(("ana", False))
+    cache.store(("ana", False), ana, {"ana gil": (1.0, 0.0), "juana perez": (0.5, 0.0)}, 0, 2)
+    assert len(cache) == 3
+
+    # A third query drops "juan", the least recently searched one
+    pedro = cache.scores_for(("pedro", False))
+    cache.store(("pedro", False), pedro, {"pedro lopez": (1.0, 0.0)}, 0, 1)
+    assert cache.scores_for(("juan", False)) == {}
+    assert cache.scores_for(("pedro", False)) == {"pedro lopez": (1.0, 0.0)}
+    assert len(cache) == 1
+    assert (cache.stats().hits, cache.stats().misses) == (0, 4)
@@ -0,0 +1,371 @@
+import sqlite3
+from datetime import date, datetime
+from urllib.parse import urlparse
+
+import pytest
+from click.testing import CliRunner
+
+from ultimate_mcp_server.cli import cli
+from ultimate_mcp_server.modules.migrations import (
+    LATEST_VERSION,
+    MIGRATIONS,
+    Migration,
+    MigrationError,
+    apply_migrations,
+    migrate,
+    migration_status,
+)
+from ultimate_mcp_server.modules.migrations.m0001_initial_schema import (
+    upgrade as create_initial_schema,
+)
+from ultimate_mcp_server.modules.timestamps import to_day, to_timestamp
+
+
+def _db_path(db_uri):
+    return urlparse(db_uri).path
+
+
+def _indexes(conn):
+    return {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    }
+
+
+def test_migrate_fresh_database(temp_db_uri):
+    applied = migrate(temp_db_uri)
+
+    assert [m.version for m in applied] == [m.version for m in MIGRATIONS]
+
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    versions = [row[0] for row in conn.execute("SELECT version FROM schema_migrations ORDER BY version")]
+    assert versions == [m.version for m in MIGRATIONS]
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == LATEST_VERSION
+
+    indexes = _indexes(conn)
+    assert "idx_players_name" in indexes
+    assert "idx_tournament_players_player_id" in indexes
+    assert "idx_federation_payments_player_date" in indexes
+    assert "idx_tournaments_date" in indexes
+    conn.close()
+
+    # Running again is a no-op
+    assert migrate(temp_db_uri) == []
+
+
+def test_migrate_adopts_existing_database(temp_db_uri):
+    """Databases created before migrations existed are upgraded in place."""
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    create_initial_schema(conn.cursor())
+    conn.execute(
+        "INSERT INTO players (name, created, phone, email) VALUES ('Player 1', '2025-01-01 12:00:00', '+1', NULL)"
+    )
+    conn.commit()
+    conn.close()
+
+    migrate(temp_db_uri)
+
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    assert conn.execute("SELECT COUNT(*) FROM players").fetchone()[0] == 1
+    assert "idx_tournaments_date" in _indexes(conn)
+    conn.close()
+
+
+def _schema(conn):
+    return sorted(
+        conn.execute(
+            "SELECT type, name, sql FROM sqlite_master WHERE name != 'sqlite_sequence'"
+        ).fetchall()
+    )
+
+
+def test_migrations_run_again_on_latest_schema(temp_db_uri):
+    """Every migration can be applied again to a database that already has it."""
+    migrate(temp_db_uri)
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    schema = _schema(conn)
+    conn.execute("DELETE FROM schema_migrations")
+    conn.execute("PRAGMA user_version = 0")
+    conn.commit()
+    conn.close()
+
+    assert [m.version for m in migrate(temp_db_uri)] == [m.version for m in MIGRATIONS]
+
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    assert _schema(conn) == schema
+    conn.close()
+
+
+@pytest.mark.parametrize("version", range(LATEST_VERSION + 1))
+def test_migrate_from_every_version(temp_db_uri, tmp_path, version):
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    apply_migrations(conn, MIGRATIONS[:version])
+    conn.close()
+
+    assert [m.version for m in migrate(temp_db_uri)] == [
+        m.version for m in MIGRATIONS[version:]
+    ]
+
+    fresh = sqlite3.connect(tmp_path / "fresh.db")
+    apply_migrations(fresh, MIGRATIONS)
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    assert _schema(conn) == _schema(fresh)
+    conn.close()
+    fresh.close()
+
+
+def test_migration_status(temp_db_uri):
+    states = migration_status(temp_db_uri)
+    assert [state.applied for state in states] == [False] * len(MIGRATIONS)
+
+    migrate(temp_db_uri)
+
+    states = migration_status(temp_db_uri)
+    assert all(state.applied for state in states)
+    assert [state.name for state in states] == [m.name for m in MIGRATIONS]
+
+
+def test_failed_migration_is_rolled_back(temp_db_uri):
+    def create_then_fail(cursor):
+        cursor.execute("CREATE TABLE half_done (id INTEGER)")
+        cursor.execute("SELECT * FROM missing_table")
+
+    migrations = MIGRATIONS + [Migration(LATEST_VERSION + 1, "broken", create_then_fail)]
+
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    with pytest.raises(MigrationError) as excinfo:
+        apply_migrations(conn, migrations)
+    assert "broken" in str(excinfo.value)
+
+    # Earlier migrations stay applied, the broken one leaves no trace
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    assert "players" in tables
+    assert "half_done" not in tables
+    versions = [row[0] for row in conn.execute("SELECT version FROM schema_migrations")]
+    assert LATEST_VERSION + 1 not in versions
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == LATEST_VERSION
+    conn.close()
+
+
+def test_migrate_cli(temp_db_uri):
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["migrate", "--status", "--db-uri", temp_db_uri])
+    assert result.exit_code == 0
+    assert "pending" in result.output
+
+    result = runner.invoke(cli, ["migrate", "--db-uri", temp_db_uri])
+    assert result.exit_code == 0
+    assert f"Applied {len(MIGRATIONS)} migrations" in result.output
+
+    result = runner.invoke(cli, ["migrate", "--db-uri", temp_db_uri])
+    assert "Database is up to date" in result.output
+
+
+def _create_legacy_players(db_uri, names):
+    conn = sqlite3.connect(_db_path(db_uri))
+    create_initial_schema(conn.cursor())
+    conn.executemany(
+        "INSERT INTO players (name, created, phone) VALUES (?, '2025-01-01 12:00:00', '+1')",
+        [(name,) for name in names],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_migrate_backfills_normalized_names(temp_db_uri):
+    _create_legacy_players(temp_db_uri, ["José Núñez", "Ana  Gil"])
+
+    migrate(temp_db_uri)
+
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    rows = conn.execute("SELECT name, normalized_name FROM players ORDER BY name").fetchall()
+    assert rows == [("Ana  Gil", "ana gil"), ("José Núñez", "jose nunez")]
+    assert "idx_players_normalized_name" in _indexes(conn)
+    conn.close()
+
+
+def test_migrate_reports_normalized_name_clashes(temp_db_uri):
+    _create_legacy_players(temp_db_uri, ["José", "Jose", "Ana"])
+
+    with pytest.raises(MigrationError) as excinfo:
+        migrate(temp_db_uri)
+
+    assert "'Jose', 'José'" in str(excinfo.value) or "'José', 'Jose'" in str(excinfo.value)
+    # The failed migration (0003) is rolled back, earlier ones stay applied
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 2
+    conn.close()
+
+
+def test_migrate_converts_timestamps_to_integers(temp_db_uri):
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    create_initial_schema(conn.cursor())
+    conn.executescript("""
+        INSERT INTO players (name, created, phone)
+        VALUES ('Ana', '2025-01-01 12:00:00.250000', '+1');
+        INSERT INTO tournaments
+        (id, name, location, date, surface, registration_deadline, created)
+        VALUES (1, 'Open', 'Madrid', '2025-06-01', 'grass', '2025-05-15', '2025-01-02 09:30:00'),
+               (2, 'Gone', 'Madrid', '2025-07-01', 'beach', '2025-06-15', '2025-01-02 09:30:00');
+        DELETE FROM tournaments WHERE id = 2;
+        INSERT INTO tournament_players
+        (tournament_id, player_name, registered_at, has_paid, payment_date)
+        VALUES (1, 'Ana', '2025-01-03 10:00:00', 1, '2025-01-04 11:00:00');
+        INSERT INTO federation_payments (player_name, payment_date, amount, created_at)
+        VALUES ('Ana', '2025-01-05 00:00:00', 30, '2025-01-05 08:00:00');
+    """)
+    conn.commit()
+    conn.close()
+
+    migrate(temp_db_uri)
+
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    assert conn.execute("SELECT created FROM players").fetchone() == (
+        to_timestamp(datetime(2025, 1, 1, 12, 0, 0, 250000)),
+    )
+    assert conn.execute(
+        "SELECT date, registration_deadline, created FROM tournaments"
+    ).fetchall() == [
+        (to_day(date(2025, 6, 1)), to_day(date(2025, 5, 15)),
+         to_timestamp(datetime(2025, 1, 2, 9, 30))),
+    ]
+    # Rebuilding the tournaments table kept its registrations
+    assert conn.execute(
+        "SELECT registered_at, payment_date FROM tournament_players"
+    ).fetchall() == [
+        (to_timestamp(datetime(2025, 1, 3, 10, 0)), to_timestamp(datetime(2025, 1, 4, 11, 0))),
+    ]
+    assert conn.execute(
+        "SELECT typeof(payment_date), typeof(created_at) FROM federation_payments"
+    ).fetchall() == [("integer", "integer")]
+    assert "idx_tournaments_date" in _indexes(conn)
+    # Ids of deleted tournaments are not reused
+    conn.execute(
+        "INSERT INTO tournaments (name, location, date, surface, registration_deadline, created) "
+        "VALUES ('New', 'Madrid', 0, 'grass', 0, 0)"
+    )
+    assert conn.execute("SELECT MAX(id) FROM tournaments").fetchone() == (3,)
+    conn.close()
+
+
+def test_integer_timestamps_migration_runs_again(temp_db_uri):
+    migrate(temp_db_uri)
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    conn.execute(
+        "INSERT INTO players (name, normalized_name, created, phone) VALUES ('Ana', 'ana', 0, '+1')"
+    )
+    conn.execute("DELETE FROM schema_migrations WHERE version = 5")
+    conn.commit()
+    conn.close()
+
+    assert [m.version for m in migrate(temp_db_uri)] == [5]
+
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    assert conn.execute("SELECT created FROM players").fetchone() == (0,)
+    conn.close()
+
+
+def test_migrate_converts_payment_amounts_to_cents(temp_db_uri):
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    create_initial_schema(conn.cursor())
+    conn.executescript("""
+        INSERT INTO players (name, created, phone) VALUES ('Ana', '2025-01-01 12:00:00', '+1');
+        INSERT INTO federation_payments (id, player_name, payment_date, amount, created_at)
+        VALUES (1, 'Ana', '2025-01-05 00:00:00', 0.29, '2025-01-05 08:00:00'),
+               (2, 'Ana', '2025-01-06 00:00:00', 19.99, '2025-01-06 08:00:00'),
+               (3, 'Ana', '2025-01-07 00:00:00', 5, '2025-01-07 08:00:00');
+        DELETE FROM federation_payments WHERE id = 3;
+    """)
+    conn.commit()
+    conn.close()
+
+    migrate(temp_db_uri)
+
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    assert conn.execute(
+        "SELECT id, amount_cents FROM federation_payments ORDER BY id"
+    ).fetchall() == [(1, 29), (2, 1999)]
+    assert "idx_federation_payments_date" in _indexes(conn)
+    assert "idx_federation_payments_player_date" in _indexes(conn)
+    assert conn.execute(
+        "SELECT seq FROM sqlite_sequence WHERE name = 'federation_payments'"
+    ).fetchone() == (3,)
+    conn.close()
+
+
+def _version_6_database(db_uri):
+    conn = sqlite3.connect(_db_path(db_uri))
+    apply_migrations(conn, MIGRATIONS[:6])
+    conn.executescript("""
+        INSERT INTO players (name, normalized_name, created, phone)
+        VALUES ('Bea', 'bea', 0, '+1'), ('Ana', 'ana', 0, '+2');
+        INSERT INTO player_phonetic_codes (code, player_name) VALUES ('P', 'Ana'), ('B', 'Bea');
+        INSERT INTO tournaments
+        (id, name, location, date, surface, registration_deadline, created)
+        VALUES (1, 'Open', 'Madrid', 0, 'grass', 0, 0);
+        INSERT INTO tournament_players
+        (tournament_id, player_name, registered_at, has_paid, payment_date)
+        VALUES (1, 'Ana', 0, 1, 5), (1, 'Bea', 0, 0, NULL);
+        INSERT INTO federation_payments
+        (id, player_name, payment_date, amount_cents, notes, created_at)
+        VALUES (1, 'Ana', 10, 3000, NULL, 10), (2, 'Bea', 20, 1500, 'Late', 20);
+        DELETE FROM federation_payments WHERE id = 2;
+    """)
+    conn.commit()
+    return conn
+
+
+def test_migrate_adds_player_ids(temp_db_uri):
+    _version_6_database(temp_db_uri).close()
+
+    assert [m.version for m in migrate(temp_db_uri)] == list(range(7, LATEST_VERSION + 1))
+
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    # Players keep their rowids as ids
+    assert conn.execute("SELECT id, name FROM players ORDER BY id").fetchall() == [
+        (1, "Bea"), (2, "Ana"),
+    ]
+    assert conn.execute(
+        "SELECT tournament_id, player_id, has_paid, payment_date FROM tournament_players"
+    ).fetchall() == [(1, 1, 0, None), (1, 2, 1, 5)]
+    assert conn.execute(
+        "SELECT id, player_id, amount_cents FROM federation_payments"
+    ).fetchall() == [(1, 2, 3000)]
+    assert conn.execute(
+        "SELECT code, player_id FROM player_phonetic_codes ORDER BY code"
+    ).fetchall() == [("B", 1), ("P", 2)]
+    assert "WITHOUT ROWID" in conn.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'tournament_players'"
+    ).fetchone()[0]
+    assert {"idx_players_name", "idx_tournament_players_player_id"} <= _indexes(conn)
+    assert conn.execute(
+        "SELECT seq FROM sqlite_sequence WHERE name = 'federation_payments'"
+    ).fetchone() == (2,)
+
+    # Running it again changes nothing
+    conn.execute("DELETE FROM schema_migrations WHERE version = 7")
+    conn.commit()
+    conn.close()
+    assert [m.version for m in migrate(temp_db_uri)] == [7]
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    assert conn.execute("SELECT COUNT(*) FROM tournament_players").fetchone() == (2,)
+    conn.close()
+
+
+def test_migrate_player_ids_reports_missing_players(temp_db_uri):
+    conn = _version_6_database(temp_db_uri)
+    conn.execute(
+        "INSERT INTO federation_payments (player_name, payment_date, amount_cents, created_at) "
+        "VALUES ('Nobody', 0, 100, 0)"
+    )
+    conn.commit()
+    conn.close()
+
+    with pytest.raises(MigrationError) as excinfo:
+        migrate(temp_db_uri)
+
+    assert "federation_payments references missing players ('Nobody')" in str(excinfo.value)
+    conn = sqlite3.connect(_db_path(temp_db_uri))
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 6
+    conn.close()
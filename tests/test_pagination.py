@@ -0,0 +1,271 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+import ultimate_mcp_server
+
+from ultimate_mcp_server.modules.data_types import (
+    AddFederationPaymentCommand,
+    AddPlayerCommand,
+    AddTournamentCommand,
+    ListFederationPaymentsCommand,
+    ListPlayersCommand,
+    ListPlayerTournamentsCommand,
+    ListTournamentPlayersCommand,
+    ListTournamentsCommand,
+    RegisterPlayerCommand,
+    SurfaceType,
+)
+from ultimate_mcp_server.modules.functionality.add_federation_payment import (
+    add_federation_payment,
+)
+from ultimate_mcp_server.modules.functionality.add_player import add_player
+from ultimate_mcp_server.modules.functionality.add_tournament import add_tournament
+from ultimate_mcp_server.modules.functionality.list_federation_payments import (
+    PAYMENTS_PAGE,
+    list_federation_payments,
+)
+from ultimate_mcp_server.modules.functionality.list_player_tournaments import (
+    list_player_tournaments,
+)
+from ultimate_mcp_server.modules.functionality.list_players import PLAYERS_PAGE, list_players
+from ultimate_mcp_server.modules.functionality.list_tournament_players import (
+    REGISTRATIONS_PAGE,
+    _registrations,
+    list_tournament_players,
+)
+from ultimate_mcp_server.modules.functionality.list_tournaments import (
+    TOURNAMENTS_PAGE,
+    list_tournaments,
+)
+from ultimate_mcp_server.modules.functionality.register_player import register_player
+from ultimate_mcp_server.modules.pool import connection
+from ultimate_mcp_server.modules.records import RegistrationRecord
+
+NAMES = ["Eva", "Ana", "Diego", "Bea", "Carla"]
+
+
+def _all_pages(list_page, page, limit):
+    """Follow page tokens until the last page; returns the pages."""
+    pages, after = [], None
+    while True:
+        items = list_page(limit, after)
+        pages.append(items)
+        after = page.next_token(items, limit)
+        if after is None:
+            return pages
+
+
+@pytest.fixture
+def players(temp_db_uri):
+    for name in NAMES:
+        add_player(AddPlayerCommand(name=name, phone="+1", db_uri=temp_db_uri))
+    return sorted(NAMES)
+
+
+@pytest.fixture
+def tournaments(temp_db_uri):
+    start = date.today() + timedelta(days=30)
+    # Two tournaments on each date, so pages must break ties by id
+    return [
+        add_tournament(
+            AddTournamentCommand(
+                name=f"Open {i}",
+                location="Madrid",
+                date=start + timedelta(days=i // 2),
+                surface=SurfaceType.GRASS,
+                registration_deadline=start,
+                db_uri=temp_db_uri,
+            )
+        )
+        for i in range(5)
+    ]
+
+
+def test_list_players_pages(temp_db_uri, players):
+    pages = _all_pages(
+        lambda limit, after: list_players(
+            ListPlayersCommand(limit=limit, after=after, db_uri=temp_db_uri)
+        ),
+        PLAYERS_PAGE,
+        2,
+    )
+
+    assert [[player.name for player in page] for page in pages] == [
+        ["Ana", "Bea"], ["Carla", "Diego"], ["Eva"]
+    ]
+
+
+def test_list_tournaments_pages(temp_db_uri, tournaments):
+    pages = _all_pages(
+        lambda limit, after: list_tournaments(
+            ListTournamentsCommand(limit=limit, after=after, db_uri=temp_db_uri)
+        ),
+        TOURNAMENTS_PAGE,
+        2,
+    )
+
+    assert [[t.id for t in page] for page in pages] == [
+        [tournaments[0].id, tournaments[1].id],
+        [tournaments[2].id, tournaments[3].id],
+        [tournaments[4].id],
+    ]
+
+
+def test_list_tournament_players_pages(temp_db_uri, players, tournaments):
+    for name in players:
+        register_player(
+            RegisterPlayerCommand(
+                tournament_id=tournaments[0].id, player_name=name, db_uri=temp_db_uri
+            )
+        )
+
+    pages = _all_pages(
+        lambda limit, after: list_tournament_players(
+            ListTournamentPlayersCommand(
+                tournament_id=tournaments[0].id, limit=limit, after=after, db_uri=temp_db_uri
+            )
+        )[1],
+        REGISTRATIONS_PAGE,
+        3,
+    )
+
+    # By name across the page boundary, whatever order the players were added in
+    assert [[p.player.name for p in page] for page in pages] == [
+        ["Ana", "Bea", "Carla"], ["Diego", "Eva"]
+    ]
+
+
+def test_registration_pages_read_one_index_range(temp_db_uri, players, tournaments):
+    for name in players:
+        register_player(
+            RegisterPlayerCommand(
+                tournament_id=tournaments[0].id, player_name=name, db_uri=temp_db_uri
+            )
+        )
+    first_page = list_tournament_players(
+        ListTournamentPlayersCommand(tournament_id=tournaments[0].id, limit=2, db_uri=temp_db_uri)
+    )[1]
+    command = ListTournamentPlayersCommand(
+        tournament_id=tournaments[0].id,
+        limit=2,
+        after=REGISTRATIONS_PAGE.next_token(first_page, 2),
+        db_uri=temp_db_uri,
+    )
+
+    with connection(temp_db_uri) as conn:
+        statements = []
+        conn.set_trace_callback(statements.append)
+        page = list(_registrations(conn.cursor(), command, RegistrationRecord.decode))
+        conn.set_trace_callback(None)
+        plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {statements[-1]}")]
+
+    assert [registration.player.name for registration in page] == ["Carla", "Diego"]
+    # The page starts inside idx_tournament_players_sort_name, and nothing is sorted
+    assert any("idx_tournament_players_sort_name" in step for step in plan)
+    assert not any("TEMP B-TREE" in step for step in plan)
+
+
+def test_renamed_players_keep_their_roster_order(temp_db_uri, players, tournaments):
+    for name in players:
+        register_player(
+            RegisterPlayerCommand(
+                tournament_id=tournaments[0].id, player_name=name, db_uri=temp_db_uri
+            )
+        )
+    with connection(temp_db_uri) as conn:
+        conn.execute("UPDATE players SET name = 'Zoe' WHERE name = 'Bea'")
+        conn.commit()
+
+    registrations = list_tournament_players(
+        ListTournamentPlayersCommand(tournament_id=tournaments[0].id, db_uri=temp_db_uri)
+    )[1]
+
+    assert [p.player.name for p in registrations] == ["Ana", "Carla", "Diego", "Eva", "Zoe"]
+
+
+def test_list_player_tournaments_pages(temp_db_uri, players, tournaments):
+    for tournament in reversed(tournaments):
+        register_player(
+            RegisterPlayerCommand(
+                tournament_id=tournament.id, player_name="Ana", db_uri=temp_db_uri
+            )
+        )
+
+    pages = _all_pages(
+        lambda limit, after: list_player_tournaments(
+            ListPlayerTournamentsCommand(
+                player_name="Ana", limit=limit, after=after, db_uri=temp_db_uri
+            )
+        )[1],
+        TOURNAMENTS_PAGE,
+        3,
+    )
+
+    assert [[t.id for t in page] for page in pages] == [
+        [t.id for t in tournaments[:3]], [t.id for t in tournaments[3:]]
+    ]
+
+
+def test_list_federation_payments_pages(temp_db_uri, players):
+    day = datetime(2025, 1, 1, 10, 30)
+    # Same payment date twice: ties are broken by creation time, then id
+    for payment_date in [day, day, day + timedelta(days=1), day + timedelta(days=2)]:
+        add_federation_payment(
+            AddFederationPaymentCommand(
+                player_name="Ana", payment_date=payment_date, amount=10, db_uri=temp_db_uri
+            )
+        )
+    _, everything = list_federation_payments(
+        ListFederationPaymentsCommand(player_name="Ana", db_uri=temp_db_uri)
+    )
+
+    pages = _all_pages(
+        lambda limit, after: list_federation_payments(
+            ListFederationPaymentsCommand(
+                player_name="Ana", limit=limit, after=after, db_uri=temp_db_uri
+            )
+        )[1],
+        PAYMENTS_PAGE,
+        3,
+    )
+
+    assert [[p.id for p in page] for page in pages] == [
+        [p.id for p in everything[:3]], [p.id for p in everything[3:]]
+    ]
+    assert [p.payment_date for p in everything] == sorted(
+        (p.payment_date for p in everything), reverse=True
+    )
+
+
+def test_invalid_page_tokens(temp_db_uri, players):
+    token = PLAYERS_PAGE.next_token(
+        list_players(ListPlayersCommand(limit=1, db_uri=temp_db_uri)), 1
+    )
+
+    with pytest.raises(ValueError, match="not for tournaments"):
+        list_tournaments(ListTournamentsCommand(after=token, db_uri=temp_db_uri))
+    with pytest.raises(ValueError, match="Invalid page token"):
+        list_players(ListPlayersCommand(after="not a token!", db_uri=temp_db_uri))
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "list-players",
+        "list-tournaments",
+        "list-tournament-players",
+        "list-player-tournaments",
+        "list-federation-payments",
+    ],
+)
+def test_paged_listings_run_from_the_command_line(monkeypatch, command):
+    """Test that the console script runs the listings instead of starting the server."""
+    calls = []
+    monkeypatch.setattr(ultimate_mcp_server, "cli", lambda: calls.append("cli"))
+    monkeypatch.setattr(ultimate_mcp_server, "run_server", lambda: calls.append("server"))
+    monkeypatch.setattr("sys.argv", ["ultimate-team-mcp-server", command])
+
+    ultimate_mcp_server.main()
+
+    assert calls == ["cli"]
@@ -0,0 +1,52 @@
+import itertools
+
+import pytest
+
+from ultimate_mcp_server.modules.parallel import ParallelMatcher
+from ultimate_mcp_server.modules.utils import top_player_matches
+
+FIRST_NAMES = ["Juan", "María", "Pedro", "Ana", "Cabi", "Lucía", "José", "Iago", "Juana"]
+SURNAMES = ["García", "González", "Pérez", "Ortiz", "Núñez", "Gil", "Jiménez", "Garcés"]
+NAMES = sorted(f"{first} {last}" for first, last in itertools.product(FIRST_NAMES, SURNAMES))
+
+
+# Starting worker processes is slow, so the tests share them
+@pytest.fixture(scope="module")
+def matcher():
+    matcher = ParallelMatcher(processes=3, min_candidates=10)
+    yield matcher
+    matcher.shutdown()
+
+
+@pytest.mark.parametrize(
+    "query, threshold, limit",
+    [("Juan", 0.6, 5), ("Jaun Garcia", 0.6, 10), ("Kavi", 0.8, 3), ("Ana", 0.3, 100)],
+)
+def test_parallel_matches_equal_in_process_matches(matcher, query, threshold, limit):
+    rows = [(name, position) for position, name in enumerate(NAMES)]
+
+    matches = matcher.top_matches(query, rows, threshold, limit, name_of=lambda row: row[0])
+
+    assert matcher._pool is not None
+    assert matches == top_player_matches(
+        query, rows, threshold, limit, name_of=lambda row: row[0]
+    )
+
+
+def test_pool_is_reused_across_searches(matcher):
+    matcher.top_matches("Juan", NAMES, 0.6, 5)
+    pool = matcher._pool
+    matcher.top_matches("Pedro", NAMES, 0.6, 5)
+    assert matcher._pool is pool
+
+
+def test_small_searches_stay_in_process():
+    matcher = ParallelMatcher(processes=3, min_candidates=len(NAMES) + 1)
+    assert matcher.top_matches("Juan", NAMES, 0.6, 5) == top_player_matches(
+        "Juan", NAMES, 0.6, 5
+    )
+    assert matcher._pool is None
+
+    single = ParallelMatcher(processes=1, min_candidates=0)
+    single.top_matches("Juan", NAMES, 0.6, 5)
+    assert single._pool is None
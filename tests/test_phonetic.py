@@ -0,0 +1,161 @@
+from datetime import date, timedelta
+
+import pytest
+
+from ultimate_mcp_server.modules.data_types import (
+    AddPlayerCommand,
+    AddTournamentCommand,
+    ImportPlayersCommand,
+    MarkPaymentCommand,
+    RegisterPlayerCommand,
+    RemovePlayerCommand,
+    SearchPaidPlayersCommand,
+    SearchPlayersCommand,
+    SurfaceType,
+)
+from ultimate_mcp_server.modules.functionality.add_player import add_player
+from ultimate_mcp_server.modules.functionality.add_tournament import add_tournament
+from ultimate_mcp_server.modules.functionality.import_players import import_players
+from ultimate_mcp_server.modules.functionality.mark_payment import mark_payment
+from ultimate_mcp_server.modules.functionality.register_player import register_player
+from ultimate_mcp_server.modules.functionality.remove_player import remove_player
+from ultimate_mcp_server.modules.functionality.search_paid_players import search_paid_players
+from ultimate_mcp_server.modules.functionality.search_players import search_players
+from ultimate_mcp_server.modules.phonetic import phonetic_code, phonetic_key
+from ultimate_mcp_server.modules.pool import connection
+from ultimate_mcp_server.modules.utils import (
+    PHONETIC_MATCH_SCORE,
+    normalize_name,
+    player_match_score,
+    top_player_matches,
+)
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("Gonzales", "González"),
+        ("Yago", "Iago"),
+        ("Cabi", "Kavi"),
+        ("Jiménez", "Giménez"),
+        ("Hernández", "Ernandez"),
+        ("Lluís", "Yuis"),
+        ("Quique", "Kike"),
+        ("Vázquez", "Vasquez"),
+    ],
+)
+def test_sound_alikes_share_a_code(first, second):
+    assert phonetic_key(normalize_name(first)) == phonetic_key(normalize_name(second))
+
+
+@pytest.mark.parametrize("first, second", [("Pablo", "Paula"), ("Ana", "Eva"), ("Juan", "Luis")])
+def test_different_names_get_different_codes(first, second):
+    assert phonetic_code(normalize_name(first)) != phonetic_code(normalize_name(second))
+
+
+def test_player_match_score_phonetic_floor():
+    # difflib alone rates these below the default threshold
+    assert player_match_score("Kavi", "Cabi Ortiz", phonetic=True) == PHONETIC_MATCH_SCORE
+    assert player_match_score("Ortiz Kavi", "Cabi Ortiz", phonetic=True) < PHONETIC_MATCH_SCORE
+    assert player_match_score("Cabi Ortis", "Cabi Ortiz", phonetic=True) > PHONETIC_MATCH_SCORE
+    assert player_match_score("Bo", "Bea Gil", phonetic=True) < PHONETIC_MATCH_SCORE
+
+
+def test_phonetic_floor_is_opt_in():
+    """Test that default scores and rankings ignore how names sound."""
+    names = ["Cabi Ortiz", "Davina Ruiz", "Kavier Gil"]
+    plain = {name: player_match_score("Kavi", name) for name in names}
+
+    # "Cabi Ortiz" sounds like the query but keeps its plain fuzzy score
+    assert plain["Cabi Ortiz"] < 0.6
+    assert player_match_score("Kavi", "Cabi Ortiz", phonetic=True) == PHONETIC_MATCH_SCORE
+    # Phonetic scores are cached apart from plain ones
+    assert {name: player_match_score("Kavi", name) for name in names} == plain
+
+    expected = sorted(
+        ((name, score) for name, score in plain.items() if score >= 0.6),
+        key=lambda match: -match[1],
+    )
+    assert top_player_matches("Kavi", names, 0.6, 10) == expected
+    assert top_player_matches("Kavi", names, 0.6, 10, phonetic=True)[0] == (
+        "Cabi Ortiz", PHONETIC_MATCH_SCORE
+    )
+
+
+def _stored_codes(db_uri):
+    with connection(db_uri) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT c.code, p.name FROM player_phonetic_codes c "
+            "JOIN players p ON p.id = c.player_id ORDER BY 1, 2"
+        )
+        return cursor.fetchall()
+
+
+def test_phonetic_codes_follow_players(temp_db_uri, tmp_path):
+    add_player(AddPlayerCommand(name="Cabi Ortiz", phone="+1", db_uri=temp_db_uri))
+    csv_path = tmp_path / "players.csv"
+    csv_path.write_text("name,phone\nYago Gil,+2\nCabi Ortiz,+3\n")
+    import_players(ImportPlayersCommand(csv_path=csv_path, db_uri=temp_db_uri))
+
+    assert _stored_codes(temp_db_uri) == [
+        ("ARTS", "Cabi Ortiz"),
+        ("JL", "Yago Gil"),
+        ("KB", "Cabi Ortiz"),
+        ("YG", "Yago Gil"),
+    ]
+
+    remove_player(RemovePlayerCommand(name="Yago Gil", db_uri=temp_db_uri))
+    assert [row[1] for row in _stored_codes(temp_db_uri)] == ["Cabi Ortiz", "Cabi Ortiz"]
+
+
+def test_search_finds_sound_alikes(temp_db_uri):
+    today = date.today()
+    tournament = add_tournament(
+        AddTournamentCommand(
+            name="Test Tournament",
+            location="Test Location",
+            date=today + timedelta(days=30),
+            surface=SurfaceType.GRASS,
+            registration_deadline=today + timedelta(days=15),
+            db_uri=temp_db_uri,
+        )
+    )
+    for name in ["Cabi Ortiz", "Davina Ruiz", "Pedro Ruiz"]:
+        add_player(AddPlayerCommand(name=name, phone="+1", db_uri=temp_db_uri))
+        register_player(
+            RegisterPlayerCommand(
+                tournament_id=tournament.id, player_name=name, db_uri=temp_db_uri
+            )
+        )
+        mark_payment(
+            MarkPaymentCommand(tournament_id=tournament.id, player_name=name, db_uri=temp_db_uri)
+        )
+
+    # "Kavi" shares too few characters with "Cabi Ortiz" to reach the
+    # threshold, but sounds like it, so Cabi is only found through its
+    # phonetic code
+    _, paid = search_paid_players(
+        SearchPaidPlayersCommand(
+            tournament_id=tournament.id, name_query="Kavi", phonetic=True, db_uri=temp_db_uri
+        )
+    )
+    assert [(p.player.name, p.match_score) for p in paid] == [
+        ("Cabi Ortiz", PHONETIC_MATCH_SCORE),
+        ("Davina Ruiz", pytest.approx(0.6)),
+    ]
+
+    matches = search_players(
+        SearchPlayersCommand(name_query="Kavi", phonetic=True, db_uri=temp_db_uri)
+    )
+    assert [match.player.name for match in matches] == ["Cabi Ortiz", "Davina Ruiz"]
+
+    # Without phonetic scoring only the plain fuzzy match is found
+    _, paid = search_paid_players(
+        SearchPaidPlayersCommand(
+            tournament_id=tournament.id, name_query="Kavi", db_uri=temp_db_uri
+        )
+    )
+    assert [p.player.name for p in paid] == ["Davina Ruiz"]
+    matches = search_players(SearchPlayersCommand(name_query="Kavi", db_uri=temp_db_uri))
+    assert [match.player.name for match in matches] == ["Davina Ruiz"]
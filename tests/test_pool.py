@@ -0,0 +1,110 @@
+import sqlite3
+import threading
+
+import pytest
+
+from ultimate_mcp_server.modules.data_types import AddPlayerCommand, ListPlayersCommand
+from ultimate_mcp_server.modules.functionality.add_player import add_player
+from ultimate_mcp_server.modules.functionality.list_players import list_players
+from ultimate_mcp_server.modules.pool import ConnectionPool, connection, get_pool
+
+
+def test_connection_is_reused(temp_db_uri):
+    """Test that consecutive checkouts reuse the same pooled connection."""
+    with connection(temp_db_uri) as first:
+        pass
+    with connection(temp_db_uri) as second:
+        pass
+
+    assert first is second
+    assert get_pool(temp_db_uri).idle_count == 1
+
+
+def test_functionality_reuses_pooled_connection(temp_db_uri):
+    """Test that a command keeps a single pooled connection open across calls."""
+    add_player(AddPlayerCommand(name="Player 1", phone="+1111111111", db_uri=temp_db_uri))
+    add_player(AddPlayerCommand(name="Player 2", phone="+2222222222", db_uri=temp_db_uri))
+    players = list_players(ListPlayersCommand(db_uri=temp_db_uri))
+
+    assert len(players) == 2
+    assert get_pool(temp_db_uri).idle_count == 1
+
+
+def test_uncommitted_work_is_rolled_back(temp_db_uri):
+    """Test that a connection returns to the pool without pending changes."""
+    with connection(temp_db_uri) as conn:
+        conn.execute("CREATE TABLE items (value TEXT)")
+        conn.commit()
+
+    with pytest.raises(RuntimeError):
+        with connection(temp_db_uri) as conn:
+            conn.execute("INSERT INTO items VALUES ('lost')")
+            raise RuntimeError("boom")
+
+    with connection(temp_db_uri) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+
+def test_unhealthy_connection_is_replaced(temp_db_uri):
+    """Test that a broken idle connection is discarded on checkout."""
+    with connection(temp_db_uri) as conn:
+        broken = conn
+    broken.close()
+
+    with connection(temp_db_uri) as conn:
+        assert conn is not broken
+        assert conn.execute("SELECT 1").fetchone() == (1,)
+
+
+def test_idle_connections_are_evicted(temp_db_uri):
+    """Test that connections idle past the timeout are not handed out again."""
+    pool = ConnectionPool(temp_db_uri, idle_timeout=0)
+    conn = pool.acquire()
+    pool.release(conn)
+
+    fresh = pool.acquire()
+    assert fresh is not conn
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+    pool.release(fresh)
+    pool.close()
+
+
+def test_pool_size_limits_idle_connections(temp_db_uri):
+    """Test that at most max_size connections are kept when returned."""
+    pool = ConnectionPool(temp_db_uri, max_size=2)
+    connections = [pool.acquire() for _ in range(4)]
+    assert len({id(conn) for conn in connections}) == 4
+
+    for conn in connections:
+        pool.release(conn)
+
+    assert pool.idle_count == 2
+    pool.close()
+    assert pool.idle_count == 0
+
+
+def test_pooled_connection_used_from_other_thread(temp_db_uri):
+    """Test that pooled connections can be checked out from any thread."""
+    with connection(temp_db_uri) as conn:
+        conn.execute("CREATE TABLE items (value TEXT)")
+        conn.commit()
+
+    errors = []
+
+    def worker():
+        try:
+            with connection(temp_db_uri) as conn:
+                conn.execute("INSERT INTO items VALUES ('from thread')")
+                conn.commit()
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert errors == []
+    with connection(temp_db_uri) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
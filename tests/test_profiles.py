@@ -0,0 +1,107 @@
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from ultimate_mcp_server.modules.data_types import (
+    AddFederationPaymentCommand,
+    AddPlayerCommand,
+    ListPlayersCommand,
+    RemovePlayerCommand,
+)
+from ultimate_mcp_server.modules.functionality.add_federation_payment import (
+    add_federation_payment,
+)
+from ultimate_mcp_server.modules.functionality.add_player import add_player
+from ultimate_mcp_server.modules.functionality.list_players import list_players
+from ultimate_mcp_server.modules.functionality.remove_player import remove_player
+from ultimate_mcp_server.modules.migrations import MigrationError
+from ultimate_mcp_server.modules.pool import configure_pool, connection
+from ultimate_mcp_server.modules.profiles import PROFILES, get_profile
+from ultimate_mcp_server.modules.utils import get_connection
+
+
+def _pragma(conn, name):
+    cursor = conn.cursor()
+    cursor.execute(f"PRAGMA {name}")
+    return cursor.fetchone()[0]
+
+
+def test_default_profile_is_durable(temp_db_uri):
+    """Test that connections use WAL, full sync and foreign keys by default."""
+    with connection(temp_db_uri) as conn:
+        assert _pragma(conn, "journal_mode") == "wal"
+        assert _pragma(conn, "synchronous") == 2  # FULL
+        assert _pragma(conn, "foreign_keys") == 1
+
+
+def test_fast_local_profile(temp_db_uri):
+    """Test that the fast-local profile relaxes syncing and keeps temp data in memory."""
+    configure_pool(temp_db_uri, profile="fast-local")
+
+    with connection(temp_db_uri) as conn:
+        assert _pragma(conn, "journal_mode") == "wal"
+        assert _pragma(conn, "synchronous") == 1  # NORMAL
+        assert _pragma(conn, "temp_store") == 2  # MEMORY
+        assert _pragma(conn, "cache_size") == PROFILES["fast-local"].cache_size
+
+
+def test_changing_profile_drops_idle_connections(temp_db_uri):
+    """Test that switching profiles doesn't hand out connections with old PRAGMAs."""
+    with connection(temp_db_uri) as first:
+        pass
+
+    configure_pool(temp_db_uri, profile="fast-local")
+
+    with connection(temp_db_uri) as second:
+        assert second is not first
+        assert _pragma(second, "synchronous") == 1
+
+
+def test_foreign_keys_cascade_on_remove_player(temp_db_uri):
+    """Test that removing a player also removes their federation payments."""
+    add_player(AddPlayerCommand(name="Player 1", phone="+1111111111", db_uri=temp_db_uri))
+    add_federation_payment(
+        AddFederationPaymentCommand(
+            player_name="Player 1",
+            payment_date=datetime(2025, 1, 15),
+            amount=50.0,
+            db_uri=temp_db_uri,
+        )
+    )
+
+    remove_player(RemovePlayerCommand(name="Player 1", db_uri=temp_db_uri))
+
+    with connection(temp_db_uri) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM federation_payments")
+        assert cursor.fetchone()[0] == 0
+
+
+def test_read_only_profile_rejects_writes(temp_db_uri):
+    """Test that the analytics profile can read but not write."""
+    add_player(AddPlayerCommand(name="Player 1", phone="+1111111111", db_uri=temp_db_uri))
+
+    configure_pool(temp_db_uri, profile="read-only-analytics")
+
+    assert len(list_players(ListPlayersCommand(db_uri=temp_db_uri))) == 1
+    with pytest.raises(sqlite3.OperationalError):
+        add_player(AddPlayerCommand(name="Player 2", phone="+2222222222", db_uri=temp_db_uri))
+
+
+def test_read_only_profile_refuses_to_migrate(temp_db_uri):
+    """Test that a read-only connection reports an outdated schema instead of failing midway."""
+    configure_pool(temp_db_uri, profile="read-only-analytics")
+
+    with pytest.raises(MigrationError):
+        list_players(ListPlayersCommand(db_uri=temp_db_uri))
+
+
+def test_unknown_profile(temp_db_uri):
+    """Test that unknown profile names are rejected."""
+    with pytest.raises(ValueError):
+        get_profile("turbo")
+    with pytest.raises(ValueError):
+        configure_pool(temp_db_uri, profile="turbo")
+    with pytest.raises(ValueError):
+        get_connection(temp_db_uri, "turbo")
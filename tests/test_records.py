@@ -0,0 +1,135 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from ultimate_mcp_server.modules.data_types import (
+    AddPlayerCommand,
+    AddTournamentCommand,
+    ListPlayersCommand,
+    ListTournamentPlayersCommand,
+    Player,
+    RegisterPlayerCommand,
+    SurfaceType,
+    Tournament,
+)
+from ultimate_mcp_server.modules.functionality.add_player import add_player
+from ultimate_mcp_server.modules.functionality.add_tournament import add_tournament
+from ultimate_mcp_server.modules.functionality.list_players import (
+    list_player_records,
+    list_players,
+)
+from ultimate_mcp_server.modules.functionality.list_tournament_players import (
+    list_tournament_player_records,
+    list_tournament_players,
+)
+from ultimate_mcp_server.modules.functionality.register_player import register_player
+from ultimate_mcp_server.modules.pool import connection
+from ultimate_mcp_server.modules.records import (
+    PLAYER_COLUMNS,
+    TOURNAMENT_COLUMNS,
+    PlayerRecord,
+    TournamentRecord,
+    fetch_tournament,
+    select,
+)
+from ultimate_mcp_server.modules.timestamps import from_timestamp
+
+
+def _add_tournament(db_uri):
+    start = date.today() + timedelta(days=30)
+    return add_tournament(
+        AddTournamentCommand(
+            name="Spring Open",
+            location="Madrid",
+            date=start,
+            surface=SurfaceType.BEACH,
+            registration_deadline=start - timedelta(days=7),
+            db_uri=db_uri,
+        )
+    )
+
+
+def test_select_decodes_rows(temp_db_uri):
+    add_player(AddPlayerCommand(name="Ana", phone="+1", db_uri=temp_db_uri))
+
+    with connection(temp_db_uri) as conn:
+        cursor = conn.cursor()
+        query = f"SELECT {PLAYER_COLUMNS} FROM players"
+        record = select(cursor, PlayerRecord.decode, query).fetchone()
+        model = select(cursor, PlayerRecord.decode_model, query).fetchone()
+        # The caller's cursor keeps returning plain rows
+        cursor.execute("SELECT created FROM players")
+        created = cursor.fetchone()[0]
+
+    assert isinstance(record, PlayerRecord)
+    assert record.created == from_timestamp(created)
+    assert model == record.to_model()
+    assert isinstance(model, Player)
+
+
+def test_tournament_record_round_trip(temp_db_uri):
+    added = _add_tournament(temp_db_uri)
+
+    with connection(temp_db_uri) as conn:
+        record = fetch_tournament(conn.cursor(), added.id)
+        rows = select(
+            conn.cursor(), TournamentRecord.decode, f"SELECT {TOURNAMENT_COLUMNS} FROM tournaments"
+        ).fetchall()
+
+    assert rows == [record]
+    assert record.surface is SurfaceType.BEACH
+    assert record.to_model() == added
+    # The trusted model is the one validation would have built
+    assert record.to_model() == Tournament(**record._asdict())
+
+
+def test_to_model_skips_validation():
+    record = PlayerRecord("Ana", "+1", None, datetime(2025, 3, 1, 12, 0))
+
+    player = record.to_model()
+
+    assert player == Player(name="Ana", phone="+1", created=datetime(2025, 3, 1, 12, 0))
+    assert player.model_dump()["created"] == datetime(2025, 3, 1, 12, 0)
+
+
+def test_trusted_models_track_assignments():
+    player = PlayerRecord("Ana", "+1", None, datetime(2025, 3, 1, 12, 0)).to_model()
+
+    player.phone = "+2"
+
+    assert player.phone == "+2"
+    assert player.model_fields_set == {"name", "phone", "email", "created"}
+    assert player.model_dump_json()
+
+
+def test_record_listings_match_model_listings(temp_db_uri):
+    tournament = _add_tournament(temp_db_uri)
+    for name in ["Bea", "Ana"]:
+        add_player(AddPlayerCommand(name=name, phone="+1", db_uri=temp_db_uri))
+        register_player(
+            RegisterPlayerCommand(
+                tournament_id=tournament.id, player_name=name, db_uri=temp_db_uri
+            )
+        )
+    players_command = ListPlayersCommand(db_uri=temp_db_uri)
+    roster_command = ListTournamentPlayersCommand(
+        tournament_id=tournament.id, db_uri=temp_db_uri
+    )
+
+    records = list_player_records(players_command)
+    record_tournament, registrations = list_tournament_player_records(roster_command)
+    model_tournament, players_with_payment = list_tournament_players(roster_command)
+
+    assert [record.to_model() for record in records] == list_players(players_command)
+    assert record_tournament.to_model() == model_tournament
+    assert [
+        (registration.player.to_model(), registration.has_paid, registration.payment_date)
+        for registration in registrations
+    ] == [
+        (item.player, item.has_paid, item.payment_date) for item in players_with_payment
+    ]
+    # Neither records nor listing items carry a per-instance dict
+    assert not hasattr(registrations[0], "__dict__")
+    assert not hasattr(players_with_payment[0], "__dict__")
+    with pytest.raises(AttributeError):
+        players_with_payment[0].has_paid = True
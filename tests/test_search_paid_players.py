@@ -14,7 +14,11 @@ from ultimate_mcp_server.modules.functionality.add_tournament import add_tournam
 from ultimate_mcp_server.modules.functionality.register_player import register_player
 from ultimate_mcp_server.modules.functionality.mark_payment import mark_payment
 from ultimate_mcp_server.modules.functionality.search_paid_players import search_paid_players
-from ultimate_mcp_server.modules.utils import fuzzy_match_score
+from ultimate_mcp_server.modules.utils import (
+    fuzzy_match_score,
+    player_match_score,
+    top_player_matches,
+)
 
 
 @pytest.fixture
@@ -98,8 +102,9 @@ def test_fuzzy_match_score():
     
     # Similar but not exact matches
     assert 0.7 < fuzzy_match_score("Juan", "Jaun") < 1.0  # Typo
-    assert 0.7 < fuzzy_match_score("García", "Garcia") < 1.0  # Missing accent
-    assert 0.7 < fuzzy_match_score("Juan García", "Juan Garcia") < 1.0
+    # Accents are ignored, like case
+    assert fuzzy_match_score("García", "Garcia") == 1.0
+    assert fuzzy_match_score("Juan García", "Juan Garcia") == 1.0
     
     # Less similar matches
     assert 0.5 < fuzzy_match_score("Juan", "Juana") < 0.9
@@ -233,4 +238,114 @@ def test_tournament_not_found(temp_db_uri):
     with pytest.raises(ValueError) as excinfo:
         search_paid_players(command)
     
-    assert "not found" in str(excinfo.value)
\ No newline at end of file
+    assert "not found" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("query", ["   ", "\t"])
+def test_blank_query_matches_nobody(temp_db_uri, test_tournament, paid_players, query):
+    """Test that a query with nothing left after normalizing returns no players."""
+    command = SearchPaidPlayersCommand(
+        tournament_id=test_tournament.id, name_query=query, db_uri=temp_db_uri
+    )
+    tournament, results = search_paid_players(command)
+
+    assert tournament.id == test_tournament.id
+    assert results == []
+
+
+def test_sound_alike_players_sharing_few_characters_are_found(temp_db_uri, test_tournament):
+    """Test that sound-alike players are candidates even when they share few characters."""
+    add_player(AddPlayerCommand(name="Cabi Ruiz", phone="+1", db_uri=temp_db_uri))
+    register_player(RegisterPlayerCommand(
+        tournament_id=test_tournament.id, player_name="Cabi Ruiz", db_uri=temp_db_uri
+    ))
+    mark_payment(MarkPaymentCommand(
+        tournament_id=test_tournament.id, player_name="Cabi Ruiz", db_uri=temp_db_uri
+    ))
+    command = SearchPaidPlayersCommand(
+        tournament_id=test_tournament.id,
+        name_query="Kavi",
+        match_threshold=0.8,
+        phonetic=True,
+        db_uri=temp_db_uri,
+    )
+
+    # "kavi" and "cabi" share only "a" and "i", too few to reach 0.8 by characters
+    _, results = search_paid_players(command)
+    assert [(r.player.name, r.match_score) for r in results] == [("Cabi Ruiz", 0.8)]
+
+
+@pytest.mark.parametrize(
+    "query, threshold",
+    [
+        ("Juan", 0.6),
+        ("garcia", 0.6),  # "María Rodríguez" (0.73) shares no trigram with it
+        ("Calros", 0.6),  # "Carlos" (0.83) ranks above "Cal Rose" (0.67)
+        ("Jaun", 0.6),  # No trigram in common with "Juan"
+        ("María Rodrigues", 0.6),
+        ("ro", 0.3),
+        ("Pedro", 0.4),
+        ("Pedro", 0.9),
+        ("Juan", 0.0),
+        ("xyz", 0.6),
+    ],
+)
+def test_prefiltered_search_matches_full_scan(
+    temp_db_uri, test_tournament, test_players, paid_players, query, threshold
+):
+    """Test that ruling out names before scoring them doesn't change the results."""
+    for name in ("Carlos", "Cal Rose"):
+        add_player(AddPlayerCommand(name=name, phone="+1", db_uri=temp_db_uri))
+        register_player(RegisterPlayerCommand(
+            tournament_id=test_tournament.id, player_name=name, db_uri=temp_db_uri
+        ))
+        mark_payment(MarkPaymentCommand(
+            tournament_id=test_tournament.id, player_name=name, db_uri=temp_db_uri
+        ))
+    command = SearchPaidPlayersCommand(
+        tournament_id=test_tournament.id,
+        name_query=query,
+        match_threshold=threshold,
+        db_uri=temp_db_uri,
+    )
+    _, results = search_paid_players(command)
+
+    paid_names = sorted([p.player_name for p in paid_players] + ["Carlos", "Cal Rose"])
+    assert [(r.player.name, r.match_score) for r in results] == top_player_matches(
+        query, paid_names, threshold, command.limit
+    )
+
+
+ROSTER = [
+    "Juan García", "Juana Gil", "Juan Gil", "María Rodríguez", "Mario Ruiz",
+    "Pedro López", "Ana Martínez", "Anabel Ortiz", "Carlos Sánchez", "Carla Sanz",
+    "Laura González", "Lorena Gómez", "Jon Smith", "John Smith", "Joan Mas",
+]
+
+
+@pytest.mark.parametrize("query", ["Juan", "Jaun", "ana", "Smith", "Carlos Sanz", "zzz"])
+@pytest.mark.parametrize("threshold", [0.0, 0.5, 0.8])
+def test_player_match_score_min_score_is_exact(query, threshold):
+    """Test that early exit never changes a score that reaches min_score."""
+    for name in ROSTER:
+        exact = player_match_score(query, name)
+        bounded = player_match_score(query, name, threshold)
+        if exact >= threshold:
+            assert bounded == exact
+        else:
+            assert bounded < threshold
+
+
+@pytest.mark.parametrize("query", ["Juan", "Jaun", "ana", "Smith", "Carlos Sanz", "zzz"])
+@pytest.mark.parametrize("limit", [1, 3, 100])
+def test_top_player_matches_equals_sort_and_slice(query, limit):
+    """Test that heap top-k selection returns what a full sort would."""
+    names = sorted(ROSTER)
+    expected = sorted(
+        ((name, player_match_score(query, name)) for name in names),
+        key=lambda match: (-match[1], match[0]),
+    )
+    expected = [match for match in expected if match[1] >= 0.5][:limit]
+
+    assert top_player_matches(query, names, 0.5, limit) == expected
+    assert top_player_matches(query, names, 0.5, 0) == []
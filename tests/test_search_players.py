@@ -0,0 +1,155 @@
+import csv
+import importlib
+import tempfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from ultimate_mcp_server.cli import cli
+from ultimate_mcp_server.modules.data_types import (
+    AddPlayerCommand,
+    ImportPlayersCommand,
+    RemovePlayerCommand,
+    SearchPlayersCommand,
+)
+from ultimate_mcp_server.modules.functionality.add_player import add_player
+from ultimate_mcp_server.modules.functionality.import_players import import_players
+from ultimate_mcp_server.modules.functionality.remove_player import remove_player
+from ultimate_mcp_server.modules.functionality.search_players import search_players
+from ultimate_mcp_server.modules.name_index import NameIndex, get_name_index
+from ultimate_mcp_server.modules.session import Session
+from ultimate_mcp_server.modules.utils import top_player_matches
+
+
+def _add(db_uri, name, session=None):
+    add_player(AddPlayerCommand(name=name, phone="+1234567890", db_uri=db_uri), session)
+
+
+def _search(db_uri, query, **kwargs):
+    command = SearchPlayersCommand(name_query=query, db_uri=db_uri, **kwargs)
+    return [match.player.name for match in search_players(command)]
+
+
+def test_name_index_search():
+    index = NameIndex(["Juan Perez", "Maria Lopez", "Ana Gil"])
+
+    assert index.search("Maria")[0] == ("Maria Lopez", pytest.approx(0.9, abs=0.1))
+    # A typo in the first letter still shares the letters
+    assert index.search("Jaun")[0][0] == "Juan Perez"
+    assert index.search("Zzzz") == []
+
+    index.remove("Ana Gil")
+    assert "Ana Gil" not in index
+    assert index.search("Ana") == []
+
+
+ROSTER = [
+    "Ana Gil", "Juan Garcia", "Jran Gaucia", "Juana Gil", "María Rodríguez", "Mario Ruiz",
+    "Laura González", "Lorena Gómez", "Carlos", "Cal Rose", "Iago Sanz", "Jon Smith",
+]
+
+
+@pytest.mark.parametrize(
+    "query", ["Uanj", "Jnua", "Calros", "garcia", "Gonzales", "Yago", "ro", "Smith", "zzz"]
+)
+@pytest.mark.parametrize("threshold", [0.0, 0.5, 0.6, 0.8, 0.9])
+@pytest.mark.parametrize("limit", [1, 3, 20])
+def test_name_index_search_matches_full_scan(query, threshold, limit):
+    """Test that the index never drops a name a full scan would return."""
+    index = NameIndex(ROSTER)
+    index.remove("Mario Ruiz")
+    roster = sorted(name for name in ROSTER if name != "Mario Ruiz")
+
+    assert index.search(query, threshold, limit) == top_player_matches(
+        query, roster, threshold, limit
+    )
+
+
+def test_search_players_follows_writes(temp_db_uri):
+    _add(temp_db_uri, "Juan Perez")
+    _add(temp_db_uri, "Maria Lopez")
+
+    assert _search(temp_db_uri, "Juan") == ["Juan Perez"]
+    # The index is built now; later writes must reach it
+    assert len(get_name_index(temp_db_uri)) == 2
+
+    _add(temp_db_uri, "Juana Martin")
+    assert _search(temp_db_uri, "Juana")[0] == "Juana Martin"
+
+    remove_player(RemovePlayerCommand(name="Juan Perez", db_uri=temp_db_uri))
+    assert "Juan Perez" not in _search(temp_db_uri, "Juan")
+    assert len(get_name_index(temp_db_uri)) == 2
+
+
+def test_search_players_ignores_rolled_back_writes(temp_db_uri):
+    _add(temp_db_uri, "Maria Lopez")
+    get_name_index(temp_db_uri)
+
+    with pytest.raises(RuntimeError):
+        with Session(temp_db_uri) as session:
+            _add(temp_db_uri, "Mario Lopez", session)
+            # Not visible until the session commits
+            assert "Mario Lopez" not in get_name_index(temp_db_uri)
+            raise RuntimeError("abort")
+
+    assert "Mario Lopez" not in get_name_index(temp_db_uri)
+    assert _search(temp_db_uri, "Mario") == ["Maria Lopez"]
+
+
+def test_search_players_after_import(temp_db_uri):
+    get_name_index(temp_db_uri)
+    with tempfile.NamedTemporaryFile(
+        suffix=".csv", mode="w", delete=False, newline=""
+    ) as csv_file:
+        csv_path = Path(csv_file.name)
+        writer = csv.writer(csv_file)
+        writer.writerow(["name", "phone"])
+        writer.writerow(["Carlos Ruiz", "+1111111111"])
+        writer.writerow(["Lucia Ruiz", "+2222222222"])
+
+    try:
+        import_players(
+            ImportPlayersCommand(csv_path=csv_path, dry_run=True, db_uri=temp_db_uri)
+        )
+        assert len(get_name_index(temp_db_uri)) == 0
+
+        import_players(ImportPlayersCommand(csv_path=csv_path, db_uri=temp_db_uri))
+        assert _search(temp_db_uri, "Lucia") == ["Lucia Ruiz"]
+        assert _search(temp_db_uri, "Ruiz") == ["Carlos Ruiz", "Lucia Ruiz"]
+    finally:
+        csv_path.unlink()
+
+
+def test_large_import_reloads_the_name_index(temp_db_uri, tmp_path, monkeypatch):
+    module = importlib.import_module(
+        "ultimate_mcp_server.modules.functionality.import_players"
+    )
+    monkeypatch.setattr(module, "IMPORT_CHUNK_SIZE", 2)
+    _add(temp_db_uri, "Ana Gil")
+    index = get_name_index(temp_db_uri)
+    csv_path = tmp_path / "players.csv"
+    with open(csv_path, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["name", "phone"])
+        writer.writerows([f"Ruiz {i}", f"+{i}"] for i in range(5))
+
+    import_players(ImportPlayersCommand(csv_path=csv_path, db_uri=temp_db_uri))
+
+    # More names than a chunk: the index is loaded again instead of updated
+    assert get_name_index(temp_db_uri) is not index
+    assert len(get_name_index(temp_db_uri)) == 6
+    assert _search(temp_db_uri, "Ruiz 4")[0] == "Ruiz 4"
+
+
+def test_search_players_cli(temp_db_uri):
+    _add(temp_db_uri, "Juan Perez")
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["search-players", "Jaun", "--db-uri", temp_db_uri])
+    assert result.exit_code == 0
+    assert "- Juan Perez (Match:" in result.output
+
+    result = runner.invoke(cli, ["search-players", "Xavier", "--db-uri", temp_db_uri])
+    assert result.exit_code == 0
+    assert "No players matching 'Xavier' found" in result.output
@@ -0,0 +1,176 @@
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+
+from ultimate_mcp_server.modules.data_types import (
+    AddPlayerCommand,
+    AddTournamentCommand,
+    ListPlayersCommand,
+    ListTournamentPlayersCommand,
+    MarkPaymentCommand,
+    RegisterPlayerCommand,
+    SurfaceType,
+)
+from ultimate_mcp_server.modules.functionality.add_player import add_player
+from ultimate_mcp_server.modules.functionality.add_tournament import add_tournament
+from ultimate_mcp_server.modules.functionality.list_players import list_players
+from ultimate_mcp_server.modules.functionality.list_tournament_players import (
+    list_tournament_players,
+)
+from ultimate_mcp_server.modules.functionality.mark_payment import mark_payment
+from ultimate_mcp_server.modules.functionality.register_player import register_player
+from ultimate_mcp_server.modules.session import Session
+
+
+def _committed_player_count(db_uri):
+    """Count players through a separate connection, i.e. committed rows only."""
+    conn = sqlite3.connect(db_uri.replace("file://", ""))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _add_tournament(db_uri, session=None):
+    return add_tournament(
+        AddTournamentCommand(
+            name="Test Tournament",
+            location="Test Location",
+            date=date.today() + timedelta(days=30),
+            surface=SurfaceType.GRASS,
+            registration_deadline=date.today() + timedelta(days=15),
+            db_uri=db_uri,
+        ),
+        session=session,
+    )
+
+
+def test_session_commits_once(temp_db_uri):
+    """Test that commands in a session are only visible after the session commits."""
+    with Session(temp_db_uri) as session:
+        tournament = _add_tournament(temp_db_uri, session)
+        for i in range(5):
+            name = f"Player {i}"
+            add_player(
+                AddPlayerCommand(name=name, phone=f"+{i}", db_uri=temp_db_uri),
+                session=session,
+            )
+            register_player(
+                RegisterPlayerCommand(
+                    tournament_id=tournament.id, player_name=name, db_uri=temp_db_uri
+                ),
+                session=session,
+            )
+            mark_payment(
+                MarkPaymentCommand(
+                    tournament_id=tournament.id, player_name=name, db_uri=temp_db_uri
+                ),
+                session=session,
+            )
+
+        # Reads in the session see its own uncommitted writes
+        assert len(list_players(ListPlayersCommand(db_uri=temp_db_uri), session=session)) == 5
+        assert _committed_player_count(temp_db_uri) == 0
+
+    assert _committed_player_count(temp_db_uri) == 5
+    _, players = list_tournament_players(
+        ListTournamentPlayersCommand(tournament_id=tournament.id, db_uri=temp_db_uri)
+    )
+    assert len(players) == 5
+    assert all(p.has_paid for p in players)
+
+
+def test_session_rolls_back_on_error(temp_db_uri):
+    """Test that an exception escaping the session discards all of its work."""
+    with pytest.raises(RuntimeError):
+        with Session(temp_db_uri) as session:
+            add_player(
+                AddPlayerCommand(name="Player 1", phone="+1", db_uri=temp_db_uri),
+                session=session,
+            )
+            raise RuntimeError("abort")
+
+    assert list_players(ListPlayersCommand(db_uri=temp_db_uri)) == []
+
+
+def test_failed_command_keeps_earlier_work(temp_db_uri):
+    """Test that a command failing inside a session only undoes its own writes."""
+    with Session(temp_db_uri) as session:
+        add_player(
+            AddPlayerCommand(name="Player 1", phone="+1", db_uri=temp_db_uri),
+            session=session,
+        )
+        with pytest.raises(ValueError, match="already exists"):
+            add_player(
+                AddPlayerCommand(name="Player 1", phone="+2", db_uri=temp_db_uri),
+                session=session,
+            )
+        add_player(
+            AddPlayerCommand(name="Player 2", phone="+3", db_uri=temp_db_uri),
+            session=session,
+        )
+
+    players = list_players(ListPlayersCommand(db_uri=temp_db_uri))
+    assert [(p.name, p.phone) for p in players] == [("Player 1", "+1"), ("Player 2", "+3")]
+
+
+def test_explicit_commit_and_rollback(temp_db_uri):
+    """Test committing part of a session and rolling back the rest."""
+    session = Session(temp_db_uri)
+    try:
+        add_player(
+            AddPlayerCommand(name="Player 1", phone="+1", db_uri=temp_db_uri),
+            session=session,
+        )
+        session.commit()
+        add_player(
+            AddPlayerCommand(name="Player 2", phone="+2", db_uri=temp_db_uri),
+            session=session,
+        )
+        session.rollback()
+    finally:
+        session.close()
+
+    players = list_players(ListPlayersCommand(db_uri=temp_db_uri))
+    assert [p.name for p in players] == ["Player 1"]
+
+
+def test_session_rejects_other_database(temp_db_uri, tmp_path):
+    """Test that a session can't be used for a command on another database."""
+    other_uri = f"file://{tmp_path / 'other.db'}"
+    with Session(temp_db_uri) as session:
+        with pytest.raises(ValueError, match="Session is bound to"):
+            add_player(
+                AddPlayerCommand(name="Player 1", phone="+1", db_uri=other_uri),
+                session=session,
+            )
+
+
+def test_after_rollback_runs_for_rolled_back_work_only(temp_db_uri):
+    """Test that rollback callbacks run with their savepoint, and not after a commit."""
+    calls = []
+    session = Session(temp_db_uri)
+    try:
+        session.cursor()
+        session.after_rollback(lambda: calls.append("outer"))
+        with pytest.raises(RuntimeError):
+            with session.savepoint():
+                session.after_rollback(lambda: calls.append("savepoint"))
+                raise RuntimeError("undo the savepoint")
+        assert calls == ["savepoint"]
+
+        session.rollback()
+        assert calls == ["savepoint", "outer"]
+
+        session.cursor()
+        session.after_rollback(lambda: calls.append("committed"))
+        session.commit()
+        session.rollback()
+        assert calls == ["savepoint", "outer"]
+
+        session.cursor()
+        session.after_rollback(lambda: calls.append("closed"))
+    finally:
+        session.close()
+    assert calls == ["savepoint", "outer", "closed"]
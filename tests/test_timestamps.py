@@ -0,0 +1,37 @@
+from datetime import date, datetime, timedelta, timezone
+
+from ultimate_mcp_server.modules.timestamps import (
+    from_day,
+    from_timestamp,
+    to_day,
+    to_timestamp,
+)
+
+
+def test_timestamps_round_trip():
+    for value in [
+        datetime(2025, 3, 1, 12, 0),
+        datetime(2025, 3, 1, 12, 0, 0, 123456),
+        datetime(1969, 12, 31, 23, 59, 59, 999999),
+    ]:
+        assert from_timestamp(to_timestamp(value)) == value
+
+    assert to_timestamp(datetime(1970, 1, 1)) == 0
+    assert to_timestamp(datetime(1970, 1, 2, 0, 0, 1)) == 86_401_000_000
+
+
+def test_aware_timestamps_are_stored_in_local_time():
+    value = datetime(2025, 3, 1, 12, 0, tzinfo=timezone(timedelta(hours=2)))
+
+    stored = from_timestamp(to_timestamp(value))
+
+    assert stored.tzinfo is None
+    assert stored == value.astimezone().replace(tzinfo=None)
+
+
+def test_days_round_trip_and_sort():
+    days = [date(1999, 12, 31), date(2025, 3, 1), date(2025, 3, 2)]
+
+    assert [from_day(to_day(day)) for day in days] == days
+    assert sorted(to_day(day) for day in days) == [to_day(day) for day in days]
+    assert to_day(date(1970, 1, 1)) == 0
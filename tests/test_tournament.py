@@ -13,6 +13,7 @@ from ultimate_mcp_server.modules.functionality.add_tournament import add_tournam
 from ultimate_mcp_server.modules.functionality.list_tournaments import list_tournaments
 from ultimate_mcp_server.modules.functionality.update_tournament import update_tournament
 from ultimate_mcp_server.modules.functionality.remove_tournament import remove_tournament
+from ultimate_mcp_server.modules.timestamps import from_day
 
 
 def test_add_tournament(temp_db_uri):
@@ -53,9 +54,9 @@ def test_add_tournament(temp_db_uri):
     assert row is not None
     assert row[1] == "Test Tournament"
     assert row[2] == "Test Location"
-    assert date.fromisoformat(row[3]) == tournament_date
+    assert from_day(row[3]) == tournament_date
     assert row[4] == "grass"
-    assert date.fromisoformat(row[5]) == deadline
+    assert from_day(row[5]) == deadline
 
 
 def test_list_tournaments(temp_db_uri):
@@ -140,7 +141,7 @@ def test_update_tournament(temp_db_uri):
     assert row is not None
     assert row[1] == "Updated Tournament"
     assert row[2] == "Updated Location"
-    assert date.fromisoformat(row[3]) == original.date
+    assert from_day(row[3]) == original.date
     assert row[4] == "beach"
 
 
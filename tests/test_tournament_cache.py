@@ -0,0 +1,154 @@
+import sqlite3
+from datetime import date, timedelta
+from urllib.parse import urlparse
+
+import pytest
+
+from ultimate_mcp_server.modules.data_types import (
+    AddPlayerCommand,
+    AddTournamentCommand,
+    ListTournamentPlayersCommand,
+    RegisterPlayerCommand,
+    RemoveTournamentCommand,
+    SurfaceType,
+    UpdateTournamentCommand,
+)
+from ultimate_mcp_server.modules.functionality.add_player import add_player
+from ultimate_mcp_server.modules.functionality.add_tournament import add_tournament
+from ultimate_mcp_server.modules.functionality.list_tournament_players import (
+    list_tournament_players,
+)
+from ultimate_mcp_server.modules.functionality.register_player import register_player
+from ultimate_mcp_server.modules.functionality.remove_tournament import remove_tournament
+from ultimate_mcp_server.modules.functionality.update_tournament import update_tournament
+from ultimate_mcp_server.modules.session import Session
+from ultimate_mcp_server.modules.tournament_cache import get_tournament_cache
+
+
+@pytest.fixture
+def tournament(temp_db_uri):
+    today = date.today()
+    return add_tournament(
+        AddTournamentCommand(
+            name="Open",
+            location="Madrid",
+            date=today + timedelta(days=30),
+            surface=SurfaceType.GRASS,
+            registration_deadline=today + timedelta(days=15),
+            db_uri=temp_db_uri,
+        )
+    )
+
+
+def _name(db_uri, tournament_id):
+    command = ListTournamentPlayersCommand(tournament_id=tournament_id, db_uri=db_uri)
+    return list_tournament_players(command)[0].name
+
+
+def _counts(db_uri):
+    cache = get_tournament_cache(db_uri)
+    return cache.hits, cache.misses
+
+
+def test_repeated_lookups_hit_the_cache(temp_db_uri, tournament):
+    assert _name(temp_db_uri, tournament.id) == "Open"
+    assert _name(temp_db_uri, tournament.id) == "Open"
+
+    assert _counts(temp_db_uri) == (1, 1)
+
+
+def test_tournament_changes_invalidate_the_cache(temp_db_uri, tournament):
+    _name(temp_db_uri, tournament.id)
+
+    update_tournament(
+        UpdateTournamentCommand(id=tournament.id, name="Grand Open", db_uri=temp_db_uri)
+    )
+    assert _name(temp_db_uri, tournament.id) == "Grand Open"
+
+    remove_tournament(RemoveTournamentCommand(id=tournament.id, db_uri=temp_db_uri))
+    with pytest.raises(ValueError, match="not found"):
+        _name(temp_db_uri, tournament.id)
+
+
+def test_changes_from_other_connections_are_detected(temp_db_uri, tournament):
+    _name(temp_db_uri, tournament.id)
+
+    # Another process writes to the database
+    conn = sqlite3.connect(urlparse(temp_db_uri).path)
+    conn.execute("UPDATE tournaments SET name = 'Renamed' WHERE id = ?", (tournament.id,))
+    conn.commit()
+    conn.close()
+
+    assert _name(temp_db_uri, tournament.id) == "Renamed"
+
+
+def test_other_writes_keep_the_cache(temp_db_uri, tournament):
+    _name(temp_db_uri, tournament.id)
+
+    add_player(AddPlayerCommand(name="Ana", phone="+1", db_uri=temp_db_uri))
+    register_player(
+        RegisterPlayerCommand(tournament_id=tournament.id, player_name="Ana", db_uri=temp_db_uri)
+    )
+    # Another process writes to a different table
+    conn = sqlite3.connect(urlparse(temp_db_uri).path)
+    conn.execute("UPDATE players SET phone = '+2'")
+    conn.commit()
+    conn.close()
+
+    assert _name(temp_db_uri, tournament.id) == "Open"
+    assert _counts(temp_db_uri) == (2, 1)
+
+
+def test_uncommitted_changes_are_not_cached(temp_db_uri, tournament):
+    _name(temp_db_uri, tournament.id)
+
+    with pytest.raises(RuntimeError):
+        with Session(temp_db_uri) as session:
+            update_tournament(
+                UpdateTournamentCommand(id=tournament.id, name="Draft", db_uri=temp_db_uri),
+                session=session,
+            )
+            command = ListTournamentPlayersCommand(
+                tournament_id=tournament.id, db_uri=temp_db_uri
+            )
+            # The session sees its own change
+            assert list_tournament_players(command, session)[0].name == "Draft"
+            raise RuntimeError("roll back")
+
+    assert _name(temp_db_uri, tournament.id) == "Open"
+
+
+def test_rolled_back_changes_go_back_to_the_cache(temp_db_uri, tournament):
+    _name(temp_db_uri, tournament.id)
+    command = ListTournamentPlayersCommand(tournament_id=tournament.id, db_uri=temp_db_uri)
+    session = Session(temp_db_uri)
+    try:
+        update_tournament(
+            UpdateTournamentCommand(id=tournament.id, name="Draft", db_uri=temp_db_uri),
+            session=session,
+        )
+        session.rollback()
+        assert list_tournament_players(command, session)[0].name == "Open"
+        assert _counts(temp_db_uri) == (1, 1)
+
+        # Undoing a savepoint keeps the session off the cache only while
+        # earlier changes of its transaction are still pending
+        update_tournament(
+            UpdateTournamentCommand(id=tournament.id, name="Draft", db_uri=temp_db_uri),
+            session=session,
+        )
+        with pytest.raises(RuntimeError):
+            with session.savepoint():
+                update_tournament(
+                    UpdateTournamentCommand(id=tournament.id, name="Final", db_uri=temp_db_uri),
+                    session=session,
+                )
+                raise RuntimeError("undo the savepoint")
+        assert list_tournament_players(command, session)[0].name == "Draft"
+        assert _counts(temp_db_uri) == (1, 1)
+
+        session.rollback()
+        assert list_tournament_players(command, session)[0].name == "Open"
+        assert _counts(temp_db_uri) == (2, 1)
+    finally:
+        session.close()
@@ -17,6 +17,7 @@ from ultimate_mcp_server.modules.functionality.register_player import register_p
 from ultimate_mcp_server.modules.functionality.mark_payment import mark_payment
 from ultimate_mcp_server.modules.functionality.clear_payment import clear_payment
 from ultimate_mcp_server.modules.functionality.list_tournament_players import list_tournament_players
+from ultimate_mcp_server.modules.timestamps import from_timestamp
 
 
 @pytest.fixture
@@ -82,9 +83,10 @@ def test_mark_payment(temp_db_uri, test_player, test_tournament, test_registrati
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     cursor.execute("""
-        SELECT tournament_id, player_name, has_paid, payment_date
-        FROM tournament_players
-        WHERE tournament_id = ? AND player_name = ?
+        SELECT tp.tournament_id, p.name, tp.has_paid, tp.payment_date
+        FROM tournament_players tp
+        JOIN players p ON p.id = tp.player_id
+        WHERE tp.tournament_id = ? AND p.name = ?
     """, (test_tournament.id, test_player.name))
     row = cursor.fetchone()
     conn.close()
@@ -93,7 +95,7 @@ def test_mark_payment(temp_db_uri, test_player, test_tournament, test_registrati
     assert row[0] == test_tournament.id
     assert row[1] == test_player.name
     assert bool(row[2]) is True  # has_paid should be true (1)
-    assert datetime.fromisoformat(row[3]) == payment_date
+    assert from_timestamp(row[3]) == payment_date
 
 
 def test_mark_payment_default_date(temp_db_uri, test_player, test_tournament, test_registration):
@@ -145,9 +147,10 @@ def test_clear_payment(temp_db_uri, test_player, test_tournament, test_registrat
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     cursor.execute("""
-        SELECT tournament_id, player_name, has_paid, payment_date
-        FROM tournament_players
-        WHERE tournament_id = ? AND player_name = ?
+        SELECT tp.tournament_id, p.name, tp.has_paid, tp.payment_date
+        FROM tournament_players tp
+        JOIN players p ON p.id = tp.player_id
+        WHERE tp.tournament_id = ? AND p.name = ?
     """, (test_tournament.id, test_player.name))
     row = cursor.fetchone()
     conn.close()
@@ -66,8 +66,9 @@ def test_register_player(temp_db_uri, test_player, test_tournament):
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     cursor.execute("""
-        SELECT tournament_id, player_name FROM tournament_players
-        WHERE tournament_id = ? AND player_name = ?
+        SELECT tp.tournament_id, p.name FROM tournament_players tp
+        JOIN players p ON p.id = tp.player_id
+        WHERE tp.tournament_id = ? AND p.name = ?
     """, (test_tournament.id, test_player.name))
     row = cursor.fetchone()
     conn.close()
@@ -122,8 +123,9 @@ def test_unregister_player(temp_db_uri, test_player, test_tournament):
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     cursor.execute("""
-        SELECT tournament_id, player_name FROM tournament_players
-        WHERE tournament_id = ? AND player_name = ?
+        SELECT tp.tournament_id, p.name FROM tournament_players tp
+        JOIN players p ON p.id = tp.player_id
+        WHERE tp.tournament_id = ? AND p.name = ?
     """, (test_tournament.id, test_player.name))
     row = cursor.fetchone()
     conn.close()
@@ -229,4 +231,30 @@ def test_list_player_tournaments(temp_db_uri, test_player):
     # Check all expected tournaments are listed
     registered_ids = [t.id for t in registered_tournaments]
     for tournament in tournaments:
-        assert tournament.id in registered_ids
\ No newline at end of file
+        assert tournament.id in registered_ids
+
+
+def test_player_lookups_ignore_case_and_accents(temp_db_uri, test_tournament):
+    """Test that player names resolve through their normalized form."""
+    add_player(AddPlayerCommand(name="José Núñez", phone="+1", db_uri=temp_db_uri))
+
+    registration = register_player(
+        RegisterPlayerCommand(
+            tournament_id=test_tournament.id, player_name="jose nunez", db_uri=temp_db_uri
+        )
+    )
+    # Results carry the stored spelling
+    assert registration.player_name == "José Núñez"
+
+    player, tournaments = list_player_tournaments(
+        ListPlayerTournamentsCommand(player_name="JOSE  NUÑEZ", db_uri=temp_db_uri)
+    )
+    assert player.name == "José Núñez"
+    assert [t.id for t in tournaments] == [test_tournament.id]
+
+    message = unregister_player(
+        UnregisterPlayerCommand(
+            tournament_id=test_tournament.id, player_name="Jose Nunez", db_uri=temp_db_uri
+        )
+    )
+    assert "José Núñez" in message